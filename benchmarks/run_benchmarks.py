@@ -0,0 +1,245 @@
+"""Benchmarks dos trechos críticos do algoritmo genético.
+
+Mede o tempo por chamada de calculate_fitness_multi_vehicle, calculate_fitness_batch,
+split_deliveries_by_vehicle, order_crossover, swap_mutation e de uma geração completa
+(avaliação + ordenação + reprodução) para vários tamanhos de instância, e a
+qualidade da solução na instância att48 em relação ao tour ótimo conhecido
+(limite inferior para a soma das rotas).
+
+Uso:
+    python benchmarks/run_benchmarks.py                          # imprime os resultados
+    python benchmarks/run_benchmarks.py --save baseline.json     # grava um baseline
+    python benchmarks/run_benchmarks.py --compare benchmarks/baselines/baseline.json
+
+Com --compare, o processo termina com código 1 se alguma medição de tempo ficar
+mais lenta que o baseline além da tolerância (--tolerance, padrão 25%) ou se a
+distância na att48 piorar.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from batch_fitness import calculate_fitness_batch
+from cities import generate_problem
+from config import NUM_VEHICLES, POPULATION_SIZE, att_48_cities_locations, att_48_cities_order
+from evaluators import create_evaluator
+from genetic_operators import order_crossover, sort_genomes, swap_mutation
+from genome import genome_to_deliveries
+from models import Delivery, Priority
+from population import (
+    calculate_distance,
+    calculate_fitness_multi_vehicle,
+    calculate_route_distance,
+    create_initial_population_genomes,
+    split_deliveries_by_vehicle,
+)
+from problem import VRPProblem
+from solver import GeneticVRP, SolverConfig, breed_next_generation
+
+DEFAULT_SIZES = [15, 48, 200, 1000]
+DEFAULT_TOLERANCE = 0.25
+ATT48_VEHICLES = 3
+
+
+def _time_per_call(func: Callable[[], object], repeat: int) -> float:
+    """Menor tempo por chamada (segundos) entre `repeat` rodadas calibradas."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def build_att48_problem(num_vehicles: int = ATT48_VEHICLES) -> VRPProblem:
+    """att48 como VRP de `num_vehicles` veículos: a primeira cidade do tour ótimo é o depósito.
+
+    Todas as entregas têm a mesma prioridade e peso unitário e os veículos não
+    têm limite efetivo, então a única parcela do fitness é a distância. Com um
+    só veículo qualquer genoma decodifica para o mesmo tour do vizinho mais
+    próximo; com vários, a ordem do genoma decide a divisão entre eles e o
+    resultado mede o AG. Como rotas fechadas no depósito podem ser encurtadas
+    até um tour único, o tour ótimo conhecido é um limite inferior da soma das
+    rotas.
+    """
+    depot_index = att_48_cities_order[0] - 1
+    depot = att_48_cities_locations[depot_index]
+    locations = [location for index, location in enumerate(att_48_cities_locations) if index != depot_index]
+
+    deliveries = [Delivery(location, Priority.LOW, 1.0, i) for i, location in enumerate(locations)]
+    return VRPProblem(
+        deliveries, num_vehicles, depot, [float(len(deliveries))] * num_vehicles, [len(deliveries)] * num_vehicles)
+
+
+def att48_optimal_distance() -> float:
+    """Comprimento euclidiano do tour ótimo da att48 (att_48_cities_order é fechado e 1-based)."""
+    tour = [att_48_cities_locations[city - 1] for city in att_48_cities_order]
+    return sum(calculate_distance(tour[i], tour[i + 1]) for i in range(len(tour) - 1))
+
+
+def benchmark_size(num_deliveries: int, repeat: int, seed: int) -> Dict[str, float]:
+    problem = generate_problem(num_deliveries, NUM_VEHICLES, seed)
+    dm = problem.distance_matrix
+    lookup = problem.delivery_lookup
+    population = create_initial_population_genomes(problem.deliveries, POPULATION_SIZE)
+    rng = np.random.default_rng(seed)
+
+    individual = genome_to_deliveries(population[0], lookup)
+    other = genome_to_deliveries(population[1], lookup)
+    args = (problem.num_vehicles, problem.depot, problem.vehicle_capacities, problem.vehicle_max_deliveries)
+
+    results = {
+        "fitness_seconds": _time_per_call(lambda: calculate_fitness_multi_vehicle(individual, *args, dm), repeat),
+        "fitness_batch_seconds": _time_per_call(lambda: calculate_fitness_batch(population, problem.deliveries, *args, dm), repeat),
+        "split_seconds": _time_per_call(lambda: split_deliveries_by_vehicle(individual, *args, dm), repeat),
+        "crossover_seconds": _time_per_call(lambda: order_crossover(individual, other), repeat),
+        "mutation_seconds": _time_per_call(lambda: swap_mutation(population[0], 1.0), repeat),
+    }
+
+    with create_evaluator("serial", problem) as evaluator:
+        def one_generation():
+            fitness = evaluator.evaluate(population)
+            sorted_population, sorted_fitness = sort_genomes(population, fitness)
+            breed_next_generation(sorted_population, sorted_fitness, 0.5, rng)
+
+        results["generation_seconds"] = _time_per_call(one_generation, repeat)
+
+    results["generations_per_second"] = 1.0 / results["generation_seconds"]
+    return results
+
+
+def benchmark_att48(generations: int, seed: int) -> Dict[str, float]:
+    problem = build_att48_problem()
+    config = SolverConfig(time_limit_seconds=None, max_generations=generations, seed=seed)
+
+    start = time.perf_counter()
+    result = GeneticVRP().run(problem, config)
+    elapsed = time.perf_counter() - start
+
+    best_distance = sum(calculate_route_distance(route, problem.depot, problem.distance_matrix) for route in result.best_routes)
+    optimum = att48_optimal_distance()
+
+    return {
+        "optimal_distance": optimum,
+        "best_distance": best_distance,
+        "gap_percent": (best_distance / optimum - 1) * 100,
+        "generations": result.generations,
+        "generations_per_second": result.generations / elapsed,
+    }
+
+
+def run_benchmarks(sizes: List[int], repeat: int, att48_generations: int, seed: int) -> dict:
+    report = {
+        "metadata": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "population_size": POPULATION_SIZE,
+            "num_vehicles": NUM_VEHICLES,
+            "seed": seed,
+        },
+        "sizes": {},
+    }
+
+    for size in sizes:
+        print(f"Medindo {size} entregas...", file=sys.stderr)
+        report["sizes"][str(size)] = benchmark_size(size, repeat, seed)
+
+    print("Rodando att48...", file=sys.stderr)
+    report["att48"] = benchmark_att48(att48_generations, seed)
+    return report
+
+
+def print_report(report: dict) -> None:
+    print(f"{'entregas':>9} {'fitness':>11} {'batch':>11} {'split':>11} {'crossover':>11} {'mutação':>11} {'geração':>11} {'ger/s':>9}")
+    for size, metrics in report["sizes"].items():
+        print(
+            f"{size:>9} "
+            + " ".join(f"{metrics[key] * 1000:>9.3f}ms" for key in (
+                "fitness_seconds", "fitness_batch_seconds", "split_seconds",
+                "crossover_seconds", "mutation_seconds", "generation_seconds",
+            ))
+            + f" {metrics['generations_per_second']:>9.1f}"
+        )
+
+    att48 = report["att48"]
+    print(
+        f"\natt48 ({ATT48_VEHICLES} veículos): distância {att48['best_distance']:.0f} vs tour ótimo "
+        f"{att48['optimal_distance']:.0f} "
+        f"(gap {att48['gap_percent']:.2f}%) em {att48['generations']} gerações "
+        f"({att48['generations_per_second']:.1f} ger/s)"
+    )
+
+
+def compare_reports(current: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Lista as regressões do relatório atual em relação ao baseline."""
+    regressions = []
+
+    for size, metrics in current["sizes"].items():
+        reference = baseline.get("sizes", {}).get(size)
+        if reference is None:
+            continue
+        for key, value in metrics.items():
+            if not key.endswith("_seconds") or key not in reference:
+                continue
+            ratio = value / reference[key]
+            if ratio > 1 + tolerance:
+                regressions.append(f"{size} entregas, {key}: {ratio:.2f}x o baseline")
+
+    reference_att48 = baseline.get("att48")
+    if reference_att48 and current["att48"]["best_distance"] > reference_att48["best_distance"] * (1 + 1e-9):
+        regressions.append(
+            f"att48: distância {current['att48']['best_distance']:.0f} pior que o baseline "
+            f"{reference_att48['best_distance']:.0f}"
+        )
+
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmarks do algoritmo genético")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="tamanhos das instâncias")
+    parser.add_argument("--repeat", type=int, default=5, help="rodadas por medição (usa a menor)")
+    parser.add_argument("--att48-generations", type=int, default=200, help="gerações na att48")
+    parser.add_argument("--seed", type=int, default=42, help="semente das instâncias e do solver")
+    parser.add_argument("--save", type=Path, help="grava o relatório em JSON")
+    parser.add_argument("--compare", type=Path, help="baseline JSON para detectar regressões")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="piora relativa aceita nos tempos")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    report = run_benchmarks(args.sizes, args.repeat, args.att48_generations, args.seed)
+    print_report(report)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        args.save.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nRelatório salvo em {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare_reports(report, baseline, args.tolerance)
+        if regressions:
+            print("\nRegressões em relação ao baseline:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print("\nSem regressões em relação ao baseline.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+import heapq
+import itertools
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from config import ELITE_ARCHIVE_SIZE
+from genome import genome_key
+
+
+class EliteArchive:
+    """Os `capacity` melhores genomas distintos vistos na execução (menor fitness primeiro).
+
+    É um heap de máximo com o pior arquivado no topo, pronto para ser trocado,
+    mais um dicionário pela chave do genoma que descarta repetições. Cada
+    inserção custa O(log K) e a memória não cresce com o número de gerações.
+    Em caso de empate no fitness, o genoma arquivado antes fica na frente.
+    """
+
+    def __init__(self, capacity: int = ELITE_ARCHIVE_SIZE):
+        if capacity < 1:
+            raise ValueError("capacity deve ser ao menos 1")
+        self.capacity = capacity
+        # (-fitness, -ordem de chegada, chave): o topo é o pior e, no empate, o mais recente
+        self._heap: List[Tuple[float, int, Tuple[int, ...]]] = []
+        self._entries: Dict[Tuple[int, ...], Tuple[float, int, np.ndarray]] = {}
+        self._arrivals = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, genome: np.ndarray) -> bool:
+        return genome_key(genome) in self._entries
+
+    def add(self, fitness: float, genome: np.ndarray) -> bool:
+        """Arquiva o genoma se ele for inédito e melhor que o pior arquivado."""
+        key = genome_key(genome)
+        if key in self._entries:
+            return False
+
+        if len(self._heap) >= self.capacity and fitness >= -self._heap[0][0]:
+            return False
+
+        arrival = next(self._arrivals)
+        entry = (-fitness, -arrival, key)
+        if len(self._heap) >= self.capacity:
+            _, _, evicted = heapq.heapreplace(self._heap, entry)
+            del self._entries[evicted]
+        else:
+            heapq.heappush(self._heap, entry)
+
+        self._entries[key] = (fitness, arrival, np.array(genome, copy=True))
+        return True
+
+    def top(self, count: int | None = None) -> List[Tuple[float, np.ndarray]]:
+        """(fitness, genoma) dos `count` melhores (todos, se None), do melhor para o pior."""
+        ordered = sorted(self._entries.values(), key=lambda entry: entry[:2])
+        return [(fitness, genome) for fitness, _, genome in ordered[:count]]
+
+    def best(self) -> Tuple[float, np.ndarray]:
+        if not self._entries:
+            raise ValueError("O arquivo de elite está vazio")
+        fitness, _, genome = min(self._entries.values(), key=lambda entry: entry[:2])
+        return fitness, genome
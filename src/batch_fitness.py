@@ -0,0 +1,265 @@
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from config import PENALTY_OVERLOAD, PENALTY_PRIORITY
+from distance_matrix import DEPOT_INDEX, DistanceMatrix
+from fitness_cache import FitnessCache
+from genome import genome_key
+from models import Delivery, DeliveryTable, Priority
+from population import PRIORITY_POSITION_RULES, calculate_fitness_multi_vehicle
+
+# Chave de ordenação atribuída à entrega recebida na passagem "ao menos uma
+# entrega por veículo": ela é sempre a primeira da rota do seu veículo.
+_FIRST_PASS_ORDER = -1
+
+
+def calculate_priority_penalty_batch(priority_values: np.ndarray) -> np.ndarray:
+    """Versão vetorizada de calculate_priority_penalty para a população inteira.
+
+    `priority_values` traz o valor da prioridade de cada posição de cada genoma
+    (tamanho_população x n_entregas).
+    """
+    total_deliveries = priority_values.shape[1]
+    positions = np.arange(total_deliveries)
+    penalty = np.zeros(priority_values.shape, dtype=np.float64)
+
+    for priority, (position_limit, multiplier) in PRIORITY_POSITION_RULES.items():
+        late = (priority_values == priority.value) & (positions > total_deliveries * position_limit)
+        penalty[late] = PENALTY_PRIORITY * multiplier
+
+    # Valores múltiplos de PENALTY_PRIORITY: a ordem da soma não altera o resultado
+    return penalty.sum(axis=1)
+
+
+def _assign_vehicles_batch(
+    sorted_weights: np.ndarray,
+    capacities: np.ndarray,
+    max_deliveries: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Atribui veículos a toda a população seguindo split_deliveries_by_vehicle.
+
+    Percorre as posições (já ordenadas por prioridade) uma a uma, mas decide a
+    posição k de todos os indivíduos ao mesmo tempo. Retorna o veículo de cada
+    posição, a chave de ordem dentro da rota e a contagem de entregas por veículo.
+    """
+    population_size, total_deliveries = sorted_weights.shape
+    num_vehicles = capacities.shape[0]
+    rows = np.arange(population_size)
+
+    vehicle_of = np.full((population_size, total_deliveries), -1, dtype=np.int64)
+    route_order = np.tile(np.arange(total_deliveries), (population_size, 1))
+    loads = np.zeros((population_size, num_vehicles), dtype=np.float64)
+    counts = np.zeros((population_size, num_vehicles), dtype=np.int64)
+
+    # Ao menos uma entrega por veículo: primeira entrega pendente que caiba
+    if total_deliveries >= num_vehicles:
+        for vehicle_id in range(num_vehicles):
+            if max_deliveries[vehicle_id] <= 0:
+                continue
+            candidates = (vehicle_of < 0) & (sorted_weights <= capacities[vehicle_id])
+            has_candidate = candidates.any(axis=1)
+            chosen_rows = rows[has_candidate]
+            chosen_positions = candidates.argmax(axis=1)[has_candidate]
+
+            vehicle_of[chosen_rows, chosen_positions] = vehicle_id
+            route_order[chosen_rows, chosen_positions] = _FIRST_PASS_ORDER
+            loads[chosen_rows, vehicle_id] += sorted_weights[chosen_rows, chosen_positions]
+            counts[chosen_rows, vehicle_id] += 1
+
+    for position in range(total_deliveries):
+        pending_rows = rows[vehicle_of[:, position] < 0]
+        if pending_rows.size == 0:
+            continue
+
+        weight = sorted_weights[pending_rows, position]
+        pending_loads = loads[pending_rows]
+        has_delivery_capacity = counts[pending_rows] < max_deliveries
+        has_weight_capacity = pending_loads + weight[:, None] <= capacities
+
+        # 1ª opção: menor carga entre veículos com peso e número de entregas livres
+        feasible = has_weight_capacity & has_delivery_capacity
+        best_vehicle = np.where(feasible, pending_loads, np.inf).argmin(axis=1)
+        found = feasible.any(axis=1)
+
+        # 2ª opção: menor carga entre veículos com número de entregas livre
+        only_count = ~found & has_delivery_capacity.any(axis=1)
+        best_vehicle[only_count] = np.where(
+            has_delivery_capacity[only_count], pending_loads[only_count], np.inf
+        ).argmin(axis=1)
+
+        # Último recurso: veículo de menor carga
+        neither = ~found & ~only_count
+        best_vehicle[neither] = pending_loads[neither].argmin(axis=1)
+
+        vehicle_of[pending_rows, position] = best_vehicle
+        loads[pending_rows, best_vehicle] += weight
+        counts[pending_rows, best_vehicle] += 1
+
+    return vehicle_of, route_order, counts
+
+
+def calculate_fitness_batch(
+    population_ids: np.ndarray,
+    deliveries: List[Delivery],
+    num_vehicles: int,
+    depot: Tuple[int, int],
+    vehicle_capacities: List[float],
+    vehicle_max_deliveries: List[int],
+    distance_matrix: DistanceMatrix | None = None,
+    fitness_cache: FitnessCache | None = None,
+    delivery_table: DeliveryTable | None = None,
+) -> np.ndarray:
+    """Avalia a população inteira de uma vez, com operações vetorizadas.
+
+    `population_ids` é uma matriz (tamanho_população x n_entregas) com os ids das
+    entregas de cada indivíduo. O resultado é idêntico, indivíduo a indivíduo, ao
+    de calculate_fitness_multi_vehicle, que continua sendo a referência escalar.
+
+    Com `fitness_cache`, genomas já conhecidos são respondidos pelo cache e só os
+    genomas inéditos (sem repetições dentro do lote) são avaliados. Quem avalia
+    várias gerações passa a `delivery_table` pronta (ex.: VRPProblem.delivery_table).
+    """
+    population_ids = np.asarray(population_ids, dtype=np.int64)
+    population_size, total_deliveries = population_ids.shape
+
+    if total_deliveries == 0:
+        return np.full(population_size, np.inf)
+
+    if distance_matrix is None:
+        distance_matrix = DistanceMatrix(depot, deliveries)
+    if delivery_table is None:
+        delivery_table = DeliveryTable.from_deliveries(deliveries)
+
+    def evaluate(rows: np.ndarray) -> np.ndarray:
+        return _evaluate_batch(
+            rows, deliveries, num_vehicles, depot, vehicle_capacities, vehicle_max_deliveries, distance_matrix, delivery_table
+        )
+
+    if fitness_cache is None:
+        return evaluate(population_ids)
+
+    return evaluate_with_cache(population_ids, fitness_cache, evaluate)
+
+
+def evaluate_with_cache(
+    population_ids: np.ndarray,
+    fitness_cache: FitnessCache,
+    evaluate: Callable[[np.ndarray], np.ndarray],
+) -> np.ndarray:
+    """Responde pelo cache os genomas conhecidos e avalia apenas os inéditos.
+
+    `evaluate` recebe a matriz com os genomas únicos ainda não vistos (sem
+    repetições dentro do lote) e devolve o fitness de cada um.
+    """
+    fitness = np.empty(len(population_ids), dtype=np.float64)
+    pending_rows: Dict[Tuple[int, ...], List[int]] = {}
+
+    for row, genome in enumerate(population_ids):
+        key = genome_key(genome)
+        cached = fitness_cache.get(key)
+        if cached is None:
+            pending_rows.setdefault(key, []).append(row)
+        else:
+            fitness[row] = cached
+
+    if pending_rows:
+        unique_rows = [rows[0] for rows in pending_rows.values()]
+        evaluated = evaluate(population_ids[unique_rows])
+        for (key, rows), value in zip(pending_rows.items(), evaluated.tolist(), strict=True):
+            fitness[rows] = value
+            fitness_cache.put(key, value)
+
+    return fitness
+
+
+def _evaluate_batch(
+    population_ids: np.ndarray,
+    deliveries: List[Delivery],
+    num_vehicles: int,
+    depot: Tuple[int, int],
+    vehicle_capacities: List[float],
+    vehicle_max_deliveries: List[int],
+    distance_matrix: DistanceMatrix,
+    delivery_table: DeliveryTable | None = None,
+) -> np.ndarray:
+    """Núcleo vetorizado de calculate_fitness_batch (sem cache)."""
+    population_size, total_deliveries = population_ids.shape
+
+    capacities = np.asarray(vehicle_capacities[:num_vehicles], dtype=np.float64)
+    max_deliveries = np.asarray(vehicle_max_deliveries[:num_vehicles], dtype=np.int64)
+    if delivery_table is None:
+        delivery_table = DeliveryTable.from_deliveries(deliveries)
+    weights_by_id, priorities_by_id = delivery_table.weight, delivery_table.priority
+
+    priority_penalty = calculate_priority_penalty_batch(priorities_by_id[population_ids])
+
+    # Ordenação estável por prioridade, como em split_deliveries_by_vehicle
+    sort_order = np.argsort(priorities_by_id[population_ids], axis=1, kind="stable")
+    sorted_ids = np.take_along_axis(population_ids, sort_order, axis=1)
+    sorted_weights = weights_by_id[sorted_ids]
+    sorted_priorities = priorities_by_id[sorted_ids]
+    sorted_indices = sorted_ids + 1  # linhas da matriz de distâncias
+
+    vehicle_of, route_order, counts = _assign_vehicles_batch(sorted_weights, capacities, max_deliveries)
+
+    matrix = distance_matrix.matrix
+    rows = np.arange(population_size)
+    no_candidate_key = total_deliveries + 1
+    no_priority = max(priority.value for priority in Priority) + 1
+
+    total_distance = np.zeros(population_size, dtype=np.float64)
+    capacity_penalty = np.zeros(population_size, dtype=np.float64)
+
+    for vehicle_id in range(num_vehicles):
+        remaining = vehicle_of == vehicle_id
+        current = np.full(population_size, DEPOT_INDEX, dtype=np.int64)
+        route_distance = np.zeros(population_size, dtype=np.float64)
+        route_load = np.zeros(population_size, dtype=np.float64)
+
+        # Vizinho mais próximo dentro do grupo de maior prioridade ainda pendente
+        for _ in range(int(counts[:, vehicle_id].max(initial=0))):
+            active = rows[remaining.any(axis=1)]
+            if active.size == 0:
+                break
+
+            active_remaining = remaining[active]
+            active_priorities = sorted_priorities[active]
+            group_priority = np.where(active_remaining, active_priorities, no_priority).min(axis=1)
+            candidates = active_remaining & (active_priorities == group_priority[:, None])
+
+            distances = matrix[current[active][:, None], sorted_indices[active]]
+            masked = np.where(candidates, distances, np.inf)
+            nearest_distance = masked.min(axis=1)
+
+            # Empates resolvidos pela ordem da entrega na rota, como o min() escalar
+            ties = candidates & (masked == nearest_distance[:, None])
+            chosen = np.where(ties, route_order[active], no_candidate_key).argmin(axis=1)
+
+            route_distance[active] += nearest_distance
+            route_load[active] += sorted_weights[active, chosen]
+            current[active] = sorted_indices[active, chosen]
+            remaining[active, chosen] = False
+
+        non_empty = counts[:, vehicle_id] > 0
+        route_distance[non_empty] += matrix[current[non_empty], DEPOT_INDEX]
+        total_distance += route_distance
+
+        vehicle_capacity = capacities[vehicle_id]
+        overloaded = non_empty & (route_load > vehicle_capacity)
+        capacity_penalty[overloaded] += PENALTY_OVERLOAD * ((route_load[overloaded] - vehicle_capacity) / vehicle_capacity)
+
+    fitness = total_distance + priority_penalty + capacity_penalty
+
+    # Indivíduos que excederam o número máximo de entregas passam pela
+    # redistribuição sequencial: usa a referência escalar para eles.
+    exceeded = (counts > max_deliveries).any(axis=1)
+    if exceeded.any():
+        deliveries_by_id = {delivery.id: delivery for delivery in deliveries}
+        for row in rows[exceeded]:
+            individual = [deliveries_by_id[delivery_id] for delivery_id in population_ids[row].tolist()]
+            fitness[row] = calculate_fitness_multi_vehicle(
+                individual, num_vehicles, depot, vehicle_capacities, vehicle_max_deliveries, distance_matrix
+            )
+
+    return fitness
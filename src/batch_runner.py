@@ -0,0 +1,223 @@
+import argparse
+import csv
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import List
+
+from config import TIME_LIMIT_SECONDS
+from models import Delivery
+from population import calculate_route_distance
+from problem import VRPProblem
+from solver import GeneticVRP, SolverConfig
+
+# Campos do cenário que sobrescrevem o SolverConfig padrão do lote
+SCENARIO_CONFIG_FIELDS = (
+    "seed",
+    "time_limit_seconds",
+    "max_generations",
+    "population_size",
+    "mutation_probability",
+    "selection_strategy",
+    "local_search_elites",
+)
+# Nomes de cenário viram nomes de arquivo: sem separadores de caminho nem ponto inicial
+SCENARIO_NAME_PATTERN = re.compile(r"\w[\w .-]*")
+SUMMARY_FILENAME = "summary.csv"
+SUMMARY_COLUMNS = [
+    "scenario",
+    "status",
+    "best_fitness",
+    "total_distance",
+    "generations",
+    "elapsed_seconds",
+    "num_deliveries",
+    "num_vehicles",
+    "error",
+]
+
+
+@dataclass
+class Scenario:
+    """Uma instância a resolver e os parâmetros do solver para ela."""
+
+    name: str
+    problem: VRPProblem
+    config: SolverConfig
+
+
+def load_scenario(data: dict, default_name: str, defaults: SolverConfig) -> Scenario:
+    """Monta um cenário a partir do JSON: a instância (ver VRPProblem.from_dict),
+    um `name` opcional e os campos de SCENARIO_CONFIG_FIELDS."""
+    overrides = {key: data[key] for key in SCENARIO_CONFIG_FIELDS if key in data}
+    config = replace(defaults, **overrides)
+    if config.time_limit_seconds is None and config.max_generations is None:
+        raise ValueError(f"Cenário {default_name!r} sem limite de tempo nem de gerações")
+
+    return Scenario(str(data.get("name", default_name)), VRPProblem.from_dict(data), config)
+
+
+def load_scenarios(path: str | Path, defaults: SolverConfig) -> List[Scenario]:
+    """Lê os cenários de um diretório (todos os *.json) ou de um arquivo.
+
+    O arquivo pode ser um único cenário ou um manifesto {"scenarios": [...]},
+    cujos itens são cenários embutidos ou caminhos (relativos ao manifesto).
+    """
+    path = Path(path)
+    if path.is_dir():
+        entries = sorted(path.glob("*.json"))
+    else:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if "scenarios" not in data:
+            entries = [path]
+        else:
+            entries = [path.parent / entry if isinstance(entry, str) else entry for entry in data["scenarios"]]
+
+    scenarios = []
+    for index, entry in enumerate(entries):
+        if isinstance(entry, Path):
+            with open(entry, encoding="utf-8") as file:
+                scenarios.append(load_scenario(json.load(file), entry.stem, defaults))
+        else:
+            scenarios.append(load_scenario(entry, f"scenario_{index + 1}", defaults))
+
+    names = [scenario.name for scenario in scenarios]
+    invalid = [name for name in names if not SCENARIO_NAME_PATTERN.fullmatch(name)]
+    if invalid:
+        raise ValueError(f"Nomes de cenário inválidos (use letras, dígitos, espaço, '.', '_' ou '-'): {invalid}")
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Nomes de cenário repetidos: {', '.join(duplicates)}")
+
+    return scenarios
+
+
+def route_summaries(problem: VRPProblem, vehicle_routes: List[List[Delivery]]) -> List[dict]:
+    """Rotas em JSON: ids das entregas, carga e distância de cada veículo."""
+    return [
+        {
+            "vehicle": vehicle_id,
+            "delivery_ids": [d.id for d in route],
+            "load": sum(d.weight for d in route),
+            "distance": calculate_route_distance(route, problem.depot, problem.distance_matrix),
+        }
+        for vehicle_id, route in enumerate(vehicle_routes, 1)
+    ]
+
+
+def solve_scenario(scenario: Scenario) -> dict:
+    """Resolve um cenário sem observadores e devolve o resultado em JSON."""
+    problem = scenario.problem
+    result = GeneticVRP().run(problem, scenario.config)
+    routes = route_summaries(problem, result.best_routes)
+
+    return {
+        "name": scenario.name,
+        "status": "ok",
+        "best_fitness": result.best_fitness,
+        "total_distance": sum(route["distance"] for route in routes),
+        "generations": result.generations,
+        "elapsed_seconds": result.elapsed_seconds,
+        "num_deliveries": problem.num_deliveries,
+        "num_vehicles": problem.num_vehicles,
+        "routes": routes,
+        "fitness_history": result.fitness_history,
+    }
+
+
+def _failed_result(scenario: Scenario, error: BaseException) -> dict:
+    return {
+        "name": scenario.name,
+        "status": "error",
+        "error": f"{type(error).__name__}: {error}",
+        "num_deliveries": scenario.problem.num_deliveries,
+        "num_vehicles": scenario.problem.num_vehicles,
+    }
+
+
+def write_result_file(output_dir: Path, result: dict) -> Path:
+    path = output_dir / f"{result['name']}.json"
+    if path.resolve().parent != output_dir.resolve():
+        raise ValueError(f"Nome de cenário fora do diretório de saída: {result['name']!r}")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(result, file, indent=2)
+    return path
+
+
+def write_summary(output_dir: Path, results: List[dict]) -> Path:
+    """Grava a tabela-resumo (uma linha por cenário, na ordem de entrada)."""
+    path = output_dir / SUMMARY_FILENAME
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=SUMMARY_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        for result in results:
+            writer.writerow({"scenario": result["name"], **result})
+    return path
+
+
+def run_batch(scenarios: List[Scenario], output_dir: str | Path, workers: int | None = None) -> List[dict]:
+    """Resolve os cenários em um pool de processos e grava um JSON por cenário
+    mais o summary.csv. A falha de um cenário é registrada sem interromper os demais."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+
+    results: List[dict | None] = [None] * len(scenarios)
+    with ProcessPoolExecutor(max_workers=min(workers, max(1, len(scenarios)))) as executor:
+        futures = {executor.submit(solve_scenario, scenario): index for index, scenario in enumerate(scenarios)}
+        for future in as_completed(futures):
+            index = futures[future]
+            scenario = scenarios[index]
+            try:
+                result = future.result()
+            except Exception as exc:
+                result = _failed_result(scenario, exc)
+
+            try:
+                write_result_file(output_dir, result)
+            except Exception as exc:
+                result = _failed_result(scenario, exc)
+            results[index] = result
+            if result["status"] == "ok":
+                print(f"✓ {scenario.name}: fitness {result['best_fitness']:.2f} em {result['generations']} gerações")
+            else:
+                print(f"✗ {scenario.name}: {result['error']}")
+
+    write_summary(output_dir, results)
+    return results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Resolve vários cenários de VRP em paralelo, sem janelas")
+    parser.add_argument("scenarios", help="diretório com cenários *.json, um cenário ou um manifesto {\"scenarios\": [...]}")
+    parser.add_argument("--output", default="batch_results", help="diretório dos resultados (um JSON por cenário e summary.csv)")
+    parser.add_argument("--workers", type=int, default=None, help="processos em paralelo (padrão: número de CPUs)")
+    parser.add_argument("--time-limit", type=float, default=TIME_LIMIT_SECONDS,
+                        help="tempo por cenário em segundos, quando o cenário não define time_limit_seconds")
+    parser.add_argument("--max-generations", type=int, default=None,
+                        help="gerações por cenário, quando o cenário não define max_generations")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    # Cada cenário roda em um processo do pool: o avaliador é sempre serial
+    defaults = SolverConfig(time_limit_seconds=args.time_limit, max_generations=args.max_generations, evaluator_backend="serial")
+    scenarios = load_scenarios(args.scenarios, defaults)
+    print(f"{len(scenarios)} cenários, resultados em {args.output}")
+
+    start = time.perf_counter()
+    results = run_batch(scenarios, args.output, args.workers)
+    failures = sum(result["status"] != "ok" for result in results)
+    print(f"\nConcluído em {time.perf_counter() - start:.1f}s: {len(results) - failures} ok, {failures} com erro")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
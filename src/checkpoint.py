@@ -0,0 +1,160 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import warnings
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+
+from config import CHECKPOINT_INTERVAL_SECONDS
+from genome import GENOME_DTYPE
+from problem import VRPProblem
+from solver import SolverCheckpoint, SolverConfig
+
+# Versão do layout do arquivo; checkpoints de outra versão são recusados
+CHECKPOINT_FORMAT_VERSION = 1
+
+
+def _genome_rows(genomes, num_genes: int) -> np.ndarray:
+    return np.array(genomes, dtype=GENOME_DTYPE).reshape(len(genomes), num_genes)
+
+
+def save_checkpoint(path: str | Path, checkpoint: SolverCheckpoint) -> None:
+    """Grava o checkpoint em `.npz` comprimido, de forma atômica.
+
+    Os genomas vão como matrizes int32 (uma permutação de ids por linha); o
+    problema, a configuração e os estados dos geradores aleatórios vão como
+    texto JSON. O arquivo é escrito ao lado do destino e só então o substitui,
+    então uma interrupção no meio da gravação preserva o checkpoint anterior.
+    """
+    path = Path(path)
+    num_genes = checkpoint.population.shape[1]
+    arrays = {
+        "format_version": np.array(CHECKPOINT_FORMAT_VERSION),
+        "generation": np.array(checkpoint.generation),
+        "elapsed_seconds": np.array(checkpoint.elapsed_seconds),
+        "population": checkpoint.population.astype(GENOME_DTYPE, copy=False),
+        "fitness": np.asarray(checkpoint.fitness, dtype=np.float64),
+        "fitness_history": np.array(checkpoint.fitness_history, dtype=np.float64),
+        "archive_genomes": _genome_rows([genome for _, genome in checkpoint.elite_archive], num_genes),
+        "archive_fitness": np.array([fitness for fitness, _ in checkpoint.elite_archive], dtype=np.float64),
+        "improved_genomes": _genome_rows([key for key, _ in checkpoint.improved_fitness], num_genes),
+        "improved_fitness": np.array([fitness for _, fitness in checkpoint.improved_fitness], dtype=np.float64),
+        "problem": np.array(json.dumps(checkpoint.problem.to_dict())),
+        "problem_max_id": np.array(checkpoint.problem.max_id),
+        "config": np.array(json.dumps(asdict(checkpoint.config))),
+        "rng_state": np.array(json.dumps(checkpoint.rng_state)),
+        "random_state": np.array(json.dumps(checkpoint.random_state)),
+    }
+
+    descriptor, temp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            np.savez_compressed(file, **arrays)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_checkpoint(path: str | Path) -> SolverCheckpoint:
+    """Lê um checkpoint gravado por save_checkpoint."""
+    with np.load(path, allow_pickle=False) as data:
+        version = int(data["format_version"])
+        if version != CHECKPOINT_FORMAT_VERSION:
+            raise ValueError(f"Versão de checkpoint não suportada: {version}")
+
+        random_version, internal_state, gauss_next = json.loads(str(data["random_state"]))
+        # Ausente nos checkpoints gravados antes de VRPProblem.max_id
+        problem_max_id = int(data["problem_max_id"]) if "problem_max_id" in data else -1
+        return SolverCheckpoint(
+            problem=VRPProblem.from_dict(json.loads(str(data["problem"])), problem_max_id),
+            config=SolverConfig(**json.loads(str(data["config"]))),
+            generation=int(data["generation"]),
+            elapsed_seconds=float(data["elapsed_seconds"]),
+            population=data["population"],
+            fitness=data["fitness"],
+            fitness_history=data["fitness_history"].tolist(),
+            elite_archive=list(zip(data["archive_fitness"].tolist(), data["archive_genomes"], strict=True)),
+            improved_fitness=[
+                (tuple(genome.tolist()), fitness)
+                for genome, fitness in zip(data["improved_genomes"], data["improved_fitness"].tolist(), strict=True)
+            ],
+            rng_state=json.loads(str(data["rng_state"])),
+            random_state=(random_version, tuple(internal_state), gauss_next),
+        )
+
+
+class CheckpointWriter:
+    """Grava os checkpoints do solver em uma thread de fundo, sem parar o AG.
+
+    O solver entrega um checkpoint quando `due()` indica que passou o
+    intervalo desde o último. Se a gravação anterior ainda não terminou, só o
+    checkpoint mais recente fica na fila. Uma falha de gravação vira um aviso
+    e a execução continua.
+    """
+
+    def __init__(self, path: str | Path, interval_seconds: float = CHECKPOINT_INTERVAL_SECONDS):
+        self.path = Path(path)
+        self.interval_seconds = interval_seconds
+        self.saved = 0
+        self._pending: SolverCheckpoint | None = None
+        self._writing = False
+        self._closed = False
+        self._last_submit = time.monotonic()
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._write_loop, name="checkpoint-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "CheckpointWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def due(self) -> bool:
+        return time.monotonic() - self._last_submit >= self.interval_seconds
+
+    def submit(self, checkpoint: SolverCheckpoint) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("CheckpointWriter já foi fechado")
+            self._pending = checkpoint
+            self._last_submit = time.monotonic()
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        """Espera a gravação do último checkpoint entregue."""
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending is None and not self._writing)
+
+    def close(self) -> None:
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _write_loop(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending is not None or self._closed)
+                if self._pending is None:
+                    return
+                checkpoint, self._pending = self._pending, None
+                self._writing = True
+
+            try:
+                save_checkpoint(self.path, checkpoint)
+                self.saved += 1
+            except Exception as exc:
+                warnings.warn(f"Falha ao gravar o checkpoint em {self.path}: {exc}", RuntimeWarning, stacklevel=1)
+            finally:
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
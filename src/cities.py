@@ -1,7 +1,12 @@
+import math
 import random
 from typing import List, Tuple
 
+import numpy as np
+
 from config import (
+    DEPOT_LOCATION,
+    FLEET_CAPACITY_MARGIN,
     HEIGHT,
     MARGIN,
     MAX_DELIVERY_WEIGHT,
@@ -10,7 +15,24 @@ from config import (
     WIDTH,
 )
 from models import Delivery, Priority
-from population import calculate_distance
+from problem import VRPProblem
+
+# Retângulo (x_min, y_min, x_max, y_max) padrão das entregas: a área do mapa na janela
+Bounds = Tuple[float, float, float, float]
+DELIVERY_BOUNDS: Bounds = (PLOT_X_OFFSET + MARGIN, MARGIN, WIDTH - MARGIN, HEIGHT - MARGIN)
+
+# Distribuição de prioridades (proporções)
+PRIORITY_DISTRIBUTION = [
+    (Priority.CRITICAL, 0.10),  # 10% críticas
+    (Priority.HIGH, 0.20),  # 20% altas
+    (Priority.MEDIUM, 0.40),  # 40% médias
+    (Priority.LOW, 0.30),  # 30% baixas
+]
+
+# Pontos por área r² que a amostragem de Poisson-disk alcança ao saturar
+_POISSON_DISK_DENSITY = 0.6
+# Vizinhança de uma célula da grade (lado r/√2) que pode ter pontos a menos de r
+_GRID_NEIGHBORS = [(dy, dx) for dy in range(-2, 3) for dx in range(-2, 3) if (dy or dx) and abs(dy) + abs(dx) < 4]
 
 
 def generate_cities(
@@ -23,6 +45,8 @@ def generate_cities(
     """
     cities = []
     attempts = 0
+    # Compara distâncias ao quadrado para evitar uma raiz quadrada por par
+    min_distance_sq = min_distance * min_distance
 
     while len(cities) < num_cities and attempts < max_attempts:
         attempts += 1
@@ -32,8 +56,10 @@ def generate_cities(
         candidate = (x, y)
 
         valid_position = True
-        for existing_city in cities:
-            if calculate_distance(candidate, existing_city) < min_distance:
+        for existing_x, existing_y in cities:
+            dx = x - existing_x
+            dy = y - existing_y
+            if dx * dx + dy * dy < min_distance_sq:
                 valid_position = False
                 break
 
@@ -60,17 +86,9 @@ def generate_deliveries(
     """
     locations = generate_cities(num_deliveries, min_distance, max_attempts)
 
-    # Define distribuição de prioridades (proporções)
-    priority_distribution = [
-        (Priority.CRITICAL, 0.10),  # 10% críticas
-        (Priority.HIGH, 0.20),  # 20% altas
-        (Priority.MEDIUM, 0.40),  # 40% médias
-        (Priority.LOW, 0.30),  # 30% baixas
-    ]
-
     # Calcula quantas entregas de cada prioridade
     priorities = []
-    for priority, proportion in priority_distribution:
+    for priority, proportion in PRIORITY_DISTRIBUTION:
         count = int(num_deliveries * proportion)
         priorities.extend([priority] * count)
 
@@ -121,3 +139,157 @@ def generate_vehicle_max_deliveries(num_deliveries: int, num_vehicles: int) -> L
         max_deliveries[vehicle_idx] += 1
 
     return max_deliveries
+
+
+def generate_fleet_problem(
+    deliveries: List[Delivery],
+    num_vehicles: int,
+    depot: Tuple[int, int] = DEPOT_LOCATION,
+    capacity_margin: float = FLEET_CAPACITY_MARGIN,
+) -> VRPProblem:
+    """Instância com as entregas dadas e uma frota aleatória (capacidades e máximo de entregas por veículo)."""
+    capacities = generate_vehicle_capacities(sum(d.weight for d in deliveries), num_vehicles, capacity_margin)
+    max_deliveries = generate_vehicle_max_deliveries(len(deliveries), num_vehicles)
+    return VRPProblem(deliveries, num_vehicles, depot, capacities, max_deliveries)
+
+
+def generate_problem(
+    num_deliveries: int,
+    num_vehicles: int,
+    seed: int | None = None,
+    depot: Tuple[int, int] = DEPOT_LOCATION,
+) -> VRPProblem:
+    """Instância aleatória completa: entregas de generate_deliveries e frota de
+    generate_fleet_problem. Com `seed`, o módulo `random` é semeado antes, e a
+    mesma semente gera sempre a mesma instância."""
+    if seed is not None:
+        random.seed(seed)
+    return generate_fleet_problem(generate_deliveries(num_deliveries), num_vehicles, depot)
+
+
+def poisson_disk_points(bounds: Bounds, min_distance: float, rng: np.random.Generator, rounds: int = 10) -> np.ndarray:
+    """Pontos (matriz m x 2) dentro de `bounds` a pelo menos `min_distance` uns dos outros.
+
+    Amostragem de Poisson-disk com grade de fundo (a mesma de Bridson): as
+    células têm lado r/√2, então cada uma guarda no máximo um ponto e só as
+    vizinhas a até duas células precisam ser conferidas. Em vez de crescer a
+    partir de uma lista ativa, ponto a ponto, cada rodada sorteia um candidato
+    em cada célula vazia de uma das 9 fases (células com a mesma linha e coluna
+    módulo 3, longe demais para conflitarem entre si) e testa todos de uma vez
+    com NumPy. Com `rounds` rodadas a área fica praticamente saturada, e o
+    custo é O(área / r²).
+    """
+    x_min, y_min, x_max, y_max = bounds
+    width, height = x_max - x_min, y_max - y_min
+    cell = min_distance / math.sqrt(2)
+    grid_width, grid_height = max(1, math.ceil(width / cell)), max(1, math.ceil(height / cell))
+
+    # Coordenadas do ponto de cada célula (NaN se vazia), com duas células de borda
+    grid_x = np.full((grid_height + 4, grid_width + 4), np.nan)
+    grid_y = np.full_like(grid_x, np.nan)
+    rows, cols = np.mgrid[2:grid_height + 2, 2:grid_width + 2]
+    phases = [(rows[(rows % 3 == i) & (cols % 3 == j)], cols[(rows % 3 == i) & (cols % 3 == j)])
+              for i in range(3) for j in range(3)]
+    min_distance_sq = min_distance * min_distance
+
+    for _ in range(rounds):
+        for phase_rows, phase_cols in phases:
+            empty = np.isnan(grid_x[phase_rows, phase_cols])
+            phase_rows, phase_cols = phase_rows[empty], phase_cols[empty]
+            x = (phase_cols - 2 + rng.random(len(phase_cols))) * cell
+            y = (phase_rows - 2 + rng.random(len(phase_rows))) * cell
+            valid = (x < width) & (y < height)
+            for dy, dx in _GRID_NEIGHBORS:
+                neighbor_dx = grid_x[phase_rows + dy, phase_cols + dx] - x
+                neighbor_dy = grid_y[phase_rows + dy, phase_cols + dx] - y
+                # Comparação com NaN (célula vazia) é falsa e não invalida o candidato
+                valid &= ~(neighbor_dx * neighbor_dx + neighbor_dy * neighbor_dy < min_distance_sq)
+            grid_x[phase_rows[valid], phase_cols[valid]] = x[valid]
+            grid_y[phase_rows[valid], phase_cols[valid]] = y[valid]
+
+    occupied = ~np.isnan(grid_x)
+    return np.column_stack([grid_x[occupied] + x_min, grid_y[occupied] + y_min])
+
+
+def sample_locations(
+    num_locations: int,
+    rng: np.random.Generator,
+    min_distance: float = 30,
+    bounds: Bounds = DELIVERY_BOUNDS,
+) -> np.ndarray:
+    """Coordenadas inteiras (matriz n x 2) espalhadas por `bounds`, a pelo menos
+    `min_distance` umas das outras, em O(n).
+
+    Os pontos vêm de poisson_disk_points com um raio que gera cerca de 25% a
+    mais que o necessário (nunca menor que `min_distance`), dos quais se
+    sorteiam `num_locations`; assim uma caixa grande com poucas entregas não
+    custa mais que uma pequena. O raio inclui √2 de folga para o arredondamento
+    das coordenadas. Se a caixa não comporta as entregas com essa distância,
+    levanta ValueError (generate_cities, ao contrário, completaria com pontos
+    sem a restrição).
+    """
+    x_min, y_min, x_max, y_max = math.ceil(bounds[0]), math.ceil(bounds[1]), math.floor(bounds[2]), math.floor(bounds[3])
+    if x_max < x_min or y_max < y_min:
+        raise ValueError(f"Retângulo inválido: {bounds}")
+    if num_locations <= 0:
+        return np.empty((0, 2), dtype=np.int64)
+
+    required_radius = max(min_distance, 1) + math.sqrt(2)
+    area = max(x_max - x_min, 1) * max(y_max - y_min, 1)
+    radius = max(required_radius, math.sqrt(_POISSON_DISK_DENSITY * area / (1.25 * num_locations)))
+    while True:
+        points = poisson_disk_points((x_min, y_min, x_max, y_max), radius, rng)
+        if len(points) >= num_locations:
+            break
+        if radius == required_radius:
+            raise ValueError(
+                f"O retângulo {bounds} comporta só {len(points)} entregas a {min_distance} de distância; "
+                f"{num_locations} pedidas"
+            )
+        radius = max(required_radius, radius * 0.9)
+
+    chosen = rng.choice(len(points), size=num_locations, replace=False)
+    return np.rint(points[chosen]).astype(np.int64)
+
+
+def sample_deliveries(
+    num_deliveries: int,
+    rng: np.random.Generator,
+    min_distance: float = 30,
+    bounds: Bounds = DELIVERY_BOUNDS,
+) -> List[Delivery]:
+    """Versão vetorizada de generate_deliveries para instâncias grandes (10k-100k entregas).
+
+    Localizações de sample_locations e prioridades na mesma proporção de
+    PRIORITY_DISTRIBUTION, com pesos e embaralhamento sorteados de uma vez
+    pelo `rng`: a mesma semente gera a mesma instância.
+
+    A DistanceMatrix de um VRPProblem é densa, (n+1)² float64, e só é montada
+    no primeiro uso: cerca de 0,8 GB com 10k entregas (com pico de alguns GB
+    durante a montagem e ~3,2 GB a mais para as linhas em listas Python) e
+    80 GB com 100k. Acima de poucos milhares de entregas, use estas instâncias
+    sem a matriz (ex.: GridIndex, assign_deliveries_to_vehicles).
+    """
+    locations = sample_locations(num_deliveries, rng, min_distance, bounds)
+
+    counts = [int(num_deliveries * proportion) for _, proportion in PRIORITY_DISTRIBUTION]
+    priority_values = np.repeat([priority.value for priority, _ in PRIORITY_DISTRIBUTION], counts)
+    priority_values = np.concatenate(
+        [priority_values, np.full(num_deliveries - len(priority_values), Priority.MEDIUM.value)])
+    priority_values = rng.permutation(priority_values)
+
+    weights = np.round(rng.uniform(MIN_DELIVERY_WEIGHT, MAX_DELIVERY_WEIGHT, num_deliveries), 2)
+
+    return [
+        Delivery(location=(x, y), priority=Priority(priority), weight=weight, id=i)
+        for i, ((x, y), priority, weight) in enumerate(
+            zip(locations.tolist(), priority_values.tolist(), weights.tolist(), strict=True))
+    ]
+
+
+def sample_vehicle_max_deliveries(num_deliveries: int, num_vehicles: int, rng: np.random.Generator) -> List[int]:
+    """Como generate_vehicle_max_deliveries (ao menos 1 por veículo e o resto ao
+    acaso), com o resto repartido por um único sorteio multinomial."""
+    # Com menos entregas que veículos, todos ficam com 1, como na versão original
+    extra = rng.multinomial(max(num_deliveries - num_vehicles, 0), np.full(num_vehicles, 1 / num_vehicles))
+    return (extra + 1).tolist()
@@ -6,6 +6,8 @@ NODE_RADIUS = 10
 FPS = 30
 PLOT_X_OFFSET = 450
 MARGIN = 30
+# Máximo de pontos desenhados no gráfico de convergência (históricos maiores são amostrados)
+PLOT_MAX_POINTS = 500
 
 #  ============= GA constant values =====================
 N_CITIES = 15
@@ -13,9 +15,33 @@ POPULATION_SIZE = 100
 N_GENERATIONS = 1000
 TIME_LIMIT_SECONDS = 10  # 10 segundos
 MUTATION_PROBABILITY = 0.5
+SELECTION_STRATEGY = "proportional"  # Seleção dos pais: "proportional", "tournament", "rank" ou "sus"
+TOURNAMENT_SIZE = 3  # Indivíduos por torneio na seleção "tournament"
+ISLAND_COUNT = 4  # Ilhas (subpopulações em processos separados) no modo de ilhas
+ISLAND_MIGRATION_INTERVAL = 10  # Gerações entre migrações
+ISLAND_MIGRATION_SIZE = 2  # Melhores indivíduos enviados por ilha a cada migração
+ISLAND_TOPOLOGY = "ring"  # Topologia da migração: "ring" ou "full"
+LOCAL_SEARCH_ELITES = 0  # Melhores indivíduos refinados com 2-opt/Or-opt a cada geração (0 desativa o modo memético)
+LOCAL_SEARCH_NEIGHBORS = 10  # Vizinhos mais próximos considerados em cada movimento da busca local
+ELITE_ARCHIVE_SIZE = 5  # Melhores genomas distintos mantidos durante a execução (exportados ao fim)
+FITNESS_CACHE_SIZE = 10_000  # Máximo de genomas com fitness memorizado (LRU)
+EVALUATOR_BACKEND = "serial"  # Avaliação do fitness: "serial", "process" ou "thread"
+EVALUATOR_WORKERS = None  # Workers dos avaliadores paralelos (None = número de CPUs)
+CHECKPOINT_INTERVAL_SECONDS = 60  # Intervalo mínimo entre checkpoints gravados durante a execução (--checkpoint)
+SPATIAL_INDEX_MIN_POINTS = 128  # A partir deste tamanho de rota o vizinho mais próximo usa a grade espacial
+SERVICE_HOST = "127.0.0.1"  # Endereço do serviço HTTP de otimização (service.py)
+SERVICE_PORT = 8765
+SERVICE_MAX_JOBS = None  # Jobs resolvidos ao mesmo tempo, cada um em um processo (None = número de CPUs)
+SERVICE_MAX_TIME_LIMIT_SECONDS = 300  # Teto para o time_limit_seconds pedido em cada job
+SERVICE_PROGRESS_INTERVAL = 0.5  # Intervalo mínimo (s) entre as melhorias publicadas de um job
+SERVICE_CANCEL_GRACE_SECONDS = 5  # Após cancelar, tempo de espera até encerrar o processo à força
+SERVICE_MAX_FINISHED_JOBS = 100  # Jobs encerrados mantidos em memória para consulta
 
 #  ============= VRP constant values ====================
 NUM_VEHICLES = 3  # Número de veículos disponíveis
+MIN_DELIVERIES = 2  # Menor instância resolvida pelo AG (a mutação troca dois genes de posição)
+DEPOT_LOCATION = (500, HEIGHT // 2)  # Depósito das instâncias geradas
+DELIVERY_ID_SLACK = 1000  # Ids de entrega vão de 0 a 2·n + este valor (cada id possível ocupa uma linha da matriz de distâncias)
 
 # Parâmetros de entregas
 MIN_DELIVERY_WEIGHT = 5.0  # Peso mínimo de uma entrega em kg
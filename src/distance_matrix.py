@@ -0,0 +1,169 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from models import Delivery
+
+# Linha/coluna reservada para o depósito na matriz de distâncias
+DEPOT_INDEX = 0
+
+
+def _pairwise_distances(coordinates: np.ndarray) -> np.ndarray:
+    """Calcula a matriz euclidiana completa entre todas as coordenadas."""
+    dx = coordinates[:, 0][:, None] - coordinates[:, 0][None, :]
+    dy = coordinates[:, 1][:, None] - coordinates[:, 1][None, :]
+    # Mesma sequência de operações de population.calculate_distance, garantindo
+    # resultados bit a bit idênticos aos do cálculo escalar.
+    return np.sqrt(dx * dx + dy * dy)
+
+
+class DistanceMatrix:
+    """Tabela de distâncias pré-calculada entre o depósito e todas as entregas.
+
+    A linha/coluna ``DEPOT_INDEX`` corresponde ao depósito e a entrega de id
+    ``i`` ocupa a linha/coluna ``i + 1``. A matriz é construída uma única vez por
+    problema e substitui o recálculo de raízes quadradas nos laços do AG.
+    Linhas de ids sem entrega (buracos na numeração, entregas canceladas) ficam
+    com distância infinita e nunca aparecem nas listas de vizinhos.
+    """
+
+    def __init__(self, depot: Tuple[int, int], deliveries: List[Delivery]):
+        size = max((delivery.id for delivery in deliveries), default=-1) + 2
+
+        coordinates = np.zeros((size, 2), dtype=np.float64)
+        coordinates[DEPOT_INDEX] = depot
+        present = np.zeros(size, dtype=bool)
+        present[DEPOT_INDEX] = True
+        for delivery in deliveries:
+            coordinates[self.index(delivery.id)] = delivery.location
+            present[self.index(delivery.id)] = True
+
+        self.depot = depot
+        self.coordinates = coordinates
+        self.present = present
+        self.matrix = _pairwise_distances(coordinates)
+        self.matrix[~present, :] = np.inf
+        self.matrix[:, ~present] = np.inf
+        # `matrix` é uma visão do canto deste buffer, que ganha folga ao crescer (add_delivery)
+        self._buffer = self.matrix
+        self._rows: List[List[float]] | None = None
+        self._neighbors: Dict[int, List[List[int]]] = {}
+
+    @staticmethod
+    def index(delivery_id: int) -> int:
+        """Retorna a linha/coluna da matriz associada ao id de uma entrega."""
+        return delivery_id + 1
+
+    @property
+    def size(self) -> int:
+        return self.matrix.shape[0]
+
+    @property
+    def rows(self) -> List[List[float]]:
+        """Linhas da matriz como listas Python, para consultas escalares rápidas.
+
+        Indexar listas é bem mais barato que indexar um ``np.ndarray`` elemento a
+        elemento, por isso os laços em Python (vizinho mais próximo, distância de
+        rota) usam esta visão. É construída sob demanda e reaproveitada.
+        """
+        if self._rows is None:
+            self._rows = self.matrix.tolist()
+        return self._rows
+
+    def neighbors(self, count: int) -> List[List[int]]:
+        """Para cada linha, as `count` entregas mais próximas (índices da matriz).
+
+        As listas vêm em ordem crescente de distância, não incluem o próprio
+        ponto, o depósito nem linhas sem entrega e são calculadas uma vez por
+        valor de `count`.
+        """
+        if count not in self._neighbors:
+            distances = self.matrix.copy()
+            np.fill_diagonal(distances, np.inf)
+            distances[:, DEPOT_INDEX] = np.inf
+            count_in_range = max(0, min(count, int(self.present.sum()) - 2))
+            order = np.argsort(distances, axis=1, kind="stable")[:, :count_in_range]
+            self._neighbors[count] = order.tolist()
+        return self._neighbors[count]
+
+    def add_delivery(self, delivery: Delivery) -> None:
+        """Inclui (ou reposiciona) uma entrega calculando só a linha dela.
+
+        A matriz cresce sobre um buffer com 50% de folga, então inserções
+        seguidas custam O(n) amortizado em vez de recalcular as O(n²)
+        distâncias. As listas de `rows` já construídas são atualizadas no lugar
+        e as listas de vizinhos são descartadas (recalculadas sob demanda).
+        """
+        index = self.index(delivery.id)
+        old_size = self.size
+        size = max(old_size, index + 1)
+
+        if size > self._buffer.shape[0]:
+            capacity = max(size, self._buffer.shape[0] * 3 // 2)
+            buffer = np.zeros((capacity, capacity), dtype=np.float64)
+            buffer[:old_size, :old_size] = self.matrix
+            self._buffer = buffer
+        if size > old_size:
+            coordinates = np.zeros((size, 2), dtype=np.float64)
+            coordinates[:old_size] = self.coordinates
+            self.coordinates = coordinates
+            present = np.zeros(size, dtype=bool)
+            present[:old_size] = self.present
+            self.present = present
+
+        self.coordinates[index] = delivery.location
+        self.present[index] = True
+        dx = self.coordinates[:, 0] - self.coordinates[index, 0]
+        dy = self.coordinates[:, 1] - self.coordinates[index, 1]
+        row = np.sqrt(dx * dx + dy * dy)
+        row[~self.present] = np.inf
+        self.matrix = self._buffer[:size, :size]
+        # Ids pulados entre o antigo maior id e o novo ficam como buracos
+        self.matrix[old_size:, :] = np.inf
+        self.matrix[:, old_size:] = np.inf
+        self.matrix[index, :] = row
+        self.matrix[:, index] = row
+
+        if self._rows is not None:
+            for row_index, values in enumerate(self._rows):
+                values.extend(self.matrix[row_index, old_size:size].tolist())
+                values[index] = float(row[row_index])
+            self._rows.extend(self.matrix[old_size:size].tolist())
+            self._rows[index] = row.tolist()
+        self._neighbors.clear()
+
+    def remove_delivery(self, delivery_id: int) -> None:
+        """Transforma a linha da entrega em buraco (distância infinita), em O(n)."""
+        index = self.index(delivery_id)
+        self.present[index] = False
+        self.matrix[index, :] = np.inf
+        self.matrix[:, index] = np.inf
+        if self._rows is not None:
+            for values in self._rows:
+                values[index] = np.inf
+            self._rows[index] = [np.inf] * self.size
+        self._neighbors.clear()
+
+    def distance(self, delivery_id1: int, delivery_id2: int) -> float:
+        """Distância entre duas entregas identificadas pelo id."""
+        return self.rows[delivery_id1 + 1][delivery_id2 + 1]
+
+    def depot_distance(self, delivery_id: int) -> float:
+        """Distância entre o depósito e a entrega informada."""
+        return self.rows[DEPOT_INDEX][delivery_id + 1]
+
+    def route_distance(self, route: List[Delivery]) -> float:
+        """Distância total de uma rota saindo e voltando ao depósito."""
+        if not route:
+            return 0.0
+
+        rows = self.rows
+        total = 0.0
+        previous = DEPOT_INDEX
+        for delivery in route:
+            current = delivery.id + 1
+            total += rows[previous][current]
+            previous = current
+        total += rows[previous][DEPOT_INDEX]
+
+        return total
@@ -0,0 +1,160 @@
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from batch_fitness import calculate_fitness_batch, evaluate_with_cache
+from fitness_cache import FitnessCache
+from problem import VRPProblem
+
+# Problema recebido por cada processo do pool na inicialização
+_worker_problem: VRPProblem | None = None
+
+
+def _evaluate_problem(problem: VRPProblem, population_ids: np.ndarray) -> np.ndarray:
+    return calculate_fitness_batch(
+        population_ids,
+        problem.deliveries,
+        problem.num_vehicles,
+        problem.depot,
+        problem.vehicle_capacities,
+        problem.vehicle_max_deliveries,
+        problem.distance_matrix,
+        delivery_table=problem.delivery_table,
+    )
+
+
+def _init_worker(problem: VRPProblem) -> None:
+    """Recebe o problema uma única vez e já constrói a matriz de distâncias."""
+    global _worker_problem
+    _worker_problem = problem
+    _ = problem.distance_matrix
+    _ = problem.delivery_table
+
+
+def _evaluate_in_worker(population_ids: np.ndarray) -> np.ndarray:
+    return _evaluate_problem(_worker_problem, population_ids)
+
+
+class SerialEvaluator:
+    """Avalia a população no próprio processo, com calculate_fitness_batch."""
+
+    def __init__(self, problem: VRPProblem, fitness_cache: FitnessCache | None = None):
+        self.problem = problem
+        self.fitness_cache = fitness_cache
+        # Genomas efetivamente avaliados (fora do cache), para instrumentação
+        self.evaluations = 0
+
+    def _evaluate_uncached(self, population_ids: np.ndarray) -> np.ndarray:
+        return _evaluate_problem(self.problem, population_ids)
+
+    def _evaluate_counted(self, population_ids: np.ndarray) -> np.ndarray:
+        self.evaluations += len(population_ids)
+        return self._evaluate_uncached(population_ids)
+
+    def evaluate(self, population_ids: np.ndarray) -> np.ndarray:
+        """Retorna o vetor de fitness da população (matriz de genomas)."""
+        if len(population_ids) == 0:
+            return np.empty(0, dtype=np.float64)
+
+        if self.fitness_cache is None:
+            return self._evaluate_counted(population_ids)
+
+        return evaluate_with_cache(population_ids, self.fitness_cache, self._evaluate_counted)
+
+    def problem_changed(self) -> None:
+        """Chamado quando o problema é alterado durante a execução (entregas
+        inseridas ou canceladas): descarta o que valia para a instância anterior."""
+        if self.fitness_cache is not None:
+            self.fitness_cache.clear()
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _PoolEvaluator(SerialEvaluator):
+    """Base dos avaliadores paralelos: divide os genomas em blocos entre workers.
+
+    O cache continua no processo principal; só os genomas inéditos são enviados.
+    """
+
+    def __init__(self, problem: VRPProblem, workers: int | None = None, fitness_cache: FitnessCache | None = None):
+        super().__init__(problem, fitness_cache)
+        self.workers = workers or os.cpu_count() or 1
+        self._executor = self._create_executor()
+
+    def _create_executor(self) -> Executor:
+        raise NotImplementedError
+
+    def _submit_chunk(self, chunk: np.ndarray):
+        raise NotImplementedError
+
+    def _evaluate_uncached(self, population_ids: np.ndarray) -> np.ndarray:
+        num_chunks = min(self.workers, len(population_ids))
+        chunks = np.array_split(population_ids, num_chunks)
+        futures = [self._submit_chunk(chunk) for chunk in chunks]
+        return np.concatenate([future.result() for future in futures])
+
+    def problem_changed(self) -> None:
+        super().problem_changed()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = self._create_executor()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class ProcessPoolEvaluator(_PoolEvaluator):
+    """Avalia blocos da população em processos separados.
+
+    Cada processo recebe o problema uma vez (initializer do pool); a cada geração
+    só as matrizes de ids dos genomas trafegam entre os processos.
+    """
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(self.problem,))
+
+    def _submit_chunk(self, chunk: np.ndarray):
+        return self._executor.submit(_evaluate_in_worker, chunk)
+
+
+class ThreadPoolEvaluator(_PoolEvaluator):
+    """Avalia blocos da população em threads que compartilham o mesmo problema."""
+
+    def _create_executor(self) -> Executor:
+        # Constrói a matriz e a tabela antes de disparar as threads para não duplicá-las
+        _ = self.problem.distance_matrix
+        _ = self.problem.delivery_table
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+    def _submit_chunk(self, chunk: np.ndarray):
+        return self._executor.submit(_evaluate_problem, self.problem, chunk)
+
+
+EVALUATOR_BACKENDS = {
+    "serial": SerialEvaluator,
+    "process": ProcessPoolEvaluator,
+    "thread": ThreadPoolEvaluator,
+}
+
+
+def create_evaluator(
+    backend: str,
+    problem: VRPProblem,
+    workers: int | None = None,
+    fitness_cache: FitnessCache | None = None,
+) -> SerialEvaluator:
+    """Cria o avaliador configurado ("serial", "process" ou "thread")."""
+    if backend not in EVALUATOR_BACKENDS:
+        raise ValueError(f"Avaliador desconhecido: {backend!r}. Opções: {', '.join(EVALUATOR_BACKENDS)}")
+
+    if backend == "serial":
+        return SerialEvaluator(problem, fitness_cache)
+
+    return EVALUATOR_BACKENDS[backend](problem, workers, fitness_cache)
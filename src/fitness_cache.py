@@ -0,0 +1,65 @@
+from collections import OrderedDict
+from typing import Hashable, List, Tuple
+
+from config import FITNESS_CACHE_SIZE
+
+
+class FitnessCache:
+    """Cache LRU de fitness indexado pelo genoma (tupla de ids das entregas).
+
+    Com elitismo e baixa diversidade, muitos indivíduos se repetem entre
+    gerações; cada acerto evita refazer a divisão entre veículos e o vizinho mais
+    próximo. Ao atingir `max_size`, descarta a entrada usada há mais tempo.
+    """
+
+    def __init__(self, max_size: int = FITNESS_CACHE_SIZE):
+        if max_size <= 0:
+            raise ValueError("max_size deve ser positivo")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> float | None:
+        """Retorna o fitness armazenado (atualizando o uso) ou None em caso de falta."""
+        fitness = self._entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return fitness
+
+    def put(self, key: Hashable, fitness: float) -> None:
+        """Armazena o fitness de um genoma, descartando o menos usado se necessário."""
+        self._entries[key] = fitness
+        self._entries.move_to_end(key)
+
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def items(self) -> List[Tuple[Hashable, float]]:
+        """Entradas (chave, fitness) da usada há mais tempo para a mais recente.
+
+        Reinseri-las nessa ordem com `put` reproduz o cache, inclusive a ordem de descarte.
+        """
+        return list(self._entries.items())
+
+    def clear(self) -> None:
+        """Esvazia o cache e zera os contadores (ex.: quando o problema muda)."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
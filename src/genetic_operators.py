@@ -1,7 +1,8 @@
-import copy
 import random
 from typing import List, Tuple, TypeVar
 
+import numpy as np
+
 from models import Delivery
 
 T = TypeVar("T", Tuple[int, int], Delivery)
@@ -14,25 +15,108 @@ def sort_population(population: List[List[T]], fitness_scores: List[float]) -> T
     return sorted_population, sorted_fitness
 
 
+def sort_genomes(population: np.ndarray, fitness_scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Ordena a matriz de genomas pelo fitness (estável, como sort_population)."""
+    order = np.argsort(fitness_scores, kind="stable")
+    return population[order], fitness_scores[order]
+
+
+def _gene_key(gene: T):
+    """Chave de pertinência de um gene: o id para entregas, o próprio valor para tuplas."""
+    return gene.id if isinstance(gene, Delivery) else gene
+
+
 def order_crossover(parent1: List[T], parent2: List[T]) -> List[T]:
     length = len(parent1)
 
     start_index = random.randint(0, length - 1)
     end_index = random.randint(start_index + 1, length)
 
-    child = parent1[start_index:end_index]
+    # Filho pré-alocado e conjunto de pertinência: O(n), sem `in` em lista nem insert
+    child: List[T] = [None] * length
+    child[start_index:end_index] = parent1[start_index:end_index]
+    in_child = {_gene_key(gene) for gene in child[start_index:end_index]}
 
-    remaining_positions = [i for i in range(length) if i < start_index or i >= end_index]
-    remaining_genes = [gene for gene in parent2 if gene not in child]
+    remaining_positions = [*range(start_index), *range(end_index, length)]
+    remaining_genes = (gene for gene in parent2 if _gene_key(gene) not in in_child)
 
     for position, gene in zip(remaining_positions, remaining_genes, strict=False):
-        child.insert(position, gene)
+        child[position] = gene
+
+    return child
+
+
+def order_crossover_genome(
+    parent1: np.ndarray,
+    parent2: np.ndarray,
+    start_index: int | None = None,
+    end_index: int | None = None,
+) -> np.ndarray:
+    """Order crossover (OX1) em tempo linear para genomas de ids.
+
+    Usa um buffer pré-alocado para o filho e um bitmap de pertinência indexado
+    pelo id da entrega. Sem cortes informados, sorteia-os como order_crossover.
+    """
+    length = len(parent1)
+
+    if start_index is None or end_index is None:
+        start_index = random.randint(0, length - 1)
+        end_index = random.randint(start_index + 1, length)
+
+    child = np.empty_like(parent1)
+    segment = parent1[start_index:end_index]
+    child[start_index:end_index] = segment
+
+    in_child = np.zeros(int(parent1.max()) + 1, dtype=bool)
+    in_child[segment] = True
+
+    remaining_genes = parent2[~in_child[parent2]]
+    child[:start_index] = remaining_genes[:start_index]
+    child[end_index:] = remaining_genes[start_index:]
 
     return child
 
 
+def random_cut_points(count: int, length: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorteia `count` pares de cortes com a mesma distribuição de order_crossover."""
+    start_indices = rng.integers(0, length, size=count)
+    end_indices = rng.integers(start_indices + 1, length + 1)
+    return start_indices, end_indices
+
+
+def order_crossover_batch(
+    parents1: np.ndarray,
+    parents2: np.ndarray,
+    start_indices: np.ndarray,
+    end_indices: np.ndarray,
+) -> np.ndarray:
+    """Gera uma geração inteira de filhos OX1 de uma só vez.
+
+    Cada linha i de `parents1`/`parents2` é um par de pais e
+    `start_indices[i]:end_indices[i]` o segmento herdado do primeiro pai.
+    """
+    num_children, length = parents1.shape
+    rows = np.arange(num_children)[:, None]
+    positions = np.arange(length)
+
+    in_segment = (positions >= start_indices[:, None]) & (positions < end_indices[:, None])
+
+    # Bitmap (filho x id) marcando os genes já herdados do primeiro pai
+    in_child = np.zeros((num_children, int(parents1.max()) + 1), dtype=bool)
+    in_child[rows, parents1] = in_segment
+
+    children = np.empty_like(parents1)
+    children[in_segment] = parents1[in_segment]
+    # Máscaras percorridas linha a linha: cada filho recebe, em ordem, os genes do
+    # segundo pai que faltam, exatamente nas posições fora do segmento.
+    children[~in_segment] = parents2[~in_child[rows, parents2]]
+
+    return children
+
+
 def swap_mutation(individual: List[T], mutation_probability: float) -> List[T]:
-    mutated = copy.deepcopy(individual)
+    # Cópia rasa: os genes (ids, tuplas ou entregas) nunca são alterados, só trocados de lugar
+    mutated = individual.copy()
 
     if random.random() < mutation_probability:
         index = random.randint(0, len(individual) - 2)
@@ -0,0 +1,28 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from models import Delivery
+
+# Tipo inteiro usado nos genomas: comporta ids acima de 65535 (cenários grandes)
+GENOME_DTYPE = np.int32
+
+
+def build_delivery_lookup(deliveries: List[Delivery]) -> Dict[int, Delivery]:
+    """Tabela única id -> Delivery compartilhada por todos os genomas."""
+    return {delivery.id: delivery for delivery in deliveries}
+
+
+def deliveries_to_genome(deliveries: List[Delivery]) -> np.ndarray:
+    """Converte uma lista de entregas no genoma (permutação de ids)."""
+    return np.fromiter((delivery.id for delivery in deliveries), dtype=GENOME_DTYPE, count=len(deliveries))
+
+
+def genome_to_deliveries(genome: np.ndarray, delivery_lookup: Dict[int, Delivery]) -> List[Delivery]:
+    """Converte um genoma de volta na lista de entregas (visualização, CSV, relatórios)."""
+    return [delivery_lookup[delivery_id] for delivery_id in genome.tolist()]
+
+
+def genome_key(genome: np.ndarray) -> Tuple[int, ...]:
+    """Chave imutável e hashável que identifica um genoma (tupla de ids)."""
+    return tuple(genome.tolist())
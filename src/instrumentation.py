@@ -0,0 +1,85 @@
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterator
+
+# Fases medidas em cada geração; "render" cobre todos os observadores (console, Pygame...)
+# e "replan" a aplicação das entregas inseridas ou canceladas durante a execução
+PHASES = ("replan", "evaluate", "sort", "local_search", "select", "crossover", "mutate", "render")
+
+
+@dataclass
+class GenerationMetrics:
+    """Tempos por fase e contadores de uma geração."""
+
+    generation: int
+    elapsed_seconds: float
+    best_fitness: float
+    phase_seconds: Dict[str, float]
+    evaluations: int
+    cache_hits: int
+    cache_misses: int
+    unique_genomes: int
+
+    @property
+    def generation_seconds(self) -> float:
+        return sum(self.phase_seconds.values())
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass
+class Instrumentation:
+    """Acumula os tempos de cada fase da geração corrente e os totais da execução.
+
+    Uso: `with instrumentation.phase("evaluate"): ...` dentro da geração e
+    `finish_generation(...)` ao fim dela, que devolve o GenerationMetrics.
+    """
+
+    phase_totals: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0))
+    generations: int = 0
+    evaluations: int = 0
+    _current: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(PHASES, 0.0), repr=False)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Soma `seconds` à fase na geração corrente (ex.: tempo medido em outro processo)."""
+        self._current[name] = self._current.get(name, 0.0) + seconds
+
+    def finish_generation(
+        self,
+        generation: int,
+        elapsed_seconds: float,
+        best_fitness: float,
+        evaluations: int,
+        cache_hits: int,
+        cache_misses: int,
+        unique_genomes: int,
+    ) -> GenerationMetrics:
+        """Fecha a geração corrente, somando seus tempos aos totais."""
+        phase_seconds = self._current
+        self._current = dict.fromkeys(PHASES, 0.0)
+
+        for name, seconds in phase_seconds.items():
+            self.phase_totals[name] = self.phase_totals.get(name, 0.0) + seconds
+        self.generations += 1
+        self.evaluations += evaluations
+
+        return GenerationMetrics(
+            generation=generation,
+            elapsed_seconds=elapsed_seconds,
+            best_fitness=best_fitness,
+            phase_seconds=phase_seconds,
+            evaluations=evaluations,
+            cache_hits=cache_hits,
+            cache_misses=cache_misses,
+            unique_genomes=unique_genomes,
+        )
@@ -0,0 +1,360 @@
+import multiprocessing
+import random
+import time
+import traceback
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+from archive import EliteArchive
+from config import ISLAND_COUNT, ISLAND_MIGRATION_INTERVAL, ISLAND_MIGRATION_SIZE, ISLAND_TOPOLOGY
+from evaluators import SerialEvaluator
+from fitness_cache import FitnessCache
+from genetic_operators import sort_genomes
+from instrumentation import Instrumentation
+from models import Delivery
+from population import create_initial_population_genomes
+from problem import VRPProblem
+from solver import (
+    GenerationEvent,
+    GeneticVRP,
+    SolverCheckpoint,
+    SolverConfig,
+    SolverObserver,
+    SolverResult,
+    breed_next_generation,
+    improve_elites,
+)
+
+MIGRATION_TOPOLOGIES = ("ring", "full")
+
+
+@dataclass
+class IslandConfig:
+    """Parâmetros do modelo de ilhas.
+
+    `island_population_size` None divide `SolverConfig.population_size` entre
+    as ilhas, mantendo o mesmo número de avaliações por geração.
+    """
+
+    num_islands: int = ISLAND_COUNT
+    migration_interval: int = ISLAND_MIGRATION_INTERVAL
+    migration_size: int = ISLAND_MIGRATION_SIZE
+    topology: str = ISLAND_TOPOLOGY
+    island_population_size: int | None = None
+
+
+def migration_sources(topology: str, num_islands: int) -> List[List[int]]:
+    """Para cada ilha, as ilhas de onde ela recebe migrantes."""
+    if topology == "ring":
+        return [[(island - 1) % num_islands] if num_islands > 1 else [] for island in range(num_islands)]
+    if topology == "full":
+        return [[other for other in range(num_islands) if other != island] for island in range(num_islands)]
+    raise ValueError(f"Topologia desconhecida: {topology!r}. Opções: {', '.join(MIGRATION_TOPOLOGIES)}")
+
+
+def select_migrants(
+    emigrants: List[Tuple[np.ndarray, np.ndarray]],
+    migration_size: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Junta os emigrantes das ilhas de origem e fica com os `migration_size` melhores."""
+    genomes = np.concatenate([genomes for genomes, _ in emigrants])
+    fitness = np.concatenate([fitness for _, fitness in emigrants])
+    order = np.argsort(fitness, kind="stable")[:migration_size]
+    return genomes[order], fitness[order]
+
+
+def integrate_migrants(
+    population: np.ndarray,
+    fitness: np.ndarray,
+    migrants: np.ndarray,
+    migrant_fitness: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Substitui os piores indivíduos (população ordenada) pelos migrantes.
+
+    O melhor indivíduo local (posição 0) nunca é substituído.
+    """
+    count = min(len(migrants), len(population) - 1)
+    if count <= 0:
+        return population, fitness
+
+    population = population.copy()
+    fitness = fitness.copy()
+    population[-count:] = migrants[:count]
+    fitness[-count:] = migrant_fitness[:count]
+    return sort_genomes(population, fitness)
+
+
+def _island_worker(
+    island_id: int,
+    problem: VRPProblem,
+    config: SolverConfig,
+    population_size: int,
+    migration_size: int,
+    seed_genomes: np.ndarray | None,
+    stop_event,
+    connection,
+) -> None:
+    """Laço de uma ilha: evolui os lotes de gerações pedidos pelo coordenador.
+
+    Cada comando é (gerações, segundos restantes, migrantes, fitness dos
+    migrantes) ou None para encerrar. O lote termina antes se o tempo restante
+    acabar ou se `stop_event` for sinalizado; a resposta traz os melhores
+    indivíduos e, por geração executada, o melhor fitness, o melhor genoma e as
+    métricas (GenerationMetrics).
+    """
+    try:
+        seed = None if config.seed is None else config.seed + island_id
+        random.seed(seed)
+        rng = np.random.default_rng(seed)
+
+        instrumentation = Instrumentation()
+        fitness_cache = FitnessCache(config.fitness_cache_size)
+        improved_cache = FitnessCache(config.fitness_cache_size)
+        evaluator = SerialEvaluator(problem, fitness_cache)
+        population = create_initial_population_genomes(problem.deliveries, population_size)
+        if seed_genomes is not None:
+            population[:len(seed_genomes)] = seed_genomes
+        fitness = evaluator.evaluate(population)
+        population, fitness = sort_genomes(population, fitness)
+        generation = 0
+
+        while True:
+            command = connection.recv()
+            if command is None:
+                connection.send(("done", (fitness_cache.hits, fitness_cache.misses)))
+                return
+
+            generations, remaining_seconds, migrants, migrant_fitness = command
+            deadline = None if remaining_seconds is None else time.perf_counter() + remaining_seconds
+            if migrants is not None:
+                population, fitness = integrate_migrants(population, fitness, migrants, migrant_fitness)
+
+            history = []
+            best_genomes = []
+            metrics = []
+            for _ in range(generations):
+                if stop_event.is_set() or (deadline is not None and time.perf_counter() >= deadline):
+                    break
+
+                generation += 1
+                evaluations, cache_hits, cache_misses = evaluator.evaluations, fitness_cache.hits, fitness_cache.misses
+                population = breed_next_generation(
+                    population, fitness, config.mutation_probability, rng, config.selection_strategy, instrumentation)
+                with instrumentation.phase("evaluate"):
+                    fitness = evaluator.evaluate(population)
+                with instrumentation.phase("sort"):
+                    population, fitness = sort_genomes(population, fitness)
+                if config.local_search_elites > 0:
+                    with instrumentation.phase("local_search"):
+                        population, fitness = improve_elites(
+                            problem, population, fitness, config.local_search_elites, improved_cache)
+
+                history.append(float(fitness[0]))
+                best_genomes.append(population[0].copy())
+                metrics.append(instrumentation.finish_generation(
+                    generation=generation,
+                    elapsed_seconds=0.0,
+                    best_fitness=history[-1],
+                    evaluations=evaluator.evaluations - evaluations,
+                    cache_hits=fitness_cache.hits - cache_hits,
+                    cache_misses=fitness_cache.misses - cache_misses,
+                    unique_genomes=len({genome.tobytes() for genome in population}),
+                ))
+
+            connection.send((
+                "ok",
+                (population[:migration_size].copy(), fitness[:migration_size].copy(), history, best_genomes, metrics),
+            ))
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+
+
+class IslandModel(GeneticVRP):
+    """AG com várias subpopulações (ilhas) evoluindo em processos separados.
+
+    Cada ilha usa os mesmos operadores do GeneticVRP (breed_next_generation).
+    A cada `migration_interval` gerações o coordenador recolhe os melhores de
+    cada ilha e os envia às vizinhas segundo a topologia ("ring": para a
+    próxima ilha; "full": para todas), onde substituem os piores indivíduos.
+    As migrações são síncronas, então com `seed` fixa e sem limite de tempo o
+    resultado é reprodutível.
+
+    Ao fim de cada lote os observadores recebem, por geração, um
+    GenerationEvent (melhor entre as ilhas) e um GenerationMetrics com tempos
+    por fase e contadores somados entre as ilhas. O limite de tempo e
+    `request_stop` são verificados pelas ilhas a cada geração, dentro do lote.
+
+    Checkpoints (`resume_from`) e a inserção/cancelamento de entregas durante a
+    execução não são suportados.
+    """
+
+    def __init__(self, observers: List[SolverObserver] | None = None, island_config: IslandConfig | None = None):
+        super().__init__(observers)
+        self.island_config = island_config or IslandConfig()
+        self._stop_event = None
+
+    def request_stop(self) -> None:
+        """Pede o encerramento; as ilhas param ao fim da geração corrente."""
+        super().request_stop()
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def insert_delivery(self, delivery: Delivery) -> None:
+        raise NotImplementedError("O modo de ilhas não aceita inserir entregas durante a execução")
+
+    def cancel_delivery(self, delivery_id: int) -> None:
+        raise NotImplementedError("O modo de ilhas não aceita cancelar entregas durante a execução")
+
+    def run(
+        self,
+        problem: VRPProblem,
+        config: SolverConfig | None = None,
+        resume_from: SolverCheckpoint | None = None,
+        seed_genomes: np.ndarray | None = None,
+    ) -> SolverResult:
+        """Executa as ilhas sobre `problem` até o limite de tempo/gerações ou parada.
+
+        `seed_genomes` é distribuído entre as ilhas (genoma i para a ilha
+        i % num_islands), nas primeiras linhas de cada população inicial.
+        """
+        config = config or SolverConfig()
+        island_config = self.island_config
+        num_islands = island_config.num_islands
+        if num_islands < 1:
+            raise ValueError("num_islands deve ser ao menos 1")
+        if resume_from is not None:
+            raise ValueError("O modo de ilhas não retoma execuções de checkpoint")
+        if seed_genomes is not None and len(seed_genomes) and seed_genomes.shape[1] != problem.num_deliveries:
+            raise ValueError("Os genomas iniciais não correspondem ao problema: número de entregas diferente")
+
+        sources = migration_sources(island_config.topology, num_islands)
+        population_size = island_config.island_population_size or max(2, config.population_size // num_islands)
+        self._stop_requested = False
+
+        for observer in self.observers:
+            observer.on_start(self, problem, config)
+
+        context = multiprocessing.get_context()
+        self._stop_event = context.Event()
+        connections = []
+        processes = []
+        for island_id in range(num_islands):
+            island_seeds = None
+            if seed_genomes is not None and len(seed_genomes):
+                island_seeds = seed_genomes[island_id::num_islands][:population_size]
+            parent_connection, child_connection = context.Pipe()
+            process = context.Process(
+                target=_island_worker,
+                args=(island_id, problem, config, population_size, island_config.migration_size,
+                      island_seeds, self._stop_event, child_connection),
+                daemon=True,
+            )
+            process.start()
+            connections.append(parent_connection)
+            processes.append(process)
+
+        fitness_history: List[float] = []
+        self.instrumentation = instrumentation = Instrumentation()
+        self.elite_archive = elite_archive = EliteArchive(config.elite_archive_size)
+        cache_hits = cache_misses = 0
+        generation = 0
+        migrants: List[Tuple[np.ndarray, np.ndarray] | None] = [None] * num_islands
+
+        try:
+            start_time = time.perf_counter()
+
+            while self._should_continue(generation, start_time, config):
+                epoch = island_config.migration_interval
+                if config.max_generations is not None:
+                    epoch = min(epoch, config.max_generations - generation)
+                remaining_seconds = None
+                if config.time_limit_seconds is not None:
+                    remaining_seconds = config.time_limit_seconds - (time.perf_counter() - start_time)
+
+                for connection, incoming in zip(connections, migrants, strict=True):
+                    connection.send((epoch, remaining_seconds, *(incoming or (None, None))))
+                replies = [self._receive(connection) for connection in connections]
+
+                # Melhor entre as ilhas em cada geração do lote; uma ilha que
+                # parou antes (tempo ou parada) só conta até onde chegou
+                lengths = [len(reply[2]) for reply in replies]
+                for offset in range(max(lengths)):
+                    active = [island for island in range(num_islands) if lengths[island] > offset]
+                    best_island = min(active, key=lambda island: replies[island][2][offset])
+                    best_genome = replies[best_island][3][offset]
+                    fitness_history.append(replies[best_island][2][offset])
+                    elite_archive.add(fitness_history[-1], best_genome)
+
+                    island_metrics = [replies[island][4][offset] for island in active]
+                    for metrics in island_metrics:
+                        for name, seconds in metrics.phase_seconds.items():
+                            instrumentation.record(name, seconds)
+
+                    generation += 1
+                    event = GenerationEvent(
+                        generation=generation,
+                        best_fitness=fitness_history[-1],
+                        best_genome=best_genome,
+                        elapsed_seconds=time.perf_counter() - start_time,
+                        fitness_history=fitness_history,
+                        elite_archive=elite_archive,
+                    )
+                    with instrumentation.phase("render"):
+                        for observer in self.observers:
+                            observer.on_generation(event)
+
+                    metrics = instrumentation.finish_generation(
+                        generation=generation,
+                        elapsed_seconds=time.perf_counter() - start_time,
+                        best_fitness=fitness_history[-1],
+                        evaluations=sum(metrics.evaluations for metrics in island_metrics),
+                        cache_hits=sum(metrics.cache_hits for metrics in island_metrics),
+                        cache_misses=sum(metrics.cache_misses for metrics in island_metrics),
+                        unique_genomes=sum(metrics.unique_genomes for metrics in island_metrics),
+                    )
+                    for observer in self.observers:
+                        observer.on_metrics(metrics)
+
+                emigrants = [(reply[0], reply[1]) for reply in replies]
+                migrants = [
+                    select_migrants([emigrants[source] for source in sources[island]], island_config.migration_size)
+                    if sources[island] else None
+                    for island in range(num_islands)
+                ]
+
+            elapsed_seconds = time.perf_counter() - start_time
+
+            for connection in connections:
+                connection.send(None)
+            for connection in connections:
+                hits, misses = self._receive(connection)
+                cache_hits += hits
+                cache_misses += misses
+        finally:
+            self._stop_event = None
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            for connection in connections:
+                connection.close()
+
+        result = self._build_result(
+            problem, fitness_history, elite_archive, generation, elapsed_seconds, config.local_search_elites > 0)
+        result.cache_hits = cache_hits
+        result.cache_misses = cache_misses
+        result.phase_seconds = dict(instrumentation.phase_totals)
+
+        for observer in self.observers:
+            observer.on_finish(result)
+
+        return result
+
+    @staticmethod
+    def _receive(connection):
+        status, payload = connection.recv()
+        if status == "error":
+            raise RuntimeError(f"Falha em uma ilha:\n{payload}")
+        return payload
@@ -0,0 +1,220 @@
+from typing import Dict, List, Tuple
+
+from config import LOCAL_SEARCH_NEIGHBORS
+from distance_matrix import DEPOT_INDEX, DistanceMatrix
+from models import Delivery
+
+# Maior sequência de entregas consecutivas movida pelo Or-opt
+OR_OPT_MAX_CHAIN = 3
+# Ganho mínimo para aceitar um movimento (evita ciclos por arredondamento)
+_MIN_GAIN = 1e-9
+# Grupos fictícios do depósito no início e no fim da rota (antes/depois de todas as prioridades)
+_START_GROUP = 0
+_END_GROUP = 1_000
+
+
+def _two_opt_pass(nodes: List[int], groups: List[int], rows: List[List[float]], neighbors: List[List[int]]) -> float:
+    """Uma varredura de 2-opt por listas de vizinhos; aplica os movimentos que melhoram.
+
+    `nodes` é a rota em índices da matriz com o depósito nas duas pontas. Só
+    inverte trechos inteiramente dentro de um mesmo grupo de prioridade, então a
+    ordem entre os grupos é preservada. Retorna a variação total da distância.
+    """
+    position = {node: index for index, node in enumerate(nodes[1:-1], 1)}
+    last = len(nodes) - 2
+    total_delta = 0.0
+
+    for i in range(last + 1):
+        a = nodes[i]
+
+        # Arestas (a, sucessor de a) e (c, sucessor de c) viram (a, c) e (sucessores)
+        b = nodes[i + 1]
+        d_ab = rows[a][b]
+        for c in neighbors[a]:
+            d_ac = rows[a][c]
+            if d_ac >= d_ab:
+                break
+            j = position.get(c)
+            if j is None or j <= i + 1 or groups[i + 1] != groups[j]:
+                continue
+            d = nodes[j + 1]
+            delta = d_ac + rows[b][d] - d_ab - rows[c][d]
+            if delta < -_MIN_GAIN:
+                nodes[i + 1:j + 1] = nodes[i + 1:j + 1][::-1]
+                for k in range(i + 1, j + 1):
+                    position[nodes[k]] = k
+                total_delta += delta
+                b = nodes[i + 1]
+                d_ab = rows[a][b]
+
+        if i == 0:
+            continue
+
+        # Arestas (predecessor de c, c) e (predecessor de a, a) viram (predecessores) e (c, a)
+        a = nodes[i]
+        pa = nodes[i - 1]
+        d_paa = rows[pa][a]
+        for c in neighbors[a]:
+            d_ac = rows[a][c]
+            if d_ac >= d_paa:
+                break
+            j = position.get(c)
+            if j is None or j >= i - 1 or groups[j] != groups[i - 1]:
+                continue
+            pc = nodes[j - 1]
+            delta = rows[pc][pa] + d_ac - rows[pc][c] - d_paa
+            if delta < -_MIN_GAIN:
+                nodes[j:i] = nodes[j:i][::-1]
+                for k in range(j, i):
+                    position[nodes[k]] = k
+                total_delta += delta
+                pa = nodes[i - 1]
+                d_paa = rows[pa][a]
+
+    return total_delta
+
+
+def _best_insertion(
+    nodes: List[int],
+    groups: List[int],
+    position: Dict[int, int],
+    rows: List[List[float]],
+    neighbors: List[List[int]],
+    start: int,
+    length: int,
+    removal_gain: float,
+) -> Tuple[float, int, bool]:
+    """Melhor aresta (u, v) próxima da sequência para reinseri-la (Or-opt).
+
+    Retorna (custo de inserção, posição de u, inverter?) ou custo infinito.
+    """
+    first, last = nodes[start], nodes[start + length - 1]
+    group = groups[start]
+    best = (float("inf"), -1, False)
+
+    for anchor in (first, last):
+        for c in neighbors[anchor]:
+            if rows[anchor][c] >= removal_gain:
+                break
+            t = position.get(c)
+            if t is None:
+                continue
+
+            # Arestas que tocam c: (predecessor, c) e (c, sucessor)
+            for u_position in (t - 1, t):
+                if start - 1 <= u_position <= start + length - 1:
+                    continue
+                if not groups[u_position] <= group <= groups[u_position + 1]:
+                    continue
+
+                u, v = nodes[u_position], nodes[u_position + 1]
+                d_uv = rows[u][v]
+                forward = rows[u][first] + rows[last][v] - d_uv
+                backward = rows[u][last] + rows[first][v] - d_uv
+                if forward < best[0]:
+                    best = (forward, u_position, False)
+                if backward < best[0]:
+                    best = (backward, u_position, True)
+
+    return best
+
+
+def _or_opt_pass(nodes: List[int], groups: List[int], rows: List[List[float]], neighbors: List[List[int]]) -> float:
+    """Uma varredura de Or-opt: move sequências de 1 a 3 entregas do mesmo grupo.
+
+    A sequência pode ser reinserida invertida, sempre em uma posição em que a
+    ordem dos grupos de prioridade continua válida.
+    """
+    position = {node: index for index, node in enumerate(nodes[1:-1], 1)}
+    total_delta = 0.0
+    start = 1
+
+    while start < len(nodes) - 1:
+        moved = False
+
+        for length in range(1, OR_OPT_MAX_CHAIN + 1):
+            end = start + length - 1
+            if end > len(nodes) - 2 or groups[start] != groups[end]:
+                break
+
+            previous, following = nodes[start - 1], nodes[end + 1]
+            removal_gain = rows[previous][nodes[start]] + rows[nodes[end]][following] - rows[previous][following]
+            if removal_gain <= _MIN_GAIN:
+                continue
+
+            insertion_cost, u_position, reverse = _best_insertion(
+                nodes, groups, position, rows, neighbors, start, length, removal_gain)
+            delta = insertion_cost - removal_gain
+            if delta >= -_MIN_GAIN:
+                continue
+
+            chain = nodes[start:end + 1]
+            chain_groups = groups[start:end + 1]
+            if reverse:
+                chain.reverse()
+            del nodes[start:end + 1]
+            del groups[start:end + 1]
+
+            insert_at = u_position + 1 if u_position < start else u_position + 1 - length
+            nodes[insert_at:insert_at] = chain
+            groups[insert_at:insert_at] = chain_groups
+            # Só mudam de posição as entregas entre a origem e o destino da sequência
+            for k in range(min(start, insert_at), max(end, insert_at + length - 1) + 1):
+                position[nodes[k]] = k
+            total_delta += delta
+            moved = True
+            break
+
+        if not moved:
+            start += 1
+
+    return total_delta
+
+
+def improve_route(
+    route: List[Delivery],
+    distance_matrix: DistanceMatrix,
+    neighbor_count: int = LOCAL_SEARCH_NEIGHBORS,
+) -> Tuple[List[Delivery], float]:
+    """Aplica 2-opt e Or-opt até não haver melhora e retorna (rota, variação da distância).
+
+    Os movimentos respeitam os grupos de prioridade da rota (as entregas de
+    maior prioridade continuam antes das demais) e são avaliados pela diferença
+    das arestas trocadas, em O(1) pela tabela de distâncias. Só são testados
+    movimentos que criam arestas para os `neighbor_count` vizinhos mais próximos.
+    """
+    if len(route) < 3:
+        return list(route), 0.0
+
+    by_index = {distance_matrix.index(delivery.id): delivery for delivery in route}
+    nodes = [DEPOT_INDEX, *by_index, DEPOT_INDEX]
+    groups = [_START_GROUP, *(delivery.priority.value for delivery in route), _END_GROUP]
+    rows = distance_matrix.rows
+    neighbors = distance_matrix.neighbors(neighbor_count)
+
+    total_delta = 0.0
+    while True:
+        delta = _two_opt_pass(nodes, groups, rows, neighbors)
+        delta += _or_opt_pass(nodes, groups, rows, neighbors)
+        total_delta += delta
+        if delta >= -_MIN_GAIN:
+            break
+
+    return [by_index[node] for node in nodes[1:-1]], total_delta
+
+
+def improve_routes(
+    vehicle_routes: List[List[Delivery]],
+    distance_matrix: DistanceMatrix,
+    neighbor_count: int = LOCAL_SEARCH_NEIGHBORS,
+) -> Tuple[List[List[Delivery]], float]:
+    """Aplica improve_route a cada veículo; retorna as rotas e a variação total."""
+    improved_routes = []
+    total_delta = 0.0
+
+    for route in vehicle_routes:
+        improved, delta = improve_route(route, distance_matrix, neighbor_count)
+        improved_routes.append(improved)
+        total_delta += delta
+
+    return improved_routes, total_delta
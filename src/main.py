@@ -1,36 +1,38 @@
+import argparse
+import contextlib
+import csv
 import os
-import random
-import time
+import signal
+from typing import List
 
 import numpy as np
 import pygame
-import csv
 
-from cities import generate_deliveries, generate_vehicle_capacities, generate_vehicle_max_deliveries
+from checkpoint import CheckpointWriter, load_checkpoint
+from cities import generate_problem
 from config import (
-    FLEET_CAPACITY_MARGIN,
-    FPS,
+    CHECKPOINT_INTERVAL_SECONDS,
+    DEPOT_LOCATION,
+    LOCAL_SEARCH_ELITES,
     HEIGHT,
-    MUTATION_PROBABILITY,
     N_CITIES,
     NODE_RADIUS,
     NUM_VEHICLES,
-    POPULATION_SIZE,
     TIME_LIMIT_SECONDS,
     WHITE,
     WIDTH,
 )
-from genetic_operators import order_crossover, sort_population, swap_mutation
-from models import Priority
-from population import (
-    calculate_fitness_multi_vehicle,
-    calculate_route_distance,
-    create_initial_population_deliveries,
-    split_deliveries_by_vehicle,
-)
-from visualization import draw_deliveries, draw_depot, draw_legend, draw_multiple_routes, draw_plot
+from island_model import IslandConfig, IslandModel
+from metrics_exporters import JsonlMetricsExporter, PrometheusMetricsExporter
+from models import Delivery, Priority
+from population import calculate_route_distance
+from problem import VRPProblem
+from solver import ConsoleReporter, GeneticVRP, SolverConfig, SolverResult, decode_routes
+from visualization import ConvergencePlot, PygameRenderer, draw_deliveries, draw_depot, draw_legend, draw_multiple_routes
+from warm_start import load_warm_start_genomes, warm_start_genomes
 
-DEPOT_LOCATION = (500, HEIGHT // 2)
+# Pixels extras adicionados abaixo do mapa nas imagens salvas para colocar a legenda
+SAVE_EXTRA_HEIGHT = 120
 
 
 def get_inputs_via_pygame(defaults):
@@ -142,218 +144,137 @@ def get_inputs_via_pygame(defaults):
         clock.tick(30)
 
 
-# Abre a janela de input e recebe valores (usar defaults definidos em config)
-n_cities, num_vehicles, time_limit_seconds = get_inputs_via_pygame(
-    (N_CITIES, NUM_VEHICLES, TIME_LIMIT_SECONDS))
-
-deliveries = generate_deliveries(num_deliveries=n_cities)
-print(f"Entregas geradas: {len(deliveries)}")
-
-total_weight = sum(d.weight for d in deliveries)
-
-vehicle_capacities = generate_vehicle_capacities(
-    total_weight, num_vehicles, FLEET_CAPACITY_MARGIN)
-total_capacity = sum(vehicle_capacities)
-
-vehicle_max_deliveries = generate_vehicle_max_deliveries(
-    n_cities, num_vehicles)
-
-print(f"\nVeículos disponíveis: {num_vehicles}")
-for i, (capacity, max_deliveries) in enumerate(zip(vehicle_capacities, vehicle_max_deliveries, strict=False), 1):
-    print(f"  V{i}: Capacidade = {capacity:.1f}kg, Máx. Entregas = {max_deliveries}")
-
-# Estatísticas das entregas
-priority_counts = dict.fromkeys(Priority, 0)
-for delivery in deliveries:
-    priority_counts[delivery.priority] += 1
-
-print("\nDistribuição de prioridades:")
-for priority, count in priority_counts.items():
-    print(f"  {priority.name}: {count} entregas")
-
-print(f"\nPeso total dos medicamentos: {total_weight:.2f}kg")
-print(f"Capacidade total da frota: {total_capacity:.2f}kg")
-print(
-    f"Margem de segurança: {total_capacity - total_weight:.2f}kg ({((total_capacity / total_weight - 1) * 100):.1f}%)"
-)
-
-# Inicializa Pygame
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("VRP Solver - Algoritmo Genético com Prioridades")
-clock = pygame.time.Clock()
-
-# Cria população inicial
-population = create_initial_population_deliveries(deliveries, POPULATION_SIZE)
-best_fitness_values = []
-best_solutions = []
-generation = 0
-
-print(f"\nPopulação inicial criada: {POPULATION_SIZE} indivíduos")
-print("Iniciando evolução...\n")
-
+def build_problem(n_cities: int, num_vehicles: int, seed: int | None = None) -> VRPProblem:
+    """Gera uma instância aleatória com entregas, capacidades e limites por veículo.
 
-start_time = time.time()
-while (time.time() - start_time) < time_limit_seconds:
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_q:
-            running = False
-
-    generation += 1
+    Com `seed`, a mesma semente gera sempre a mesma instância.
+    """
+    problem = generate_problem(n_cities, num_vehicles, seed, DEPOT_LOCATION)
+    print(f"Entregas geradas: {problem.num_deliveries}")
+    return problem
 
-    screen.fill(WHITE)
 
-    population_fitness = [
-        calculate_fitness_multi_vehicle(
-            individual, num_vehicles, DEPOT_LOCATION, vehicle_capacities, vehicle_max_deliveries
-        )
-        for individual in population
-    ]
+def print_problem_summary(problem: VRPProblem) -> None:
+    total_weight = sum(d.weight for d in problem.deliveries)
+    total_capacity = sum(problem.vehicle_capacities)
 
-    population, population_fitness = sort_population(
-        population, population_fitness)
+    print(f"\nVeículos disponíveis: {problem.num_vehicles}")
+    for i, (capacity, max_deliveries) in enumerate(zip(problem.vehicle_capacities, problem.vehicle_max_deliveries, strict=False), 1):
+        print(f"  V{i}: Capacidade = {capacity:.1f}kg, Máx. Entregas = {max_deliveries}")
 
-    best_fitness = population_fitness[0]
-    best_solution = population[0]
-    best_fitness_values.append(best_fitness)
-    best_solutions.append(best_solution)
+    # Estatísticas das entregas
+    priority_counts = dict.fromkeys(Priority, 0)
+    for delivery in problem.deliveries:
+        priority_counts[delivery.priority] += 1
 
-    draw_plot(screen, list(range(1, len(best_fitness_values) + 1)),
-              best_fitness_values)
+    print("\nDistribuição de prioridades:")
+    for priority, count in priority_counts.items():
+        print(f"  {priority.name}: {count} entregas")
 
-    best_routes = split_deliveries_by_vehicle(
-        best_solution, num_vehicles, DEPOT_LOCATION, vehicle_capacities, vehicle_max_deliveries
+    print(f"\nPeso total dos medicamentos: {total_weight:.2f}kg")
+    print(f"Capacidade total da frota: {total_capacity:.2f}kg")
+    print(
+        f"Margem de segurança: {total_capacity - total_weight:.2f}kg ({((total_capacity / total_weight - 1) * 100):.1f}%)"
     )
 
-    draw_deliveries(screen, deliveries, NODE_RADIUS)
 
-    draw_depot(screen, DEPOT_LOCATION, NODE_RADIUS)
+def print_best_solution(problem: VRPProblem, result: SolverResult) -> None:
+    print("\n" + "=" * 60)
+    print("MELHOR SOLUÇÃO ENCONTRADA")
+    print("=" * 60)
+    print(f"Fitness: {result.best_fitness:.2f}")
+    print(f"Total de gerações: {result.generations}")
+    lookups = result.cache_hits + result.cache_misses
+    print(
+        f"Cache de fitness: {result.cache_hits} acertos, {result.cache_misses} faltas "
+        f"({(result.cache_hits / lookups if lookups else 0.0) * 100:.1f}%)"
+    )
 
-    draw_multiple_routes(screen, best_routes, DEPOT_LOCATION)
+    total_phase_seconds = sum(result.phase_seconds.values())
+    if total_phase_seconds > 0:
+        print("Tempo por fase: " + ", ".join(
+            f"{phase} {seconds:.2f}s ({seconds / total_phase_seconds * 100:.0f}%)"
+            for phase, seconds in result.phase_seconds.items()
+        ))
 
-    stats_lines = []
-    for vehicle_id, route in enumerate(best_routes, 1):
+    # Analisa cada veículo
+    print("\nRotas por veículo:")
+    for vehicle_id, route in enumerate(result.best_routes, 1):
         route_load = sum(d.weight for d in route)
-        route_distance = calculate_route_distance(route, DEPOT_LOCATION)
-
-        # Capacidade específica deste veículo
-        vehicle_capacity = vehicle_capacities[vehicle_id - 1]
-        max_deliveries = vehicle_max_deliveries[vehicle_id - 1]
-
-        overload = max(0, route_load - vehicle_capacity)
-        exceed_deliveries = max(0, len(route) - max_deliveries)
-
-        vehicle_stats = (
-            f"V{vehicle_id}: {len(route)}/{max_deliveries} entregas, {round(route_load, 1)}kg/{round(vehicle_capacity, 1)}kg, "
-            f"{round(route_distance, 0)}dist"
-        )
-        stats_lines.append(vehicle_stats)
-
-    print(f"Geração {generation}: Fitness = {round(best_fitness, 2)} | " +
-          " | ".join(stats_lines))
-
-    new_population = [population[0]]  # Elitismo
+        route_distance = calculate_route_distance(route, problem.depot, problem.distance_matrix)
+        vehicle_capacity = problem.vehicle_capacities[vehicle_id - 1]
+        max_deliveries = problem.vehicle_max_deliveries[vehicle_id - 1]
 
-    while len(new_population) < POPULATION_SIZE:
-        # Seleção: probabilidade inversamente proporcional ao fitness
-        probability = 1 / np.array(population_fitness)
-        parent1, parent2 = random.choices(population, weights=probability, k=2)
+        print(f"\nVeículo {vehicle_id}:")
+        print(f"  Capacidade do veículo: {vehicle_capacity:.2f}kg")
+        print(f"  Entregas: {len(route)} / {max_deliveries}")
+        print(f"  Carga: {route_load:.2f}kg / {vehicle_capacity:.2f}kg")
+        print(f"  Distância: {route_distance:.0f}")
 
-        # Crossover
-        child = order_crossover(parent1, parent2)
+        if route:
+            print("  Primeiras entregas:")
+            for i, delivery in enumerate(route[:5], 1):
+                print(
+                    f"    {i}. Prioridade {delivery.priority.name} - {delivery.weight}kg")
 
-        # Mutação
-        child = swap_mutation(child, MUTATION_PROBABILITY)
 
-        new_population.append(child)
+def write_solution_csv(csv_path: str, rank: int, fitness: float, vehicle_routes: List[List[Delivery]], problem: VRPProblem, genome: np.ndarray) -> None:
+    """Escreve um CSV com as rotas de uma solução (um arquivo por solução).
 
-    population = new_population
-
-    pygame.display.flip()
-    clock.tick(FPS)
-
-
-pygame.quit()
-
-best_route = best_solutions[best_fitness_values.index(
-    min(best_fitness_values))]
-best_vehicle_routes = split_deliveries_by_vehicle(
-    best_route, num_vehicles, DEPOT_LOCATION, vehicle_capacities, vehicle_max_deliveries
-)
-
-print("\n" + "=" * 60)
-print("MELHOR SOLUÇÃO ENCONTRADA")
-print("=" * 60)
-print(f"Fitness: {min(best_fitness_values):.2f}")
-print(f"Total de gerações: {generation}")
-
-# Analisa cada veículo
-print("\nRotas por veículo:")
-for vehicle_id, route in enumerate(best_vehicle_routes, 1):
-    route_load = sum(d.weight for d in route)
-    route_distance = calculate_route_distance(route, DEPOT_LOCATION)
-    vehicle_capacity = vehicle_capacities[vehicle_id - 1]
-    max_deliveries = vehicle_max_deliveries[vehicle_id - 1]
-
-    print(f"\nVeículo {vehicle_id}:")
-    print(f"  Capacidade do veículo: {vehicle_capacity:.2f}kg")
-    print(f"  Entregas: {len(route)} / {max_deliveries}")
-    print(f"  Carga: {route_load:.2f}kg / {vehicle_capacity:.2f}kg")
-    print(f"  Distância: {route_distance:.0f}")
-
-    if route:
-        print("  Primeiras entregas:")
-        for i, delivery in enumerate(route[:5], 1):
-            print(
-                f"    {i}. Prioridade {delivery.priority.name} - {delivery.weight}kg")
-
-
-print("\n" + "=" * 60)
-print("SALVANDO TOP 5 MELHORES SOLUÇÕES")
-print("=" * 60)
-
-images_dir = os.path.join(os.path.dirname(__file__), "images")
-os.makedirs(images_dir, exist_ok=True)
-
-# Pixels extras adicionados abaixo do mapa nas imagens salvas para colocar a legenda
-SAVE_EXTRA_HEIGHT = 120
-
-# Encontra soluções únicas removendo duplicatas
-unique_solutions = []
-seen_solutions = set()
-
-for fitness, solution in zip(best_fitness_values, best_solutions, strict=False):
-    solution_tuple = tuple(d.id for d in solution)  # Usa IDs das entregas
-    if solution_tuple not in seen_solutions:
-        seen_solutions.add(solution_tuple)
-        unique_solutions.append((fitness, solution))
-
-# Ordena por fitness e pega as 5 melhores únicas
-unique_solutions.sort(key=lambda x: x[0])
-top_5_solutions = unique_solutions[:5]
+    A coluna GenomeIDs repete em cada linha o genoma que gerou as rotas; é ela
+    que o warm start lê, porque concatenar as rotas não reproduz a solução (a
+    decodificação redistribui as entregas entre os veículos).
+    """
+    with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.writer(csvfile)
+        # Cabeçalho
+        writer.writerow([
+            "SolutionRank",
+            "Fitness",
+            "VehicleID",
+            "DeliveryIDs",
+            "NumDeliveries",
+            "TotalWeight",
+            "Distance",
+            "Priorities",
+            "GenomeIDs",
+        ])
+
+        genome_ids = ";".join(str(delivery_id) for delivery_id in genome.tolist())
+
+        for vid, route in enumerate(vehicle_routes, 1):
+            delivery_ids = ";".join(str(d.id) for d in route)
+            num_deliveries = len(route)
+            total_w = round(sum(d.weight for d in route), 2)
+            try:
+                dist = calculate_route_distance(route, problem.depot, problem.distance_matrix)
+            except Exception:
+                dist = 0
+            priorities = ";".join(d.priority.name for d in route)
 
-print(f"Soluções únicas encontradas: {len(unique_solutions)}")
-print(f"Salvando as {len(top_5_solutions)} melhores\n")
+            writer.writerow([
+                rank,
+                f"{fitness:.2f}",
+                vid,
+                delivery_ids,
+                num_deliveries,
+                f"{total_w:.2f}",
+                dist,
+                priorities,
+                genome_ids,
+            ])
 
-# Reinicializa pygame para renderizar as imagens
-pygame.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
 
-for rank, (fitness, solution) in enumerate(top_5_solutions, 1):
+def save_solution_image(filepath: str, rank: int, fitness: float, vehicle_routes: List[List[Delivery]], problem: VRPProblem, result: SolverResult, screen: pygame.Surface, plot: ConvergencePlot) -> None:
+    """Mostra a solução na tela e salva a imagem com legenda abaixo do mapa."""
     # Atualiza o display para visualização
     screen.fill(WHITE)
 
-    # Divide entregas entre veículos
-    vehicle_routes = split_deliveries_by_vehicle(
-        solution, num_vehicles, DEPOT_LOCATION, vehicle_capacities, vehicle_max_deliveries
-    )
-
     # Desenha no display (tela)
-    draw_plot(screen, list(range(1, len(best_fitness_values) + 1)),
-              best_fitness_values)
-    draw_deliveries(screen, deliveries, NODE_RADIUS)
-    draw_depot(screen, DEPOT_LOCATION, NODE_RADIUS)
-    draw_multiple_routes(screen, vehicle_routes, DEPOT_LOCATION)
+    plot.draw(screen, result.fitness_history)
+    draw_deliveries(screen, problem.deliveries, NODE_RADIUS)
+    draw_depot(screen, problem.depot, NODE_RADIUS)
+    draw_multiple_routes(screen, vehicle_routes, problem.depot)
     # Não desenhar a legenda na tela durante a execução interativa.
     # A legenda será adicionada somente nas imagens salvas (save_surface).
 
@@ -370,15 +291,14 @@ for rank, (fitness, solution) in enumerate(top_5_solutions, 1):
     save_surface.fill(WHITE)
 
     # Desenha o mapa/rotas na parte superior da imagem salva
-    draw_plot(save_surface, list(
-        range(1, len(best_fitness_values) + 1)), best_fitness_values)
-    draw_deliveries(save_surface, deliveries, NODE_RADIUS)
-    draw_depot(save_surface, DEPOT_LOCATION, NODE_RADIUS)
-    draw_multiple_routes(save_surface, vehicle_routes, DEPOT_LOCATION)
+    plot.draw(save_surface, result.fitness_history)
+    draw_deliveries(save_surface, problem.deliveries, NODE_RADIUS)
+    draw_depot(save_surface, problem.depot, NODE_RADIUS)
+    draw_multiple_routes(save_surface, vehicle_routes, problem.depot)
 
     # Desenha a legenda deslocada para a área extra (abaixo do mapa)
     legend_y = HEIGHT + 10
-    draw_legend(save_surface, x=20, y=legend_y, num_vehicles=num_vehicles)
+    draw_legend(save_surface, x=20, y=legend_y, num_vehicles=problem.num_vehicles)
 
     # Adiciona título na imagem salva
     font2 = pygame.font.Font(None, 28)
@@ -386,52 +306,146 @@ for rank, (fitness, solution) in enumerate(top_5_solutions, 1):
         f"Top {rank} - Fitness: {fitness:.2f}", True, (0, 0, 0))
     save_surface.blit(title_text2, (10, 10))
 
-    filename = f"top_{rank}.png"
-    filepath = os.path.join(images_dir, filename)
     pygame.image.save(save_surface, filepath)
 
-    print(f"✓ Salva: {filename} - Fitness: {fitness:.2f}")
-
-    # Escreve um CSV com as rotas desta solução (um arquivo por imagem)
-    csv_filename = f"top_{rank}.csv"
-    csv_path = os.path.join(images_dir, csv_filename)
-
-    try:
-        with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.writer(csvfile)
-            # Cabeçalho
-            writer.writerow([
-                "SolutionRank",
-                "Fitness",
-                "VehicleID",
-                "DeliveryIDs",
-                "NumDeliveries",
-                "TotalWeight",
-                "Distance",
-                "Priorities",
-            ])
 
-            for vid, route in enumerate(vehicle_routes, 1):
-                delivery_ids = ";".join(str(d.id) for d in route)
-                num_deliveries = len(route)
-                total_w = round(sum(d.weight for d in route), 2)
-                try:
-                    dist = calculate_route_distance(route, DEPOT_LOCATION)
-                except Exception:
-                    dist = 0
-                priorities = ";".join(d.priority.name for d in route)
-
-                writer.writerow([
-                    rank,
-                    f"{fitness:.2f}",
-                    vid,
-                    delivery_ids,
-                    num_deliveries,
-                    f"{total_w:.2f}",
-                    dist,
-                    priorities,
-                ])
-    except Exception as e:
-        print(f"Aviso: não foi possível salvar CSV {csv_filename}: {e}")
-
-pygame.quit()
+def save_top_solutions(problem: VRPProblem, result: SolverResult, images_dir: str, with_images: bool = True, improve: bool = False) -> None:
+    print("\n" + "=" * 60)
+    print("SALVANDO TOP 5 MELHORES SOLUÇÕES")
+    print("=" * 60)
+
+    os.makedirs(images_dir, exist_ok=True)
+
+    # Melhores genomas distintos, mantidos pelo arquivo de elite durante a execução
+    top_5_solutions = result.elite_archive.top(5)
+    print(f"Salvando as {len(top_5_solutions)} melhores\n")
+
+    if with_images:
+        # Reinicializa pygame para renderizar as imagens
+        pygame.init()
+        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        plot = ConvergencePlot()
+
+    for rank, (fitness, solution) in enumerate(top_5_solutions, 1):
+        # Divide entregas entre veículos
+        vehicle_routes = decode_routes(problem, solution, improve)
+
+        if with_images:
+            filename = f"top_{rank}.png"
+            save_solution_image(os.path.join(images_dir, filename), rank, fitness, vehicle_routes, problem, result, screen, plot)
+            print(f"✓ Salva: {filename} - Fitness: {fitness:.2f}")
+
+        # Escreve um CSV com as rotas desta solução (um arquivo por imagem)
+        csv_filename = f"top_{rank}.csv"
+        try:
+            write_solution_csv(os.path.join(images_dir, csv_filename), rank, fitness, vehicle_routes, problem, solution)
+        except Exception as e:
+            print(f"Aviso: não foi possível salvar CSV {csv_filename}: {e}")
+
+    if with_images:
+        plot.close()
+        pygame.quit()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="VRP com algoritmo genético e prioridades")
+    parser.add_argument("--headless", action="store_true",
+                        help="executa sem janelas Pygame (usa os valores padrão de config ou os informados)")
+    parser.add_argument("--cities", type=int, default=N_CITIES, help="número de entregas")
+    parser.add_argument("--vehicles", type=int, default=NUM_VEHICLES, help="número de veículos")
+    parser.add_argument("--time-limit", type=float, default=TIME_LIMIT_SECONDS, help="tempo de execução em segundos")
+    parser.add_argument("--seed", type=int, default=None, help="semente para reprodutibilidade (instância gerada e solver)")
+    parser.add_argument("--islands", type=int, default=1,
+                        help="número de ilhas (subpopulações em processos separados); 1 desativa o modo de ilhas")
+    parser.add_argument("--local-search", type=int, default=LOCAL_SEARCH_ELITES, metavar="N",
+                        help="refina com 2-opt/Or-opt os N melhores de cada geração (modo memético; 0 desativa)")
+    parser.add_argument("--metrics-jsonl", help="grava as métricas de cada geração (JSON Lines) neste arquivo")
+    parser.add_argument("--metrics-prom", help="mantém os totais no formato texto do Prometheus neste arquivo")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="grava o estado da execução neste arquivo .npz periodicamente e ao fim")
+    parser.add_argument("--checkpoint-interval", type=float, default=CHECKPOINT_INTERVAL_SECONDS, metavar="SECONDS",
+                        help="intervalo mínimo entre checkpoints")
+    parser.add_argument("--resume", action="store_true",
+                        help="continua a execução gravada em --checkpoint (instância e parâmetros vêm do arquivo); "
+                             "sem o arquivo, começa do zero")
+    parser.add_argument("--warm-start", nargs="+", metavar="PATH",
+                        help="semeia a população inicial com soluções anteriores: top_N.csv, diretórios com eles "
+                             "ou checkpoints .npz (entregas removidas saem e as novas entram por inserção mais barata)")
+    args = parser.parse_args()
+    if args.resume and not args.checkpoint:
+        parser.error("--resume exige --checkpoint")
+    if args.islands > 1 and args.checkpoint:
+        parser.error("--checkpoint não é suportado no modo de ilhas")
+    return args
+
+
+def stop_on_signals(solver: GeneticVRP) -> None:
+    """SIGTERM/SIGINT encerram a execução ao fim da geração corrente, gravando o checkpoint final."""
+    def handler(signum, frame):
+        print(f"\nSinal {signal.Signals(signum).name} recebido: encerrando ao fim da geração...")
+        solver.request_stop()
+
+    signal.signal(signal.SIGTERM, handler)
+    signal.signal(signal.SIGINT, handler)
+
+
+def main() -> None:
+    args = parse_args()
+
+    resume_from = None
+    if args.resume and os.path.exists(args.checkpoint):
+        resume_from = load_checkpoint(args.checkpoint)
+        problem, config = resume_from.problem, resume_from.config
+        print(f"Retomando {args.checkpoint} na geração {resume_from.generation} "
+              f"({resume_from.elapsed_seconds:.1f}s decorridos)")
+        print_problem_summary(problem)
+    else:
+        if args.resume:
+            print(f"Checkpoint {args.checkpoint} não encontrado: começando do zero")
+        if args.headless:
+            n_cities, num_vehicles, time_limit_seconds = args.cities, args.vehicles, args.time_limit
+        else:
+            # Abre a janela de input e recebe valores (usar defaults definidos em config)
+            n_cities, num_vehicles, time_limit_seconds = get_inputs_via_pygame(
+                (args.cities, args.vehicles, args.time_limit))
+
+        problem = build_problem(n_cities, num_vehicles, args.seed)
+        print_problem_summary(problem)
+        config = SolverConfig(time_limit_seconds=time_limit_seconds, seed=args.seed, local_search_elites=args.local_search)
+
+    seed_genomes = None
+    if args.warm_start and resume_from is None:
+        seed_genomes = warm_start_genomes(problem, load_warm_start_genomes(args.warm_start), config.population_size)
+        print(f"\nWarm start: {len(seed_genomes)} soluções anteriores na população inicial")
+
+    observers = [ConsoleReporter()]
+    if not args.headless:
+        observers.append(PygameRenderer())
+    if args.metrics_jsonl:
+        observers.append(JsonlMetricsExporter(args.metrics_jsonl))
+    if args.metrics_prom:
+        observers.append(PrometheusMetricsExporter(args.metrics_prom))
+
+    print(f"\nPopulação inicial: {config.population_size} indivíduos")
+    print("Iniciando evolução...\n")
+
+    if args.islands > 1:
+        result = IslandModel(observers, IslandConfig(num_islands=args.islands)).run(problem, config, seed_genomes=seed_genomes)
+    else:
+        with contextlib.ExitStack() as stack:
+            checkpointer = None
+            if args.checkpoint:
+                checkpointer = stack.enter_context(CheckpointWriter(args.checkpoint, args.checkpoint_interval))
+            solver = GeneticVRP(observers, checkpointer)
+            if checkpointer is not None:
+                stop_on_signals(solver)
+            result = solver.run(problem, config, resume_from, seed_genomes)
+
+    print_best_solution(problem, result)
+
+    images_dir = os.path.join(os.path.dirname(__file__), "images")
+    save_top_solutions(problem, result, images_dir, with_images=not args.headless, improve=config.local_search_elites > 0)
+
+
+if __name__ == "__main__":
+    main()
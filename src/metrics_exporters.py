@@ -0,0 +1,99 @@
+import json
+import os
+from typing import Dict, TextIO
+
+from instrumentation import GenerationMetrics
+from solver import SolverObserver, SolverResult
+
+
+class JsonlMetricsExporter(SolverObserver):
+    """Grava uma linha JSON por geração com os tempos por fase e os contadores."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: TextIO | None = None
+
+    def on_start(self, solver, problem, config) -> None:
+        self._file = open(self.path, "w", encoding="utf-8")
+
+    def on_metrics(self, metrics: GenerationMetrics) -> None:
+        self._file.write(json.dumps(metrics.to_dict()) + "\n")
+        self._file.flush()
+
+    def on_finish(self, result: SolverResult) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class PrometheusMetricsExporter(SolverObserver):
+    """Mantém um arquivo no formato texto do Prometheus com os totais da execução.
+
+    O arquivo é reescrito de forma atômica (arquivo temporário + os.replace), de
+    modo que o textfile collector do node_exporter nunca leia um arquivo parcial.
+    Com `write_every` > 1 ele é reescrito só a cada tantas gerações (e no fim).
+    """
+
+    PREFIX = "vrp"
+
+    def __init__(self, path: str, write_every: int = 1):
+        self.path = path
+        self.write_every = max(1, write_every)
+        self._phase_totals: Dict[str, float] = {}
+        self._counters = {"generations": 0, "evaluations": 0, "cache_hits": 0, "cache_misses": 0}
+        self._last: GenerationMetrics | None = None
+
+    def on_start(self, solver, problem, config) -> None:
+        self._phase_totals = {}
+        self._counters = dict.fromkeys(self._counters, 0)
+        self._last = None
+
+    def on_metrics(self, metrics: GenerationMetrics) -> None:
+        for phase, seconds in metrics.phase_seconds.items():
+            self._phase_totals[phase] = self._phase_totals.get(phase, 0.0) + seconds
+        self._counters["generations"] += 1
+        self._counters["evaluations"] += metrics.evaluations
+        self._counters["cache_hits"] += metrics.cache_hits
+        self._counters["cache_misses"] += metrics.cache_misses
+        self._last = metrics
+
+        if metrics.generation % self.write_every == 0:
+            self._write()
+
+    def on_finish(self, result: SolverResult) -> None:
+        if self._last is not None:
+            self._write()
+
+    def render(self) -> str:
+        prefix = self.PREFIX
+        lines = [
+            f"# HELP {prefix}_phase_seconds_total Tempo acumulado em cada fase da geração.",
+            f"# TYPE {prefix}_phase_seconds_total counter",
+        ]
+        for phase, seconds in self._phase_totals.items():
+            lines.append(f'{prefix}_phase_seconds_total{{phase="{phase}"}} {seconds!r}')
+
+        for name, value in self._counters.items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+
+        last = self._last
+        if last is not None:
+            gauges = {
+                "generation": last.generation,
+                "best_fitness": last.best_fitness,
+                "unique_genomes": last.unique_genomes,
+                "generation_seconds": last.generation_seconds,
+                "elapsed_seconds": last.elapsed_seconds,
+            }
+            for name, value in gauges.items():
+                lines.append(f"# TYPE {prefix}_{name} gauge")
+                lines.append(f"{prefix}_{name} {value!r}")
+
+        return "\n".join(lines) + "\n"
+
+    def _write(self) -> None:
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            file.write(self.render())
+        os.replace(temporary_path, self.path)
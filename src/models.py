@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Tuple
+from typing import Iterable, Tuple
+
+import numpy as np
 
 
 class Priority(Enum):
@@ -10,9 +12,73 @@ class Priority(Enum):
     LOW = 4
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, eq=False)
 class Delivery:
+    """Entrega imutável; identidade, igualdade e hash são dados pelo `id`."""
+
     location: Tuple[int, int]
     priority: Priority
     weight: float
     id: int
+
+    def __eq__(self, other):
+        if not isinstance(other, Delivery):
+            return NotImplemented
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+
+@dataclass(frozen=True)
+class DeliveryTable:
+    """Entregas em colunas NumPy indexadas pelo id, para cálculos em lote.
+
+    `priority` guarda o valor do enum (1 = CRITICAL ... 4 = LOW). Posições sem
+    entrega (ids ausentes) ficam com zero.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    weight: np.ndarray
+    priority: np.ndarray
+
+    @classmethod
+    def from_deliveries(cls, deliveries: Iterable[Delivery]) -> "DeliveryTable":
+        deliveries = list(deliveries)
+        size = max((delivery.id for delivery in deliveries), default=-1) + 1
+        ids = np.fromiter((d.id for d in deliveries), dtype=np.int64, count=len(deliveries))
+
+        columns = {
+            "x": np.zeros(size, dtype=np.float64),
+            "y": np.zeros(size, dtype=np.float64),
+            "weight": np.zeros(size, dtype=np.float64),
+            "priority": np.zeros(size, dtype=np.int64),
+        }
+        columns["x"][ids] = [d.location[0] for d in deliveries]
+        columns["y"][ids] = [d.location[1] for d in deliveries]
+        columns["weight"][ids] = [d.weight for d in deliveries]
+        columns["priority"][ids] = [d.priority.value for d in deliveries]
+        return cls(**columns)
+
+    def with_delivery(self, delivery: Delivery) -> "DeliveryTable":
+        """Nova tabela com a entrega incluída (as colunas crescem se o id for novo), em O(n)."""
+        size = max(len(self), delivery.id + 1)
+        columns = {}
+        for name, value in (("x", delivery.location[0]), ("y", delivery.location[1]),
+                             ("weight", delivery.weight), ("priority", delivery.priority.value)):
+            column = np.zeros(size, dtype=getattr(self, name).dtype)
+            column[:len(self)] = getattr(self, name)
+            column[delivery.id] = value
+            columns[name] = column
+        return DeliveryTable(**columns)
+
+    def without_delivery(self, delivery_id: int) -> "DeliveryTable":
+        """Nova tabela com a posição da entrega zerada (id ausente), em O(n)."""
+        columns = {name: getattr(self, name).copy() for name in ("x", "y", "weight", "priority")}
+        for column in columns.values():
+            column[delivery_id] = 0
+        return DeliveryTable(**columns)
+
+    def __len__(self) -> int:
+        return len(self.weight)
@@ -1,11 +1,28 @@
+import heapq
+import math
 import random
 from typing import List, Tuple
 
+import numpy as np
+
 from config import (
     PENALTY_OVERLOAD,
     PENALTY_PRIORITY,
+    SPATIAL_INDEX_MIN_POINTS,
 )
+from distance_matrix import DEPOT_INDEX, DistanceMatrix
+from genome import GENOME_DTYPE
 from models import Delivery, Priority
+from spatial_index import GridIndex
+
+
+# Fração máxima da sequência em que cada prioridade pode aparecer sem penalidade
+# e o multiplicador de PENALTY_PRIORITY aplicado quando ela aparece depois disso.
+PRIORITY_POSITION_RULES = {
+    Priority.CRITICAL: (0.2, 3.0),
+    Priority.HIGH: (0.4, 2.0),
+    Priority.MEDIUM: (0.8, 1.0),
+}
 
 
 def create_initial_population_deliveries(deliveries: List[Delivery], population_size: int) -> List[List[Delivery]]:
@@ -13,12 +30,109 @@ def create_initial_population_deliveries(deliveries: List[Delivery], population_
     return [random.sample(deliveries, len(deliveries)) for _ in range(population_size)]
 
 
+def create_initial_population_genomes(deliveries: List[Delivery], population_size: int) -> np.ndarray:
+    """Cria população inicial como matriz (tamanho_população x n_entregas) de ids."""
+    delivery_ids = [delivery.id for delivery in deliveries]
+    population = np.empty((population_size, len(delivery_ids)), dtype=GENOME_DTYPE)
+    for row in range(population_size):
+        population[row] = random.sample(delivery_ids, len(delivery_ids))
+    return population
+
+
+def insert_delivery_cheapest(population: np.ndarray, delivery_id: int, distance_matrix: DistanceMatrix) -> np.ndarray:
+    """Insere a entrega em cada genoma na posição de inserção mais barata.
+
+    A sequência do genoma é tratada como um percurso com o depósito nas pontas;
+    o custo de inserir entre a e b é d(a, x) + d(x, b) - d(a, b), lido da matriz
+    de distâncias. Vetorizado sobre a população: O(P·n).
+    """
+    population_size, num_genes = population.shape
+    if num_genes == 0:
+        return np.full((population_size, 1), delivery_id, dtype=population.dtype)
+
+    nodes = np.full((population_size, num_genes + 2), DEPOT_INDEX, dtype=np.int64)
+    nodes[:, 1:-1] = distance_matrix.index(population)
+    previous, following = nodes[:, :-1], nodes[:, 1:]
+    node = distance_matrix.index(delivery_id)
+    matrix = distance_matrix.matrix
+    positions = (matrix[node, previous] + matrix[node, following] - matrix[previous, following]).argmin(axis=1)
+
+    # Coluna c do resultado: gene c antes da posição, a entrega nela e gene c - 1 depois
+    columns = np.arange(num_genes + 1)
+    source = np.minimum(columns - (columns > positions[:, None]), num_genes - 1)
+    result = np.take_along_axis(population, source, axis=1)
+    result[np.arange(population_size), positions] = delivery_id
+    return result
+
+
+def remove_delivery_from_genomes(population: np.ndarray, delivery_id: int) -> np.ndarray:
+    """Retira a entrega de cada genoma, preservando a ordem das demais."""
+    return population[population != delivery_id].reshape(len(population), population.shape[1] - 1)
+
+
 def calculate_distance(city1: Tuple[float, float], city2: Tuple[float, float]) -> float:
     """Calcula distância euclidiana entre duas cidades."""
-    return ((city1[0] - city2[0]) ** 2 + (city1[1] - city2[1]) ** 2) ** 0.5
+    dx = city1[0] - city2[0]
+    dy = city1[1] - city2[1]
+    # math.sqrt é exata (arredondamento IEEE) e coincide com DistanceMatrix
+    return math.sqrt(dx * dx + dy * dy)
+
 
+def _nearest_neighbor_by_matrix(route: List[Delivery], start_index: int, distance_matrix: DistanceMatrix) -> List[Delivery]:
+    """Vizinho mais próximo consultando a matriz de distâncias pré-calculada.
 
-def optimize_vehicle_route_nearest_neighbor(route: List[Delivery], depot: Tuple[int, int]) -> List[Delivery]:
+    `start_index` é a linha da matriz de onde o veículo parte (depósito ou a
+    última entrega visitada).
+    """
+    rows = distance_matrix.rows
+    current_row = rows[start_index]
+    remaining = route.copy()
+    optimized = []
+
+    while remaining:
+        nearest = min(remaining, key=lambda delivery: current_row[delivery.id + 1])
+        optimized.append(nearest)
+        current_row = rows[nearest.id + 1]
+        remaining.remove(nearest)
+
+    return optimized
+
+
+def _nearest_neighbor_by_grid(
+    route: List[Delivery],
+    start_location: Tuple[int, int],
+    start_index: int,
+    distance_matrix: DistanceMatrix | None = None,
+) -> List[Delivery]:
+    """Vizinho mais próximo apoiado numa grade espacial (GridIndex).
+
+    Produz a mesma sequência da busca linear (inclusive nos empates), mas cada
+    passo só examina as células próximas da posição atual em vez de todas as
+    entregas restantes. `start_index` é a linha da matriz equivalente a
+    `start_location`, usada quando há matriz de distâncias.
+    """
+    grid = GridIndex([delivery.location for delivery in route])
+    optimized = []
+    current_location = start_location
+    current_index = start_index
+
+    while len(grid):
+        if distance_matrix is not None:
+            current_row = distance_matrix.rows[current_index]
+            item = grid.nearest(current_location, lambda i: current_row[route[i].id + 1])
+        else:
+            item = grid.nearest(current_location, lambda i: calculate_distance(current_location, route[i].location))
+
+        grid.remove(item)
+        nearest = route[item]
+        optimized.append(nearest)
+        current_location = nearest.location
+        current_index = nearest.id + 1
+
+    return optimized
+
+
+def optimize_vehicle_route_nearest_neighbor(route: List[Delivery], depot: Tuple[int, int], distance_matrix: DistanceMatrix | None = None) -> List[Delivery]:
     """Otimiza a rota de um veículo usando a heurística do vizinho mais próximo."""
     if not route:
         return route
@@ -26,6 +140,12 @@ def optimize_vehicle_route_nearest_neighbor(route: List[Delivery], depot: Tuple[
     if len(route) == 1:
         return route
 
+    if len(route) >= SPATIAL_INDEX_MIN_POINTS:
+        return _nearest_neighbor_by_grid(route, depot, DEPOT_INDEX, distance_matrix)
+
+    if distance_matrix is not None:
+        return _nearest_neighbor_by_matrix(route, DEPOT_INDEX, distance_matrix)
+
     optimized = []
     current_position = depot
     remaining = route.copy()
@@ -44,106 +164,153 @@ def optimize_vehicle_route_nearest_neighbor(route: List[Delivery], depot: Tuple[
     return optimized
 
 
-def split_deliveries_by_vehicle(deliveries: List[Delivery], num_vehicles: int, depot: Tuple[int, int], vehicle_capacities: List[float], vehicle_max_deliveries: List[int]) -> List[List[Delivery]]:
-    sorted_deliveries = deliveries.copy()
-
-    sorted_deliveries.sort(key=lambda d: d.priority.value)
-
-    # Inicializa rotas e cargas de cada veículo
-    vehicle_routes = [[] for _ in range(num_vehicles)]
-    vehicle_loads = [0.0 for _ in range(num_vehicles)]
+def _lightest_vehicle(heap: List[Tuple[float, int, int]], versions: List[int], exclude: int | None = None) -> int | None:
+    """Veículo de menor carga (menor índice no empate) do heap, sem removê-lo.
+
+    Entradas cuja versão não é a atual do veículo estão desatualizadas e são
+    descartadas ao chegar ao topo. `exclude` é pulado e devolvido ao heap.
+    """
+    skipped = None
+    best = None
+
+    while heap:
+        _, vehicle, version = heap[0]
+        if version != versions[vehicle]:
+            heapq.heappop(heap)
+        elif vehicle == exclude:
+            skipped = heapq.heappop(heap)
+        else:
+            best = vehicle
+            break
+
+    if skipped is not None:
+        heapq.heappush(heap, skipped)
+
+    return best
+
+
+def assign_deliveries_to_vehicles(deliveries: List[Delivery], num_vehicles: int, vehicle_capacities: List[float], vehicle_max_deliveries: List[int]) -> List[List[Delivery]]:
+    """Distribui as entregas entre os veículos, ainda sem ordenar as rotas.
+
+    As entregas são percorridas em ordem de prioridade (ordenação estável):
+
+    1. havendo entregas suficientes, cada veículo com limite > 0 recebe a
+       primeira entrega que cabe na sua capacidade;
+    2. cada entrega restante vai para o veículo de menor carga com capacidade de
+       peso e de número de entregas; senão, para o de menor carga com capacidade
+       de número; senão, para o de menor carga (empates: menor índice);
+    3. veículos acima do número máximo de entregas repassam as últimas entregas
+       ao outro veículo de menor carga.
+
+    Os veículos ficam em heaps de (carga, índice, versão) com remoção
+    preguiçosa das entradas antigas, então cada escolha custa O(log V) em vez de
+    uma varredura da frota.
+    """
+    sorted_deliveries = sorted(deliveries, key=lambda d: d.priority.value)
+
+    vehicle_routes: List[List[Delivery]] = [[] for _ in range(num_vehicles)]
+    vehicle_loads = [0.0] * num_vehicles
+    versions = [0] * num_vehicles
+    # Veículos abaixo do limite de entregas e frota inteira
+    open_heap = [(0.0, vehicle, 0) for vehicle in range(num_vehicles) if vehicle_max_deliveries[vehicle] > 0]
+    fleet_heap = [(0.0, vehicle, 0) for vehicle in range(num_vehicles)]
+
+    def update(vehicle: int) -> None:
+        versions[vehicle] += 1
+        entry = (vehicle_loads[vehicle], vehicle, versions[vehicle])
+        heapq.heappush(fleet_heap, entry)
+        if len(vehicle_routes[vehicle]) < vehicle_max_deliveries[vehicle]:
+            heapq.heappush(open_heap, entry)
+
+    def add(vehicle: int, delivery: Delivery) -> None:
+        vehicle_routes[vehicle].append(delivery)
+        vehicle_loads[vehicle] += delivery.weight
+        update(vehicle)
 
     # Tenta garantir, sempre que possível, que cada veículo receba ao menos uma entrega.
     # Isso ajuda a evitar cenários onde vários veículos ficam vazios quando há entregas suficientes.
+    pending = sorted_deliveries
     if len(sorted_deliveries) >= num_vehicles:
-        # Para fairness, atribuimos as entregas de maior prioridade primeiro (lista já ordenada).
-        for i in range(num_vehicles):
-            # Procura a primeira entrega que caiba no veículo e que respeite o limite de entregas
-            assigned = False
-            for idx, delivery in enumerate(sorted_deliveries):
-                if delivery.weight <= vehicle_capacities[i] and vehicle_max_deliveries[i] > 0:
-                    vehicle_routes[i].append(delivery)
-                    vehicle_loads[i] += delivery.weight
-                    # Remove da lista de entregas pendentes
-                    sorted_deliveries.pop(idx)
-                    assigned = True
-                    break
-            # Se nenhum item coube (por limite de peso), deixamos o veículo vazio e seguimos
-            if not assigned:
+        taken = [False] * len(sorted_deliveries)
+        first_free = 0
+        for vehicle in range(num_vehicles):
+            if vehicle_max_deliveries[vehicle] <= 0:
                 continue
+            while first_free < len(sorted_deliveries) and taken[first_free]:
+                first_free += 1
+            # Primeira entrega pendente que caiba no veículo; se nenhuma couber, ele fica vazio
+            for index in range(first_free, len(sorted_deliveries)):
+                if not taken[index] and sorted_deliveries[index].weight <= vehicle_capacities[vehicle]:
+                    taken[index] = True
+                    add(vehicle, sorted_deliveries[index])
+                    break
+        pending = [delivery for delivery, was_taken in zip(sorted_deliveries, taken) if not was_taken]
 
-    for delivery in sorted_deliveries:
-        best_vehicle = None
-        min_load = float("inf")
-
-        for i in range(num_vehicles):
-            has_weight_capacity = vehicle_loads[i] + \
-                delivery.weight <= vehicle_capacities[i]
-            has_delivery_capacity = len(
-                vehicle_routes[i]) < vehicle_max_deliveries[i]
+    # Menor peso entre as entregas pendentes a partir de cada posição
+    min_weight_from = [float("inf")] * (len(pending) + 1)
+    for position in range(len(pending) - 1, -1, -1):
+        min_weight_from[position] = min(pending[position].weight, min_weight_from[position + 1])
+    # Abertos sem folga de peso nem para a entrega pendente mais leve
+    saturated_heap: List[Tuple[float, int, int]] = []
 
-            if has_weight_capacity and has_delivery_capacity and vehicle_loads[i] < min_load:
-                min_load = vehicle_loads[i]
-                best_vehicle = i
+    for position, delivery in enumerate(pending):
+        best_vehicle = None
+        lightest_open = None
+        skipped = []
+
+        # Abertos em ordem de carga: o primeiro com capacidade de peso é o escolhido
+        while open_heap:
+            entry = heapq.heappop(open_heap)
+            _, vehicle, version = entry
+            if version != versions[vehicle]:
+                continue
+            if lightest_open is None:
+                lightest_open = entry
+            if vehicle_loads[vehicle] + delivery.weight <= vehicle_capacities[vehicle]:
+                best_vehicle = vehicle
+                break
+            skipped.append(entry)
+
+        next_min_weight = min_weight_from[position + 1]
+        for entry in skipped:
+            vehicle = entry[1]
+            if vehicle_loads[vehicle] + next_min_weight > vehicle_capacities[vehicle]:
+                heapq.heappush(saturated_heap, entry)
+            else:
+                heapq.heappush(open_heap, entry)
 
         if best_vehicle is None:
-            min_load = float("inf")
-            for i in range(num_vehicles):
-                has_delivery_capacity = len(
-                    vehicle_routes[i]) < vehicle_max_deliveries[i]
-                if has_delivery_capacity and vehicle_loads[i] < min_load:
-                    min_load = vehicle_loads[i]
-                    best_vehicle = i
-
+            # Sem capacidade de peso: o mais leve entre todos os abertos
+            saturated = _lightest_vehicle(saturated_heap, versions)
+            if saturated is not None and (lightest_open is None or (vehicle_loads[saturated], saturated) < lightest_open[:2]):
+                best_vehicle = saturated
+            elif lightest_open is not None:
+                best_vehicle = lightest_open[1]
         if best_vehicle is None:
-            best_vehicle = vehicle_loads.index(min(vehicle_loads))
+            best_vehicle = _lightest_vehicle(fleet_heap, versions)
 
-        vehicle_routes[best_vehicle].append(delivery)
-        vehicle_loads[best_vehicle] += delivery.weight
+        add(best_vehicle, delivery)
 
-    # Redistribui entregas excedentes (que excedem o NÚMERO máximo de entregas)
-    for vehicle_id in range(num_vehicles):
-        max_deliveries = vehicle_max_deliveries[vehicle_id]
+    # Redistribui entregas excedentes (que excedem o NÚMERO máximo de entregas).
+    # Só há excesso se a última regra da etapa 2 foi usada, ou seja, com todos os
+    # veículos no limite; como nenhum volta a ficar abaixo dele, a entrega sempre
+    # vai para o outro veículo de menor carga. Com um único veículo ela fica nele.
+    for vehicle in range(num_vehicles):
+        while len(vehicle_routes[vehicle]) > vehicle_max_deliveries[vehicle]:
+            best_other = _lightest_vehicle(fleet_heap, versions, exclude=vehicle)
+            if best_other is None:
+                break
 
-        while len(vehicle_routes[vehicle_id]) > max_deliveries:
-            excess_delivery = vehicle_routes[vehicle_id].pop()
-            vehicle_loads[vehicle_id] -= excess_delivery.weight
-            reallocated = False
+            excess_delivery = vehicle_routes[vehicle].pop()
+            vehicle_loads[vehicle] -= excess_delivery.weight
+            update(vehicle)
+            add(best_other, excess_delivery)
 
-            for other_id in range(num_vehicles):
-                if other_id == vehicle_id:
-                    continue
+    return vehicle_routes
 
-                has_weight_capacity = vehicle_loads[other_id] + \
-                    excess_delivery.weight <= vehicle_capacities[other_id]
-                has_delivery_capacity = len(
-                    vehicle_routes[other_id]) < vehicle_max_deliveries[other_id]
 
-                if has_weight_capacity and has_delivery_capacity:
-                    vehicle_routes[other_id].append(excess_delivery)
-                    vehicle_loads[other_id] += excess_delivery.weight
-                    reallocated = True
-                    break
-
-            if not reallocated:
-                for other_id in range(num_vehicles):
-                    if other_id == vehicle_id:
-                        continue
-
-                    has_delivery_capacity = len(
-                        vehicle_routes[other_id]) < vehicle_max_deliveries[other_id]
-
-                    if has_delivery_capacity:
-                        vehicle_routes[other_id].append(excess_delivery)
-                        vehicle_loads[other_id] += excess_delivery.weight
-                        reallocated = True
-                        break
-
-            if not reallocated:
-                best_other = min((i for i in range(
-                    num_vehicles) if i != vehicle_id), key=lambda i: vehicle_loads[i])
-                vehicle_routes[best_other].append(excess_delivery)
-                vehicle_loads[best_other] += excess_delivery.weight
+def split_deliveries_by_vehicle(deliveries: List[Delivery], num_vehicles: int, depot: Tuple[int, int], vehicle_capacities: List[float], vehicle_max_deliveries: List[int], distance_matrix: DistanceMatrix | None = None) -> List[List[Delivery]]:
+    vehicle_routes = assign_deliveries_to_vehicles(deliveries, num_vehicles, vehicle_capacities, vehicle_max_deliveries)
 
     def optimize_route_respecting_priority(route: List[Delivery], depot_pos: Tuple[int, int]) -> List[Delivery]:
         """Agrupa as entregas por prioridade (CRITICAL, HIGH, MEDIUM, LOW) e aplica
@@ -164,17 +331,24 @@ def split_deliveries_by_vehicle(deliveries: List[Delivery], num_vehicles: int, d
             if not group:
                 continue
 
-            # aplica vizinho mais próximo iniciando em current_position
-            remaining = group.copy()
-            optimized_group: List[Delivery] = []
+            # Parte da última entrega do grupo anterior (ou do depósito)
+            start_index = final_route[-1].id + 1 if final_route else DEPOT_INDEX
+
+            if len(group) >= SPATIAL_INDEX_MIN_POINTS:
+                final_route.extend(_nearest_neighbor_by_grid(group, current_position, start_index, distance_matrix))
+            elif distance_matrix is not None:
+                final_route.extend(_nearest_neighbor_by_matrix(group, start_index, distance_matrix))
+            else:
+                # aplica vizinho mais próximo iniciando em current_position
+                remaining = group.copy()
 
-            while remaining:
-                nearest = min(remaining, key=lambda delivery: calculate_distance(current_position, delivery.location))
-                optimized_group.append(nearest)
-                current_position = nearest.location
-                remaining.remove(nearest)
+                while remaining:
+                    nearest = min(remaining, key=lambda delivery: calculate_distance(current_position, delivery.location))
+                    final_route.append(nearest)
+                    current_position = nearest.location
+                    remaining.remove(nearest)
 
-            final_route.extend(optimized_group)
+            current_position = final_route[-1].location
 
         return final_route
 
@@ -186,11 +360,14 @@ def split_deliveries_by_vehicle(deliveries: List[Delivery], num_vehicles: int, d
     return optimized_routes
 
 
-def calculate_route_distance(route: List[Delivery], depot: Tuple[int, int]) -> float:
+def calculate_route_distance(route: List[Delivery], depot: Tuple[int, int], distance_matrix: DistanceMatrix | None = None) -> float:
     # Se a rota estiver vazia, distância é zero
     if not route:
         return 0.0
 
+    if distance_matrix is not None:
+        return distance_matrix.route_distance(route)
+
     total = 0.0
 
     total += calculate_distance(depot, route[0].location)
@@ -203,37 +380,43 @@ def calculate_route_distance(route: List[Delivery], depot: Tuple[int, int]) -> f
     return total
 
 
-def calculate_fitness_multi_vehicle(deliveries: List[Delivery], num_vehicles: int, depot: Tuple[int, int], vehicle_capacities: List[float], vehicle_max_deliveries: List[int]) -> float:
+def calculate_priority_penalty(deliveries: List[Delivery]) -> float:
+    """Penaliza entregas prioritárias que aparecem tarde na sequência do indivíduo.
+
+    Calculada numa única passada: a posição global de cada entrega é o próprio
+    índice na enumeração, sem buscas na lista.
+    """
+    total_deliveries = len(deliveries)
+    penalty = 0.0
+
+    for global_position, delivery in enumerate(deliveries):
+        rule = PRIORITY_POSITION_RULES.get(delivery.priority)
+        if rule is not None and global_position > total_deliveries * rule[0]:
+            penalty += PENALTY_PRIORITY * rule[1]
+
+    return penalty
+
+
+def calculate_fitness_multi_vehicle(deliveries: List[Delivery], num_vehicles: int, depot: Tuple[int, int], vehicle_capacities: List[float], vehicle_max_deliveries: List[int], distance_matrix: DistanceMatrix | None = None) -> float:
     if not deliveries:
         return float("inf")
 
     vehicle_routes = split_deliveries_by_vehicle(
-        deliveries, num_vehicles, depot, vehicle_capacities, vehicle_max_deliveries
+        deliveries, num_vehicles, depot, vehicle_capacities, vehicle_max_deliveries, distance_matrix
     )
 
     total_distance = 0.0
-    priority_penalty = 0.0
+    # Penaliza prioridades mal posicionadas (depende só da ordem do indivíduo)
+    priority_penalty = calculate_priority_penalty(deliveries)
     capacity_penalty = 0.0
 
     for vehicle_id, route in enumerate(vehicle_routes):
         if not route:
             continue
 
-        route_distance = calculate_route_distance(route, depot)
+        route_distance = calculate_route_distance(route, depot, distance_matrix)
         total_distance += route_distance
 
-        # Penaliza prioridades mal posicionadas
-        for delivery in route:
-            global_position = deliveries.index(delivery)
-            total_deliveries = len(deliveries)
-
-            if delivery.priority == Priority.CRITICAL and global_position > total_deliveries * 0.2:
-                priority_penalty += PENALTY_PRIORITY * 3.0
-            elif delivery.priority == Priority.HIGH and global_position > total_deliveries * 0.4:
-                priority_penalty += PENALTY_PRIORITY * 2.0
-            elif delivery.priority == Priority.MEDIUM and global_position > total_deliveries * 0.8:
-                priority_penalty += PENALTY_PRIORITY * 1.0
-
         route_load = sum(d.weight for d in route)
         vehicle_capacity = vehicle_capacities[vehicle_id]
 
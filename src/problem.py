@@ -0,0 +1,161 @@
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, List, Tuple
+
+from config import DELIVERY_ID_SLACK
+from distance_matrix import DistanceMatrix
+from genome import build_delivery_lookup
+from models import Delivery, DeliveryTable, Priority
+
+
+@dataclass
+class VRPProblem:
+    """Dados de uma instância do VRP: entregas, frota e depósito.
+
+    As estruturas derivadas (matriz de distâncias, tabela id -> entrega e
+    DeliveryTable) são construídas sob demanda e não são serializadas: um
+    processo que recebe o problema (ex.: worker de um pool) reconstrói a
+    própria cópia uma única vez.
+    """
+
+    deliveries: List[Delivery]
+    num_vehicles: int
+    depot: Tuple[int, int]
+    vehicle_capacities: List[float]
+    vehicle_max_deliveries: List[int]
+    # Maior id já aceito; continua valendo depois de cancelamentos (ver max_delivery_id)
+    max_id: int = -1
+
+    def __post_init__(self):
+        self.max_id = max([self.max_id, *(delivery.id for delivery in self.deliveries)])
+
+    @cached_property
+    def distance_matrix(self) -> DistanceMatrix:
+        return DistanceMatrix(self.depot, self.deliveries)
+
+    @cached_property
+    def delivery_lookup(self) -> Dict[int, Delivery]:
+        return build_delivery_lookup(self.deliveries)
+
+    @cached_property
+    def delivery_table(self) -> DeliveryTable:
+        return DeliveryTable.from_deliveries(self.deliveries)
+
+    @property
+    def num_deliveries(self) -> int:
+        return len(self.deliveries)
+
+    def add_delivery(self, delivery: Delivery) -> None:
+        """Inclui uma entrega com id inédito, atualizando em O(n) as estruturas
+        derivadas já construídas em vez de reconstruí-las."""
+        if delivery.id in self.delivery_lookup:
+            raise ValueError(f"Id de entrega já em uso: {delivery.id}")
+        check_delivery_id(delivery.id, len(self.deliveries) + 1, self.max_id)
+
+        self.deliveries.append(delivery)
+        self.max_id = max(self.max_id, delivery.id)
+        self.delivery_lookup[delivery.id] = delivery
+        if "distance_matrix" in self.__dict__:
+            self.distance_matrix.add_delivery(delivery)
+        if "delivery_table" in self.__dict__:
+            self.delivery_table = self.delivery_table.with_delivery(delivery)
+
+    def remove_delivery(self, delivery_id: int) -> Delivery:
+        """Remove a entrega e devolve-a. O id passa a ser um buraco nas tabelas
+        indexadas pelo id (a linha da matriz de distâncias fica sem uso)."""
+        delivery = self.delivery_lookup.pop(delivery_id, None)
+        if delivery is None:
+            raise ValueError(f"Entrega desconhecida: {delivery_id}")
+
+        self.deliveries.remove(delivery)
+        if "distance_matrix" in self.__dict__:
+            self.distance_matrix.remove_delivery(delivery_id)
+        if "delivery_table" in self.__dict__:
+            self.delivery_table = self.delivery_table.without_delivery(delivery_id)
+        return delivery
+
+    def to_dict(self) -> dict:
+        """Representação em JSON da instância (prioridades pelo nome)."""
+        return {
+            "depot": list(self.depot),
+            "deliveries": [
+                {"id": d.id, "location": list(d.location), "priority": d.priority.name, "weight": d.weight}
+                for d in self.deliveries
+            ],
+            "vehicle_capacities": list(self.vehicle_capacities),
+            "vehicle_max_deliveries": list(self.vehicle_max_deliveries),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, max_id: int = -1) -> "VRPProblem":
+        """Inverso de to_dict; o número de veículos é o tamanho de vehicle_capacities.
+
+        A prioridade aceita o nome ("HIGH") ou o valor (2). Os ids das entregas
+        devem ser distintos e estar no intervalo de check_delivery_id; eles
+        indexam a matriz de distâncias, então buracos (ex.: entregas canceladas)
+        são aceitos, mas ocupam espaço. `max_id` é o VRPProblem.max_id de uma
+        instância gravada pelo próprio solver (checkpoint), que pode ter ids
+        acima do limite calculado só pelo número de entregas.
+        """
+        try:
+            deliveries = [delivery_from_dict(item) for item in data["deliveries"]]
+            capacities = [float(capacity) for capacity in data["vehicle_capacities"]]
+            max_deliveries = [int(limit) for limit in data["vehicle_max_deliveries"]]
+            depot = tuple(data["depot"])
+        except KeyError as exc:
+            raise ValueError(f"Campo obrigatório ausente: {exc.args[0]!r}") from None
+
+        if len(capacities) != len(max_deliveries) or not capacities:
+            raise ValueError("vehicle_capacities e vehicle_max_deliveries devem ter o mesmo tamanho (ao menos um veículo)")
+        ids = [d.id for d in deliveries]
+        if len(set(ids)) != len(ids):
+            raise ValueError("Os ids das entregas devem ser distintos")
+        for delivery_id in ids:
+            check_delivery_id(delivery_id, len(ids), max_id)
+
+        return cls(deliveries, len(capacities), depot, capacities, max_deliveries, max_id)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # cached_property guarda os valores no __dict__: descarta-os antes de serializar
+        state.pop("distance_matrix", None)
+        state.pop("delivery_lookup", None)
+        state.pop("delivery_table", None)
+        return state
+
+
+def max_delivery_id(num_deliveries: int, max_id: int = -1) -> int:
+    """Maior id aceito numa instância com `num_deliveries` entregas.
+
+    A matriz de distâncias tem uma linha por id possível, então um id enorme
+    (ex.: vindo de um cliente do serviço) alocaria uma matriz enorme. O limite
+    deixa espaço para buracos sem deixar a matriz passar de cerca de 4x a densa.
+    `max_id` (o maior id já aceito pela instância) nunca fica fora: depois de
+    inserir um id alto e cancelar outras entregas, o limite não encolhe.
+    """
+    return max(2 * num_deliveries + DELIVERY_ID_SLACK, max_id)
+
+
+def check_delivery_id(delivery_id: int, num_deliveries: int, max_id: int = -1) -> None:
+    limit = max_delivery_id(num_deliveries, max_id)
+    if not 0 <= delivery_id <= limit:
+        raise ValueError(f"Id de entrega fora do intervalo 0..{limit}: {delivery_id}")
+
+
+def delivery_from_dict(item: dict) -> Delivery:
+    """Entrega no formato de VRPProblem.to_dict (prioridade pelo nome ou pelo valor)."""
+    return Delivery(
+        location=tuple(item["location"]),
+        priority=_parse_priority(item["priority"]),
+        weight=float(item["weight"]),
+        id=int(item["id"]),
+    )
+
+
+def _parse_priority(value) -> Priority:
+    if isinstance(value, str):
+        try:
+            return Priority[value.upper()]
+        except KeyError:
+            raise ValueError(f"Prioridade desconhecida: {value!r}") from None
+    return Priority(value)
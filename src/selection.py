@@ -0,0 +1,102 @@
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+from config import SELECTION_STRATEGY, TOURNAMENT_SIZE
+
+ParentIndices = Tuple[np.ndarray, np.ndarray]
+
+
+def _inverse_fitness_weights(fitness: np.ndarray) -> np.ndarray:
+    # Menor fitness é melhor: peso inversamente proporcional, como na roleta original
+    return 1.0 / np.asarray(fitness, dtype=np.float64)
+
+
+def _sample_cumulative(cumulative: np.ndarray, draws: np.ndarray) -> np.ndarray:
+    """Converte sorteios em [0, total) nos índices da distribuição acumulada."""
+    indices = np.searchsorted(cumulative, draws, side="right")
+    # Protege contra draws == total por arredondamento
+    return np.minimum(indices, len(cumulative) - 1)
+
+
+def _as_pairs(selected: np.ndarray, num_pairs: int) -> ParentIndices:
+    pairs = selected.reshape(num_pairs, 2)
+    return pairs[:, 0], pairs[:, 1]
+
+
+def proportional_selection(fitness: np.ndarray, num_pairs: int, rng: np.random.Generator) -> ParentIndices:
+    """Roleta com probabilidade inversamente proporcional ao fitness.
+
+    A distribuição acumulada é montada uma vez por geração e todos os pais são
+    sorteados de uma só vez com busca binária: O(P log P) em vez de O(P²).
+    """
+    cumulative = np.cumsum(_inverse_fitness_weights(fitness))
+    draws = rng.random(2 * num_pairs) * cumulative[-1]
+    return _as_pairs(_sample_cumulative(cumulative, draws), num_pairs)
+
+
+def tournament_selection(
+    fitness: np.ndarray,
+    num_pairs: int,
+    rng: np.random.Generator,
+    tournament_size: int = TOURNAMENT_SIZE,
+) -> ParentIndices:
+    """Torneio: cada pai é o melhor de `tournament_size` indivíduos sorteados."""
+    fitness = np.asarray(fitness)
+    contestants = rng.integers(0, len(fitness), size=(2 * num_pairs, tournament_size))
+    winners = np.argmin(fitness[contestants], axis=1)
+    selected = contestants[np.arange(len(contestants)), winners]
+    return _as_pairs(selected, num_pairs)
+
+
+def rank_selection(fitness: np.ndarray, num_pairs: int, rng: np.random.Generator) -> ParentIndices:
+    """Roleta por posição (ranking linear): o melhor tem peso P e o pior peso 1.
+
+    Independe da escala do fitness, evitando que poucos indivíduos dominem a
+    seleção quando as penalidades tornam os valores muito distantes entre si.
+    """
+    population_size = len(fitness)
+    order = np.argsort(fitness, kind="stable")
+    weights = np.empty(population_size, dtype=np.float64)
+    weights[order] = np.arange(population_size, 0, -1)
+
+    cumulative = np.cumsum(weights)
+    draws = rng.random(2 * num_pairs) * cumulative[-1]
+    return _as_pairs(_sample_cumulative(cumulative, draws), num_pairs)
+
+
+def stochastic_universal_sampling(fitness: np.ndarray, num_pairs: int, rng: np.random.Generator) -> ParentIndices:
+    """Amostragem universal estocástica com os pesos da roleta proporcional.
+
+    Usa um único sorteio e ponteiros igualmente espaçados, o que dá a cada
+    indivíduo um número de cópias próximo do esperado; os pais selecionados são
+    embaralhados antes de formar os pares.
+    """
+    num_parents = 2 * num_pairs
+    cumulative = np.cumsum(_inverse_fitness_weights(fitness))
+    step = cumulative[-1] / num_parents
+    pointers = (rng.random() + np.arange(num_parents)) * step
+
+    selected = _sample_cumulative(cumulative, pointers)
+    return _as_pairs(rng.permutation(selected), num_pairs)
+
+
+SELECTION_STRATEGIES: Dict[str, Callable[[np.ndarray, int, np.random.Generator], ParentIndices]] = {
+    "proportional": proportional_selection,
+    "tournament": tournament_selection,
+    "rank": rank_selection,
+    "sus": stochastic_universal_sampling,
+}
+
+
+def select_parents(
+    fitness: np.ndarray,
+    num_pairs: int,
+    rng: np.random.Generator,
+    strategy: str = SELECTION_STRATEGY,
+) -> ParentIndices:
+    """Sorteia `num_pairs` pares de pais (índices na população) com a estratégia dada."""
+    if strategy not in SELECTION_STRATEGIES:
+        raise ValueError(f"Estratégia de seleção desconhecida: {strategy!r}. Opções: {', '.join(SELECTION_STRATEGIES)}")
+
+    return SELECTION_STRATEGIES[strategy](fitness, num_pairs, rng)
@@ -0,0 +1,497 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+import traceback
+import uuid
+from dataclasses import dataclass, field
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+from batch_runner import load_scenario, route_summaries
+from config import (
+    MIN_DELIVERIES,
+    SERVICE_CANCEL_GRACE_SECONDS,
+    SERVICE_HOST,
+    SERVICE_MAX_FINISHED_JOBS,
+    SERVICE_MAX_JOBS,
+    SERVICE_MAX_TIME_LIMIT_SECONDS,
+    SERVICE_PORT,
+    SERVICE_PROGRESS_INTERVAL,
+)
+from models import Delivery
+from problem import VRPProblem, delivery_from_dict, max_delivery_id
+from solver import GenerationEvent, GeneticVRP, SolverConfig, SolverObserver, decode_routes
+
+FINISHED_STATUSES = ("completed", "cancelled", "failed")
+MAX_BODY_BYTES = 10 * 1024 * 1024
+_REASONS = {
+    200: "OK", 202: "Accepted", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+    413: "Payload Too Large",
+}
+# Os processos dos jobs não devem herdar os sockets abertos do servidor (com
+# "fork", um stream de eventos só fecharia quando o processo de outro job terminasse)
+_PROCESS_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn")
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _PipeReporter(SolverObserver):
+    """Observador do processo do job: envia as melhorias pelo pipe (no máximo
+    uma a cada `progress_interval` segundos) e atende aos pedidos do serviço
+    (parada, entrega inserida ou cancelada)."""
+
+    def __init__(self, connection, progress_interval: float):
+        self.connection = connection
+        self.progress_interval = progress_interval
+        self._best_fitness = float("inf")
+        self._pending: GenerationEvent | None = None
+        self._last_sent = float("-inf")
+        self._problem_changed = False
+
+    def on_start(self, solver, problem, config) -> None:
+        self.solver = solver
+        self.problem = problem
+        self.improve = config.local_search_elites > 0
+
+    def on_generation(self, event: GenerationEvent) -> None:
+        if self._problem_changed:
+            # Primeira geração da instância alterada: publica já, mesmo que o fitness tenha subido
+            self._best_fitness = float("inf")
+            self._pending = None
+            self._last_sent = float("-inf")
+            self._problem_changed = False
+
+        while self.connection.poll():
+            kind, payload = self.connection.recv()
+            if kind == "stop":
+                self.solver.request_stop()
+            elif kind == "insert":
+                self.solver.insert_delivery(payload)
+                self._problem_changed = True
+            elif kind == "cancel":
+                self.solver.cancel_delivery(payload)
+                self._problem_changed = True
+
+        if event.best_fitness < self._best_fitness:
+            self._best_fitness = event.best_fitness
+            self._pending = event
+
+        now = time.perf_counter()
+        if self._pending is not None and now - self._last_sent >= self.progress_interval:
+            pending = self._pending
+            routes = decode_routes(self.problem, pending.best_genome, self.improve)
+            self.connection.send(("progress", _solution_fields(
+                self.problem, pending.generation, pending.best_fitness, pending.elapsed_seconds, routes)))
+            self._pending = None
+            self._last_sent = now
+
+
+def _solution_fields(problem: VRPProblem, generation: int, best_fitness: float, elapsed_seconds: float, routes) -> dict:
+    return {
+        "generation": generation,
+        "best_fitness": best_fitness,
+        "elapsed_seconds": elapsed_seconds,
+        "routes": route_summaries(problem, routes),
+    }
+
+
+def _job_worker(problem: VRPProblem, config: SolverConfig, connection, progress_interval: float) -> None:
+    """Processo de um job: executa o AG e termina com ("finished", solução) ou ("error", traceback)."""
+    try:
+        result = GeneticVRP([_PipeReporter(connection, progress_interval)]).run(problem, config)
+        connection.send(("finished", _solution_fields(
+            problem, result.generations, result.best_fitness, result.elapsed_seconds, result.best_routes)))
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+    finally:
+        connection.close()
+
+
+@dataclass
+class Job:
+    """Um pedido de otimização e o último evento publicado sobre ele."""
+
+    job_id: str
+    name: str
+    problem: VRPProblem
+    config: SolverConfig
+    status: str = "queued"
+    latest: dict | None = None
+    error: str | None = None
+    cancel_requested: bool = False
+    subscribers: List[asyncio.Queue] = field(default_factory=list, repr=False)
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+    process: multiprocessing.Process | None = field(default=None, repr=False)
+    connection: object | None = field(default=None, repr=False)
+    # Id dado às entregas inseridas sem id (ids cancelados só são reaproveitados
+    # quando o próximo passaria de max_delivery_id)
+    next_delivery_id: int = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def snapshot(self) -> dict:
+        return {"job_id": self.job_id, "name": self.name, "status": self.status, "latest": self.latest, "error": self.error}
+
+
+class SolverService:
+    """Serviço HTTP local (asyncio) que resolve jobs de VRP em processos separados.
+
+    Rotas (JSON; o corpo do POST é um cenário como no batch_runner):
+
+    - POST /jobs: cria o job e responde 202 com o id, sem esperar a solução;
+    - GET /jobs e GET /jobs/{id}: estado e última solução publicada;
+    - GET /jobs/{id}/events: NDJSON com a solução mais recente e cada melhoria
+      seguinte, até o evento "finished";
+    - DELETE /jobs/{id}: cancela o job, que termina com a melhor solução até então;
+    - POST /jobs/{id}/deliveries e DELETE /jobs/{id}/deliveries/{delivery_id}:
+      insere (id opcional) ou cancela uma entrega; o processo do job aplica a
+      mudança na próxima geração e publica a solução ajustada em seguida.
+
+    No máximo `max_jobs` jobs rodam ao mesmo tempo, cada um em um processo; os
+    demais esperam na fila. O laço de eventos só lê os pipes dos processos
+    quando há mensagens (add_reader), então nunca bloqueia numa otimização.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int | None = SERVICE_MAX_JOBS,
+        max_time_limit_seconds: float = SERVICE_MAX_TIME_LIMIT_SECONDS,
+        progress_interval: float = SERVICE_PROGRESS_INTERVAL,
+    ):
+        self.max_jobs = max_jobs or os.cpu_count() or 1
+        self.max_time_limit_seconds = max_time_limit_seconds
+        self.progress_interval = progress_interval
+        self.jobs: Dict[str, Job] = {}
+        self._slots = asyncio.Semaphore(self.max_jobs)
+        self._tasks: set = set()
+        self._server: asyncio.AbstractServer | None = None
+
+    async def start(self, host: str = SERVICE_HOST, port: int = SERVICE_PORT, unix_path: str | None = None) -> asyncio.AbstractServer:
+        """Começa a aceitar conexões em host:port ou no socket Unix `unix_path`."""
+        if unix_path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, unix_path)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def close(self) -> None:
+        """Para de aceitar conexões, cancela os jobs pendentes e espera o fim deles."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for job in list(self.jobs.values()):
+            self.cancel(job)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def submit(self, data: dict) -> Job:
+        """Enfileira um job; o limite de tempo é sempre definido e limitado ao teto do serviço.
+
+        Corpos que não são um objeto JSON e instâncias com menos de
+        MIN_DELIVERIES entregas são recusados aqui, antes de ocupar um processo.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("O corpo da requisição deve ser um objeto JSON")
+        job_id = uuid.uuid4().hex
+        scenario = load_scenario(data, job_id, SolverConfig(evaluator_backend="serial"))
+        if scenario.problem.num_deliveries < MIN_DELIVERIES:
+            raise ValueError(f"A instância precisa de ao menos {MIN_DELIVERIES} entregas")
+        config = scenario.config
+        if config.time_limit_seconds is None or config.time_limit_seconds > self.max_time_limit_seconds:
+            config.time_limit_seconds = self.max_time_limit_seconds
+
+        job = Job(job_id, scenario.name, scenario.problem, config)
+        job.next_delivery_id = max((d.id for d in scenario.problem.deliveries), default=-1) + 1
+        self.jobs[job_id] = job
+        task = asyncio.create_task(self._run_job(job))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def cancel(self, job: Job) -> None:
+        if job.finished:
+            return
+
+        job.cancel_requested = True
+        if job.status == "queued":
+            self._finish(job, "cancelled")
+            return
+
+        self._send(job, "stop", None)
+        asyncio.get_running_loop().call_later(SERVICE_CANCEL_GRACE_SECONDS, self._terminate, job)
+
+    def insert_delivery(self, job: Job, data: dict) -> Delivery:
+        """Inclui uma entrega no job: direto no problema, se ele ainda está na
+        fila, ou também no processo dele, que a aplica na próxima geração."""
+        if not isinstance(data, dict):
+            raise ValueError("O corpo da requisição deve ser um objeto JSON")
+        default_id = job.next_delivery_id
+        if default_id > max_delivery_id(job.problem.num_deliveries + 1, job.problem.max_id):
+            default_id = min(set(range(default_id)) - job.problem.delivery_lookup.keys())
+        try:
+            delivery = delivery_from_dict({"id": default_id, **data})
+        except KeyError as exc:
+            raise ValueError(f"Campo obrigatório ausente: {exc.args[0]!r}") from None
+
+        job.problem.add_delivery(delivery)
+        job.next_delivery_id = max(job.next_delivery_id, delivery.id + 1)
+        self._send(job, "insert", delivery)
+        return delivery
+
+    def cancel_delivery(self, job: Job, delivery_id: int) -> None:
+        if job.problem.num_deliveries <= MIN_DELIVERIES and delivery_id in job.problem.delivery_lookup:
+            raise ValueError(f"Não é possível cancelar: a instância precisa de ao menos {MIN_DELIVERIES} entregas")
+        job.problem.remove_delivery(delivery_id)
+        self._send(job, "cancel", delivery_id)
+
+    @staticmethod
+    def _send(job: Job, kind: str, payload) -> None:
+        if job.status != "running":
+            return
+        try:
+            job.connection.send((kind, payload))
+        except OSError:
+            pass
+
+    async def _run_job(self, job: Job) -> None:
+        async with self._slots:
+            if job.finished:
+                return
+
+            parent_connection, child_connection = _PROCESS_CONTEXT.Pipe()
+            job.process = _PROCESS_CONTEXT.Process(
+                target=_job_worker,
+                args=(job.problem, job.config, child_connection, self.progress_interval),
+                daemon=True,
+            )
+            job.process.start()
+            child_connection.close()
+            job.connection = parent_connection
+            job.status = "running"
+            asyncio.get_running_loop().add_reader(parent_connection.fileno(), self._on_worker_message, job)
+
+            try:
+                await job.done.wait()
+            finally:
+                parent_connection.close()
+                await asyncio.to_thread(job.process.join, SERVICE_CANCEL_GRACE_SECONDS)
+                self._terminate(job)
+
+    @staticmethod
+    def _terminate(job: Job) -> None:
+        if job.process is not None and job.process.is_alive():
+            job.process.terminate()
+
+    def _on_worker_message(self, job: Job) -> None:
+        status_if_failed = "cancelled" if job.cancel_requested else "failed"
+        try:
+            kind, payload = job.connection.recv()
+        except (EOFError, OSError):
+            self._finish(job, status_if_failed, error="O processo do job terminou sem resultado")
+            return
+
+        if kind == "progress":
+            self._publish(job, {"event": "progress", "job_id": job.job_id, **payload})
+        elif kind == "finished":
+            self._finish(job, "cancelled" if job.cancel_requested else "completed", payload)
+        else:
+            self._finish(job, status_if_failed, error=payload)
+
+    def _publish(self, job: Job, event: dict) -> None:
+        job.latest = event
+        for queue in job.subscribers:
+            queue.put_nowait(event)
+
+    def _finish(self, job: Job, status: str, solution: dict | None = None, error: str | None = None) -> None:
+        if job.finished:
+            return
+
+        if job.connection is not None:
+            asyncio.get_running_loop().remove_reader(job.connection.fileno())
+
+        # Sem solução final (ex.: cancelado antes do fim), repete a última publicada
+        if solution is None and job.latest is not None:
+            solution = {key: value for key, value in job.latest.items() if key not in ("event", "job_id")}
+
+        job.status = status
+        job.error = None if status == "cancelled" else error
+        event = {"event": "finished", "job_id": job.job_id, "status": status, **(solution or {})}
+        if job.error is not None:
+            event["error"] = job.error
+
+        self._publish(job, event)
+        for queue in job.subscribers:
+            queue.put_nowait(None)
+        job.done.set()
+        self._forget_finished_jobs()
+
+    def _forget_finished_jobs(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - SERVICE_MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                method, path, body = await self._read_request(reader)
+                await self._route(method, path, body, writer)
+            except HttpError as exc:
+                await self._respond(writer, exc.status, {"error": str(exc)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader):
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) != 3:
+            raise HttpError(400, "Linha de requisição inválida")
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HttpError(400, "Content-Length inválido") from None
+        if length > MAX_BODY_BYTES:
+            raise HttpError(413, "Corpo da requisição grande demais")
+
+        body = await reader.readexactly(length) if length else b""
+        return request_line[0].upper(), urlsplit(request_line[1]).path, body
+
+    async def _route(self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter) -> None:
+        parts = [part for part in path.split("/") if part]
+        if not parts or parts[0] != "jobs" or len(parts) > 4:
+            raise HttpError(404, f"Rota desconhecida: {path}")
+
+        if len(parts) == 1:
+            if method == "POST":
+                try:
+                    job = self.submit(json.loads(body or b"{}"))
+                except (ValueError, TypeError) as exc:
+                    raise HttpError(400, str(exc)) from None
+                await self._respond(writer, 202, job.snapshot())
+            elif method == "GET":
+                await self._respond(writer, 200, {"jobs": [
+                    {key: value for key, value in job.snapshot().items() if key != "latest"}
+                    for job in self.jobs.values()
+                ]})
+            else:
+                raise HttpError(405, f"Método não permitido: {method}")
+            return
+
+        job = self.jobs.get(parts[1])
+        if job is None:
+            raise HttpError(404, f"Job desconhecido: {parts[1]}")
+
+        if len(parts) >= 3 and parts[2] == "deliveries":
+            await self._route_deliveries(method, job, parts[3:], body, writer)
+        elif len(parts) == 4:
+            raise HttpError(404, f"Rota desconhecida: {path}")
+        elif len(parts) == 3:
+            if parts[2] != "events":
+                raise HttpError(404, f"Rota desconhecida: {path}")
+            if method != "GET":
+                raise HttpError(405, f"Método não permitido: {method}")
+            await self._stream_events(job, writer)
+        elif method == "GET":
+            await self._respond(writer, 200, job.snapshot())
+        elif method == "DELETE":
+            self.cancel(job)
+            await self._respond(writer, 202, job.snapshot())
+        else:
+            raise HttpError(405, f"Método não permitido: {method}")
+
+    async def _route_deliveries(self, method: str, job: Job, rest: List[str], body: bytes, writer: asyncio.StreamWriter) -> None:
+        if (method, len(rest)) not in (("POST", 0), ("DELETE", 1)):
+            raise HttpError(405, f"Método não permitido: {method}")
+        if job.finished:
+            raise HttpError(409, f"O job já terminou ({job.status})")
+
+        try:
+            if method == "POST":
+                delivery_id = self.insert_delivery(job, json.loads(body or b"{}")).id
+            else:
+                delivery_id = int(rest[0])
+                self.cancel_delivery(job, delivery_id)
+        except (ValueError, TypeError) as exc:
+            raise HttpError(400, str(exc)) from None
+        await self._respond(writer, 202, {"job_id": job.job_id, "delivery_id": delivery_id, "status": job.status})
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1")
+            + body
+        )
+        await writer.drain()
+
+    @staticmethod
+    async def _stream_events(job: Job, writer: asyncio.StreamWriter) -> None:
+        """Envia um evento JSON por linha até o fim do job (resposta delimitada pelo fechamento)."""
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nCache-Control: no-cache\r\nConnection: close\r\n\r\n")
+        queue: asyncio.Queue = asyncio.Queue()
+        if job.latest is not None:
+            queue.put_nowait(job.latest)
+        if job.finished:
+            queue.put_nowait(None)
+        else:
+            job.subscribers.append(queue)
+
+        try:
+            while (event := await queue.get()) is not None:
+                writer.write(json.dumps(event).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            if queue in job.subscribers:
+                job.subscribers.remove(queue)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serviço HTTP local de otimização de rotas (VRP)")
+    parser.add_argument("--host", default=SERVICE_HOST, help="endereço TCP")
+    parser.add_argument("--port", type=int, default=SERVICE_PORT, help="porta TCP")
+    parser.add_argument("--unix", help="escuta neste socket Unix em vez de TCP")
+    parser.add_argument("--max-jobs", type=int, default=SERVICE_MAX_JOBS,
+                        help="jobs resolvidos ao mesmo tempo (padrão: número de CPUs)")
+    return parser.parse_args()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    service = SolverService(args.max_jobs)
+    server = await service.start(args.host, args.port, args.unix)
+    print(f"Serviço ouvindo em {args.unix or f'http://{args.host}:{args.port}'} ({service.max_jobs} jobs simultâneos)")
+    try:
+        await server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main() -> None:
+    try:
+        asyncio.run(serve(parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
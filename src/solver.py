@@ -0,0 +1,541 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+import numpy as np
+
+from archive import EliteArchive
+from config import (
+    ELITE_ARCHIVE_SIZE,
+    EVALUATOR_BACKEND,
+    EVALUATOR_WORKERS,
+    FITNESS_CACHE_SIZE,
+    LOCAL_SEARCH_ELITES,
+    MIN_DELIVERIES,
+    MUTATION_PROBABILITY,
+    POPULATION_SIZE,
+    SELECTION_STRATEGY,
+    TIME_LIMIT_SECONDS,
+)
+from evaluators import create_evaluator
+from fitness_cache import FitnessCache
+from genetic_operators import order_crossover_batch, random_cut_points, sort_genomes, swap_mutation
+from genome import genome_key, genome_to_deliveries
+from instrumentation import GenerationMetrics, Instrumentation
+from local_search import improve_routes
+from models import Delivery
+from population import (
+    calculate_route_distance,
+    create_initial_population_genomes,
+    insert_delivery_cheapest,
+    remove_delivery_from_genomes,
+    split_deliveries_by_vehicle,
+)
+from problem import VRPProblem, check_delivery_id
+from selection import select_parents
+
+if TYPE_CHECKING:
+    from checkpoint import CheckpointWriter
+
+
+@dataclass
+class SolverConfig:
+    """Parâmetros de execução do algoritmo genético."""
+
+    population_size: int = POPULATION_SIZE
+    mutation_probability: float = MUTATION_PROBABILITY
+    selection_strategy: str = SELECTION_STRATEGY
+    time_limit_seconds: float | None = TIME_LIMIT_SECONDS
+    max_generations: int | None = None
+    evaluator_backend: str = EVALUATOR_BACKEND
+    evaluator_workers: int | None = EVALUATOR_WORKERS
+    fitness_cache_size: int = FITNESS_CACHE_SIZE
+    local_search_elites: int = LOCAL_SEARCH_ELITES
+    elite_archive_size: int = ELITE_ARCHIVE_SIZE
+    seed: int | None = None
+
+
+@dataclass
+class GenerationEvent:
+    """Estado publicado aos observadores ao fim da avaliação de cada geração."""
+
+    generation: int
+    best_fitness: float
+    best_genome: np.ndarray
+    elapsed_seconds: float
+    fitness_history: List[float]
+    # Melhores genomas distintos até esta geração (consultável durante a execução)
+    elite_archive: EliteArchive | None = None
+
+
+@dataclass
+class SolverResult:
+    """Resultado de uma execução do solver."""
+
+    best_genome: np.ndarray
+    best_fitness: float
+    best_routes: List[List[Delivery]]
+    generations: int
+    elapsed_seconds: float
+    fitness_history: List[float] = field(default_factory=list)
+    elite_archive: EliteArchive = field(default_factory=EliteArchive)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    phase_seconds: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class SolverCheckpoint:
+    """Estado de uma execução ao fim de uma geração, suficiente para retomá-la exatamente.
+
+    `population` já está avaliada e ordenada (com `fitness`); a retomada começa
+    gerando os filhos dela. O cache de fitness da avaliação não entra: só
+    acelera e não muda nenhum valor. O cache das rotas refinadas do modo
+    memético entra, na ordem LRU, porque decide o fitness dos genomas.
+    """
+
+    problem: VRPProblem
+    config: SolverConfig
+    generation: int
+    elapsed_seconds: float
+    population: np.ndarray
+    fitness: np.ndarray
+    fitness_history: List[float]
+    # (fitness, genoma) do arquivo de elite, do melhor para o pior
+    elite_archive: List[Tuple[float, np.ndarray]]
+    # (chave do genoma, fitness refinado), do uso mais antigo para o mais recente
+    improved_fitness: List[Tuple[Tuple[int, ...], float]]
+    rng_state: dict
+    random_state: tuple
+
+
+class SolverObserver:
+    """Base para observadores do solver; sobrescreva apenas os ganchos necessários."""
+
+    def on_start(self, solver: "GeneticVRP", problem: VRPProblem, config: SolverConfig) -> None:
+        pass
+
+    def on_generation(self, event: GenerationEvent) -> None:
+        pass
+
+    def on_metrics(self, metrics: GenerationMetrics) -> None:
+        pass
+
+    def on_finish(self, result: SolverResult) -> None:
+        pass
+
+
+def breed_next_generation(
+    population: np.ndarray,
+    population_fitness: np.ndarray,
+    mutation_probability: float,
+    rng: np.random.Generator,
+    selection_strategy: str = SELECTION_STRATEGY,
+    instrumentation: Instrumentation | None = None,
+) -> np.ndarray:
+    """Gera a próxima população a partir de uma população já ordenada por fitness.
+
+    Mantém o melhor indivíduo (elitismo), sorteia todos os pares de pais de uma
+    vez com a estratégia de seleção configurada, cruza os pares com OX1 e aplica
+    a mutação.
+    """
+    instrumentation = instrumentation or Instrumentation()
+    population_size, num_genes = population.shape
+    num_children = population_size - 1
+
+    with instrumentation.phase("select"):
+        # Seleção: distribuição montada uma vez por geração para todos os pares
+        parents1, parents2 = select_parents(population_fitness, num_children, rng, selection_strategy)
+
+    with instrumentation.phase("crossover"):
+        # Crossover de toda a geração de uma vez
+        start_indices, end_indices = random_cut_points(num_children, num_genes, rng)
+        children = order_crossover_batch(population[parents1], population[parents2], start_indices, end_indices)
+
+    with instrumentation.phase("mutate"):
+        new_population = np.empty_like(population)
+        new_population[0] = population[0]  # Elitismo
+
+        for child_index, child in enumerate(children, 1):
+            # Mutação
+            new_population[child_index] = swap_mutation(child, mutation_probability)
+
+    return new_population
+
+
+def improve_elites(
+    problem: VRPProblem,
+    population: np.ndarray,
+    population_fitness: np.ndarray,
+    elite_count: int,
+    improved_cache: FitnessCache,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Modo memético: refina com busca local as rotas dos melhores indivíduos.
+
+    O genoma só define a divisão entre veículos (a ordem das rotas vem do
+    vizinho mais próximo), então a melhoria não é escrita de volta nele: o
+    indivíduo passa a valer o fitness das rotas refinadas (aprendizado
+    baldwiniano). Genomas já refinados são lembrados em `improved_cache` e
+    recuperam o valor refinado em qualquer posição da população. Retorna a
+    população reordenada e o novo vetor de fitness.
+    """
+    population_fitness = population_fitness.copy()
+    for row, genome in enumerate(population):
+        improved = improved_cache.get(genome_key(genome))
+        if improved is not None:
+            population_fitness[row] = improved
+    population, population_fitness = sort_genomes(population, population_fitness)
+
+    for row in range(min(elite_count, len(population))):
+        key = genome_key(population[row])
+        if key in improved_cache:
+            continue
+        _, delta = improve_routes(decode_routes(problem, population[row]), problem.distance_matrix)
+        population_fitness[row] += delta
+        improved_cache.put(key, float(population_fitness[row]))
+
+    return sort_genomes(population, population_fitness)
+
+
+class GeneticVRP:
+    """Motor do algoritmo genético para o VRP, sem dependência de interface gráfica.
+
+    A visualização, o console e qualquer outro acompanhamento são observadores
+    (SolverObserver) notificados a cada geração. Com um `checkpointer`, o estado
+    da execução é gravado periodicamente e ao fim (ver checkpoint.py).
+    """
+
+    def __init__(self, observers: List[SolverObserver] | None = None, checkpointer: "CheckpointWriter | None" = None):
+        self.observers: List[SolverObserver] = list(observers or [])
+        self.checkpointer = checkpointer
+        self.instrumentation = Instrumentation()
+        self.elite_archive = EliteArchive()
+        self._stop_requested = False
+        # Inserções/cancelamentos pedidos durante a execução, aplicados na virada da geração
+        self._changes_lock = threading.Lock()
+        self._pending_changes: List[Tuple[str, Delivery | int]] = []
+        self._planned_ids: set | None = None
+        self._max_id = -1
+
+    def add_observer(self, observer: SolverObserver) -> None:
+        self.observers.append(observer)
+
+    def request_stop(self) -> None:
+        """Pede o encerramento da execução ao fim da geração corrente."""
+        self._stop_requested = True
+
+    def insert_delivery(self, delivery: Delivery) -> None:
+        """Insere uma entrega na execução em andamento (replanejamento online).
+
+        Pode ser chamado de outra thread ou de um observador; a mudança vale a
+        partir da próxima geração. O problema e a matriz de distâncias ganham só
+        a linha da nova entrega, cada indivíduo (e cada genoma do arquivo de
+        elite) a recebe na posição de inserção mais barata e os caches de
+        fitness são esvaziados.
+        """
+        with self._changes_lock:
+            if self._planned_ids is None:
+                raise RuntimeError("Nenhuma execução em andamento")
+            if delivery.id in self._planned_ids:
+                raise ValueError(f"Id de entrega já em uso: {delivery.id}")
+            check_delivery_id(delivery.id, len(self._planned_ids) + 1, self._max_id)
+            self._planned_ids.add(delivery.id)
+            self._max_id = max(self._max_id, delivery.id)
+            self._pending_changes.append(("insert", delivery))
+
+    def cancel_delivery(self, delivery_id: int) -> None:
+        """Cancela uma entrega da execução em andamento; como em insert_delivery,
+        vale a partir da próxima geração, com a entrega retirada de cada indivíduo."""
+        with self._changes_lock:
+            if self._planned_ids is None:
+                raise RuntimeError("Nenhuma execução em andamento")
+            if delivery_id not in self._planned_ids:
+                raise ValueError(f"Entrega desconhecida: {delivery_id}")
+            if len(self._planned_ids) <= MIN_DELIVERIES:
+                raise ValueError(f"Não é possível cancelar: a instância precisa de ao menos {MIN_DELIVERIES} entregas")
+            self._planned_ids.discard(delivery_id)
+            self._pending_changes.append(("cancel", delivery_id))
+
+    def _take_changes(self) -> List[Tuple[str, Delivery | int]]:
+        with self._changes_lock:
+            changes, self._pending_changes = self._pending_changes, []
+        return changes
+
+    @staticmethod
+    def _apply_changes(
+        problem: VRPProblem, changes: List[Tuple[str, Delivery | int]], *populations: np.ndarray
+    ) -> List[np.ndarray]:
+        """Aplica as inserções e cancelamentos ao problema e às matrizes de genomas."""
+        populations = list(populations)
+        for kind, change in changes:
+            if kind == "insert":
+                problem.add_delivery(change)
+                populations = [insert_delivery_cheapest(genomes, change.id, problem.distance_matrix) for genomes in populations]
+            else:
+                problem.remove_delivery(change)
+                populations = [remove_delivery_from_genomes(genomes, change) for genomes in populations]
+        return populations
+
+    def _should_continue(self, generation: int, start_time: float, config: SolverConfig) -> bool:
+        if self._stop_requested:
+            return False
+        if config.max_generations is not None and generation >= config.max_generations:
+            return False
+        if config.time_limit_seconds is not None and time.perf_counter() - start_time >= config.time_limit_seconds:
+            return False
+        return True
+
+    def run(
+        self,
+        problem: VRPProblem,
+        config: SolverConfig | None = None,
+        resume_from: SolverCheckpoint | None = None,
+        seed_genomes: np.ndarray | None = None,
+    ) -> SolverResult:
+        """Executa o AG sobre `problem` até o limite de tempo/gerações ou parada.
+
+        Com `resume_from`, continua a execução gravada no checkpoint (mesma
+        população, históricos, arquivo de elite, estados dos geradores
+        aleatórios e tempo já decorrido) em vez de começar do zero.
+        `seed_genomes` (ver warm_start.py) ocupa as primeiras linhas da
+        população inicial; o restante continua aleatório.
+        """
+        config = config or SolverConfig()
+        self._stop_requested = False
+        with self._changes_lock:
+            self._pending_changes = []
+            self._planned_ids = set(problem.delivery_lookup)
+            self._max_id = problem.max_id
+
+        if config.seed is not None:
+            random.seed(config.seed)
+        rng = np.random.default_rng(config.seed)
+
+        for observer in self.observers:
+            observer.on_start(self, problem, config)
+
+        self.instrumentation = instrumentation = Instrumentation()
+        fitness_cache = FitnessCache(config.fitness_cache_size)
+        improved_cache = FitnessCache(config.fitness_cache_size)
+        self.elite_archive = elite_archive = EliteArchive(config.elite_archive_size)
+
+        if resume_from is None:
+            population = create_initial_population_genomes(problem.deliveries, config.population_size)
+            if seed_genomes is not None and len(seed_genomes):
+                if seed_genomes.shape[1] != problem.num_deliveries:
+                    raise ValueError("Os genomas iniciais não correspondem ao problema: número de entregas diferente")
+                seeds = seed_genomes[:config.population_size]
+                population[:len(seeds)] = seeds
+            population_fitness = None
+            fitness_history: List[float] = []
+            generation = 0
+            elapsed_offset = 0.0
+        else:
+            if resume_from.population.shape[1] != problem.num_deliveries:
+                raise ValueError("O checkpoint não corresponde ao problema: número de entregas diferente")
+            population = resume_from.population.copy()
+            population_fitness = resume_from.fitness.copy()
+            fitness_history = list(resume_from.fitness_history)
+            generation = resume_from.generation
+            elapsed_offset = resume_from.elapsed_seconds
+            for fitness, genome in resume_from.elite_archive:
+                elite_archive.add(fitness, genome)
+            for key, fitness in resume_from.improved_fitness:
+                improved_cache.put(key, fitness)
+            rng.bit_generator.state = resume_from.rng_state
+            random.setstate(resume_from.random_state)
+
+        with create_evaluator(config.evaluator_backend, problem, config.evaluator_workers, fitness_cache) as evaluator:
+            start_time = time.perf_counter() - elapsed_offset
+
+            while self._should_continue(generation, start_time, config):
+                generation += 1
+
+                changes = self._take_changes()
+                if changes:
+                    with instrumentation.phase("replan"):
+                        archived = np.array([genome for _, genome in elite_archive.top()], dtype=population.dtype)
+                        population, archived = self._apply_changes(
+                            problem, changes, population, archived.reshape(len(archived), population.shape[1]))
+                        evaluator.problem_changed()
+                        improved_cache.clear()
+                        # O arquivo de elite passa a valer para a nova instância
+                        self.elite_archive = elite_archive = EliteArchive(config.elite_archive_size)
+                        for fitness, genome in zip(evaluator.evaluate(archived).tolist(), archived, strict=True):
+                            elite_archive.add(fitness, genome)
+                    # A população ajustada é avaliada como está, sem cruzamento nesta geração
+                    population_fitness = None
+
+                evaluations, cache_hits, cache_misses = evaluator.evaluations, fitness_cache.hits, fitness_cache.misses
+
+                # Os filhos são gerados no início da geração seguinte: a população
+                # avaliada ao fim de cada geração é a que vai para o checkpoint
+                if population_fitness is not None:
+                    population = breed_next_generation(
+                        population, population_fitness, config.mutation_probability, rng,
+                        config.selection_strategy, instrumentation)
+
+                with instrumentation.phase("evaluate"):
+                    population_fitness = evaluator.evaluate(population)
+                with instrumentation.phase("sort"):
+                    population, population_fitness = sort_genomes(population, population_fitness)
+                if config.local_search_elites > 0:
+                    with instrumentation.phase("local_search"):
+                        population, population_fitness = improve_elites(
+                            problem, population, population_fitness, config.local_search_elites, improved_cache)
+                unique_genomes = len({genome.tobytes() for genome in population})
+
+                best_fitness = float(population_fitness[0])
+                fitness_history.append(best_fitness)
+                elite_archive.add(best_fitness, population[0])
+
+                event = GenerationEvent(
+                    generation=generation,
+                    best_fitness=best_fitness,
+                    best_genome=population[0].copy(),
+                    elapsed_seconds=time.perf_counter() - start_time,
+                    fitness_history=fitness_history,
+                    elite_archive=elite_archive,
+                )
+                with instrumentation.phase("render"):
+                    for observer in self.observers:
+                        observer.on_generation(event)
+
+                metrics = instrumentation.finish_generation(
+                    generation=generation,
+                    elapsed_seconds=time.perf_counter() - start_time,
+                    best_fitness=best_fitness,
+                    evaluations=evaluator.evaluations - evaluations,
+                    cache_hits=fitness_cache.hits - cache_hits,
+                    cache_misses=fitness_cache.misses - cache_misses,
+                    unique_genomes=unique_genomes,
+                )
+                for observer in self.observers:
+                    observer.on_metrics(metrics)
+
+                if self.checkpointer is not None and self.checkpointer.due():
+                    self.checkpointer.submit(self._checkpoint(
+                        problem, config, generation, time.perf_counter() - start_time, population,
+                        population_fitness, fitness_history, elite_archive, improved_cache, rng))
+
+            elapsed_seconds = time.perf_counter() - start_time
+
+        with self._changes_lock:
+            self._planned_ids = None
+
+        if self.checkpointer is not None and population_fitness is not None:
+            # Checkpoint final: permite retomar após uma parada pedida (ex.: SIGTERM)
+            self.checkpointer.submit(self._checkpoint(
+                problem, config, generation, elapsed_seconds, population,
+                population_fitness, fitness_history, elite_archive, improved_cache, rng))
+            self.checkpointer.flush()
+
+        result = self._build_result(
+            problem, fitness_history, elite_archive, generation, elapsed_seconds, config.local_search_elites > 0)
+        result.cache_hits = fitness_cache.hits
+        result.cache_misses = fitness_cache.misses
+        result.phase_seconds = dict(instrumentation.phase_totals)
+
+        for observer in self.observers:
+            observer.on_finish(result)
+
+        return result
+
+    @staticmethod
+    def _checkpoint(
+        problem: VRPProblem,
+        config: SolverConfig,
+        generation: int,
+        elapsed_seconds: float,
+        population: np.ndarray,
+        population_fitness: np.ndarray,
+        fitness_history: List[float],
+        elite_archive: EliteArchive,
+        improved_cache: FitnessCache,
+        rng: np.random.Generator,
+    ) -> SolverCheckpoint:
+        """Copia o estado da execução; a gravação em disco fica com o checkpointer."""
+        return SolverCheckpoint(
+            # Cópia rasa: inserções/cancelamentos seguintes não alteram o checkpoint em gravação
+            problem=replace(problem, deliveries=list(problem.deliveries)),
+            config=config,
+            generation=generation,
+            elapsed_seconds=elapsed_seconds,
+            population=population.copy(),
+            fitness=population_fitness.copy(),
+            fitness_history=list(fitness_history),
+            elite_archive=elite_archive.top(),
+            improved_fitness=improved_cache.items(),
+            rng_state=rng.bit_generator.state,
+            random_state=random.getstate(),
+        )
+
+    @staticmethod
+    def _build_result(
+        problem: VRPProblem,
+        fitness_history: List[float],
+        elite_archive: EliteArchive,
+        generations: int,
+        elapsed_seconds: float,
+        improve: bool = False,
+    ) -> SolverResult:
+        if not fitness_history:
+            raise RuntimeError("Nenhuma geração foi executada: aumente o limite de tempo ou de gerações")
+
+        best_fitness, best_genome = elite_archive.best()
+
+        return SolverResult(
+            best_genome=best_genome,
+            best_fitness=best_fitness,
+            best_routes=decode_routes(problem, best_genome, improve),
+            generations=generations,
+            elapsed_seconds=elapsed_seconds,
+            fitness_history=fitness_history,
+            elite_archive=elite_archive,
+        )
+
+
+def decode_routes(problem: VRPProblem, genome: np.ndarray, improve: bool = False) -> List[List[Delivery]]:
+    """Converte um genoma nas rotas de cada veículo.
+
+    Com `improve`, as rotas passam pela busca local (2-opt/Or-opt), como no
+    modo memético.
+    """
+    vehicle_routes = split_deliveries_by_vehicle(
+        genome_to_deliveries(genome, problem.delivery_lookup),
+        problem.num_vehicles,
+        problem.depot,
+        problem.vehicle_capacities,
+        problem.vehicle_max_deliveries,
+        problem.distance_matrix,
+    )
+    if improve:
+        vehicle_routes, _ = improve_routes(vehicle_routes, problem.distance_matrix)
+    return vehicle_routes
+
+
+class ConsoleReporter(SolverObserver):
+    """Imprime uma linha por geração com o fitness e o resumo de cada veículo."""
+
+    def on_start(self, solver: "GeneticVRP", problem: VRPProblem, config: SolverConfig) -> None:
+        self.problem = problem
+        self.improve = config.local_search_elites > 0
+
+    def on_generation(self, event: GenerationEvent) -> None:
+        problem = self.problem
+        stats_lines = []
+
+        for vehicle_id, route in enumerate(decode_routes(problem, event.best_genome, self.improve)):
+            route_load = sum(d.weight for d in route)
+            route_distance = calculate_route_distance(route, problem.depot, problem.distance_matrix)
+            vehicle_capacity = problem.vehicle_capacities[vehicle_id]
+            max_deliveries = problem.vehicle_max_deliveries[vehicle_id]
+
+            stats_lines.append(
+                f"V{vehicle_id + 1}: {len(route)}/{max_deliveries} entregas, "
+                f"{round(route_load, 1)}kg/{round(vehicle_capacity, 1)}kg, {round(route_distance, 0)}dist"
+            )
+
+        print(f"Geração {event.generation}: Fitness = {round(event.best_fitness, 2)} | " + " | ".join(stats_lines))
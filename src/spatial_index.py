@@ -0,0 +1,118 @@
+import math
+from typing import Callable, Dict, List, Tuple
+
+# Quantidade média de pontos por célula usada para dimensionar a grade
+_POINTS_PER_CELL = 2.0
+# Folga relativa no critério de parada, protegendo contra arredondamento do sqrt
+_BOUND_TOLERANCE = 1e-9
+
+
+class GridIndex:
+    """Grade uniforme de buckets para consultas de vizinho mais próximo com remoção.
+
+    Os itens são identificados pelo índice na lista de pontos recebida. A busca
+    percorre anéis de células ao redor da consulta e para assim que nenhum ponto
+    ainda não visitado pode estar mais perto que o melhor encontrado. Empates de
+    distância são resolvidos pelo menor índice, o mesmo critério do ``min()``
+    sobre a lista original, então as rotas geradas são idênticas às da busca linear.
+    """
+
+    def __init__(self, points: List[Tuple[float, float]], cell_size: float | None = None):
+        self._points = points
+        self._alive = len(points)
+
+        if not points:
+            self._min_x = self._min_y = 0.0
+            self._cell_size = 1.0
+            self._max_cell_x = self._max_cell_y = 0
+            self._cells: Dict[Tuple[int, int], List[int]] = {}
+            self._cell_of: List[Tuple[int, int]] = []
+            return
+
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        self._min_x, self._min_y = min(xs), min(ys)
+        width, height = max(xs) - self._min_x, max(ys) - self._min_y
+
+        if cell_size is None:
+            area = max(width, 1.0) * max(height, 1.0)
+            cell_size = math.sqrt(area * _POINTS_PER_CELL / len(points))
+        self._cell_size = max(cell_size, 1e-9)
+
+        self._cells = {}
+        self._cell_of = []
+        for item, point in enumerate(points):
+            cell = self._cell(point)
+            self._cell_of.append(cell)
+            # Itens entram em ordem crescente de índice dentro de cada célula
+            self._cells.setdefault(cell, []).append(item)
+
+        # Limites tirados das próprias células (mesmo arredondamento de _cell)
+        self._max_cell_x = max(cell[0] for cell in self._cell_of)
+        self._max_cell_y = max(cell[1] for cell in self._cell_of)
+
+    def __len__(self) -> int:
+        return self._alive
+
+    def _cell(self, point: Tuple[float, float]) -> Tuple[int, int]:
+        return (
+            math.floor((point[0] - self._min_x) / self._cell_size),
+            math.floor((point[1] - self._min_y) / self._cell_size),
+        )
+
+    def remove(self, item: int) -> None:
+        """Remove um item da grade (ele deixa de ser retornado por nearest)."""
+        self._cells[self._cell_of[item]].remove(item)
+        self._alive -= 1
+
+    def _ring(self, center_x: int, center_y: int, radius: int):
+        """Células existentes a exatamente `radius` células (Chebyshev) do centro."""
+        if radius == 0:
+            yield (center_x, center_y)
+            return
+
+        low_x, high_x = max(center_x - radius, 0), min(center_x + radius, self._max_cell_x)
+        for y in (center_y - radius, center_y + radius):
+            if 0 <= y <= self._max_cell_y:
+                for x in range(low_x, high_x + 1):
+                    yield (x, y)
+
+        low_y, high_y = max(center_y - radius + 1, 0), min(center_y + radius - 1, self._max_cell_y)
+        for x in (center_x - radius, center_x + radius):
+            if 0 <= x <= self._max_cell_x:
+                for y in range(low_y, high_y + 1):
+                    yield (x, y)
+
+    def nearest(self, query: Tuple[float, float], distance_to: Callable[[int], float]) -> int:
+        """Retorna o item mais próximo de `query` (ou -1 se a grade estiver vazia).
+
+        `distance_to(item)` deve devolver a distância da consulta ao item; assim a
+        comparação usa exatamente os mesmos valores da busca linear (matriz
+        pré-calculada ou calculate_distance).
+        """
+        if self._alive == 0:
+            return -1
+
+        center_x, center_y = self._cell(query)
+        max_radius = max(
+            abs(center_x), abs(self._max_cell_x - center_x),
+            abs(center_y), abs(self._max_cell_y - center_y),
+        )
+
+        best_item = -1
+        best_distance = math.inf
+        cells = self._cells
+
+        for radius in range(max_radius + 1):
+            for cell in self._ring(center_x, center_y, radius):
+                for item in cells.get(cell, ()):
+                    distance = distance_to(item)
+                    if distance < best_distance or (distance == best_distance and item < best_item):
+                        best_distance = distance
+                        best_item = item
+
+            # Pontos fora dos anéis já visitados estão a pelo menos radius células
+            if best_item >= 0 and best_distance < radius * self._cell_size * (1 - _BOUND_TOLERANCE):
+                break
+
+        return best_item
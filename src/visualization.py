@@ -7,8 +7,9 @@ import pygame
 from matplotlib.backends.backend_agg import FigureCanvasAgg
 
 import math
-from config import GREEN, PRIORITY_COLORS, RED, VEHICLE_COLORS
+from config import FPS, GREEN, HEIGHT, NODE_RADIUS, PLOT_MAX_POINTS, PRIORITY_COLORS, RED, VEHICLE_COLORS, WHITE, WIDTH
 from models import Delivery, Priority
+from solver import GenerationEvent, SolverObserver, decode_routes
 
 matplotlib.use("Agg")
 
@@ -21,69 +22,104 @@ def draw_deliveries(screen: pygame.Surface, deliveries: List[Delivery], radius:
         pygame.draw.circle(screen, color, delivery.location, radius)
 
 
-def draw_plot(
-    screen: pygame.Surface,
-    x_values: List[int],
-    y_values: List[float],
-    x_label: str = "Geração",
-    y_label: str = "Distância (px)",
-    save_path: str | None = None,
-):
-    if len(y_values) < 2:
-        return
-
-    # Cria figura do matplotlib
-    fig, ax = plt.subplots(figsize=(4.5, 4), dpi=100)
-    ax.plot(x_values, y_values, color="#1f77b4", linewidth=2)
-    ax.set_xlabel(x_label)
-    ax.set_ylabel(y_label)
-    # Ajusta título com padding para criar margem entre o título e o gráfico
-    ax.set_title("Evolução do Fitness", pad=14)
-    ax.grid(True, alpha=0.3)
-    # Usa tight_layout com um padding maior para evitar cortes
-    plt.tight_layout(pad=2.0)
-
-    # Salva a figura em arquivo se solicitado (antes de extrair dados do canvas)
-    if save_path:
-        try:
-            fig.savefig(save_path, dpi=100)
-        except Exception:
-            # não falha a execução se o salvamento não funcionar
-            pass
+def downsample_series(y_values: List[float], max_points: int = PLOT_MAX_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduz uma série a no máximo `max_points` pontos para o gráfico.
 
-    # Converte matplotlib para pygame surface
-    canvas = FigureCanvasAgg(fig)
-    canvas.draw()
+    Retorna (x, y) com x começando em 1 (número da geração). Os pontos são
+    escolhidos em intervalos regulares e o primeiro e o último são sempre
+    mantidos, então o início e o valor atual da curva não se perdem.
+    """
+    y = np.asarray(y_values, dtype=np.float64)
+    count = len(y)
 
-    width, height = canvas.get_width_height()
+    if count <= max_points:
+        return np.arange(1, count + 1), y
 
-    # Obtém dados RGB do canvas
-    raw_data = None
-    if hasattr(canvas, "tostring_rgb"):
-        try:
-            raw_data = canvas.tostring_rgb()
-        except Exception:
-            raw_data = None
+    indices = np.unique(np.linspace(0, count - 1, max_points).round().astype(np.int64))
+    return indices + 1, y[indices]
 
-    if raw_data is None and hasattr(canvas, "buffer_rgba"):
-        buf = canvas.buffer_rgba()
-        arr = np.frombuffer(buf, dtype=np.uint8)
-        try:
-            arr = arr.reshape((height, width, 4))
-        except Exception:
-            arr = arr.reshape((width, height, 4)).transpose((1, 0, 2))
 
-        arr = arr[:, :, :3]
-        raw_data = arr.tobytes()
+class ConvergencePlot:
+    """Gráfico de evolução do fitness que reutiliza uma única figura matplotlib.
+
+    A figura, os eixos e a linha são criados uma vez e o histórico é amostrado
+    para no máximo `max_points` pontos. Os limites dos eixos crescem com folga:
+    enquanto a curva cabe neles, só a linha é redesenhada sobre o fundo guardado
+    (blitting); eixos, rótulos e grade são renderizados de novo apenas quando a
+    curva sai dos limites.
+    """
+
+    # Fator de crescimento do eixo x e folga relativa do eixo y ao redimensionar
+    X_GROWTH = 1.5
+    Y_MARGIN = 0.05
+
+    def __init__(
+        self,
+        max_points: int = PLOT_MAX_POINTS,
+        x_label: str = "Geração",
+        y_label: str = "Distância (px)",
+    ):
+        self.max_points = max_points
+
+        self.fig = plt.figure(figsize=(4.5, 4), dpi=100)
+        self.ax = self.fig.add_subplot()
+        (self.line,) = self.ax.plot([], [], color="#1f77b4", linewidth=2, animated=True)
+        self.ax.set_xlabel(x_label)
+        self.ax.set_ylabel(y_label)
+        self.ax.set_title("Evolução do Fitness", pad=14)
+        self.ax.grid(True, alpha=0.3)
+
+        self.canvas = FigureCanvasAgg(self.fig)
+        self._background = None
+        self._surface: pygame.Surface | None = None
+        self._drawn_count = 0
+
+    def _fits(self, x: np.ndarray, y: np.ndarray) -> bool:
+        x_low, x_high = self.ax.get_xlim()
+        y_low, y_high = self.ax.get_ylim()
+        return x[-1] <= x_high and y_low <= y.min() and y.max() <= y_high
+
+    def _rescale(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Ajusta os limites com folga e renderiza o fundo (tudo menos a linha)."""
+        self.ax.set_xlim(1, max(x[-1] * self.X_GROWTH, 2))
+
+        y_low, y_high = float(y.min()), float(y.max())
+        margin = (y_high - y_low) * self.Y_MARGIN or max(abs(y_high) * self.Y_MARGIN, 1.0)
+        self.ax.set_ylim(y_low - margin, y_high + margin)
+
+        self.fig.tight_layout(pad=2.0)
+        self.canvas.draw()
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+
+    def update(self, y_values: List[float]) -> None:
+        """Troca os dados da linha pelo histórico atual e redesenha o necessário."""
+        if len(y_values) == self._drawn_count:
+            return
 
-    if raw_data is None:
-        raise RuntimeError("Não foi possível extrair dados RGB do matplotlib")
+        x, y = downsample_series(y_values, self.max_points)
+        self.line.set_data(x, y)
 
-    size = (width, height)
-    surf = pygame.image.fromstring(raw_data, size, "RGB")
-    screen.blit(surf, (0, 0))
+        if self._background is None or not self._fits(x, y):
+            self._rescale(x, y)
+        else:
+            self.canvas.restore_region(self._background)
 
-    plt.close(fig)
+        self.ax.draw_artist(self.line)
+
+        width, height = self.canvas.get_width_height()
+        # Copia o buffer: o canvas o reescreve no próximo quadro
+        self._surface = pygame.image.frombuffer(bytes(self.canvas.buffer_rgba()), (width, height), "RGBA")
+        self._drawn_count = len(y_values)
+
+    def draw(self, screen: pygame.Surface, y_values: List[float], position: Tuple[int, int] = (0, 0)) -> None:
+        if len(y_values) < 2:
+            return
+
+        self.update(y_values)
+        screen.blit(self._surface, position)
+
+    def close(self) -> None:
+        plt.close(self.fig)
 
 
 def draw_multiple_routes(screen: pygame.Surface, vehicle_routes: List[List[Delivery]], depot: Tuple[int, int]):
@@ -242,3 +278,50 @@ def draw_legend(screen: pygame.Surface, x: int | None = None, y: int | None = No
 
         text = font.render(f"Veículo {i+1}", True, text_color)
         screen.blit(text, (right_x + 44, pos_y))
+
+
+class PygameRenderer(SolverObserver):
+    """Observador opcional do solver que desenha a evolução numa janela Pygame.
+
+    A cada geração redesenha o gráfico de fitness, as entregas e as rotas da
+    melhor solução. Fechar a janela (ou pressionar Q) pede a parada do solver.
+    """
+
+    def __init__(self, fps: int | None = FPS, node_radius: int = NODE_RADIUS):
+        self.fps = fps
+        self.node_radius = node_radius
+        self.screen: pygame.Surface | None = None
+        self.plot: ConvergencePlot | None = None
+
+    def on_start(self, solver, problem, config) -> None:
+        self.solver = solver
+        self.problem = problem
+        self.improve = config.local_search_elites > 0
+
+        pygame.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption("VRP Solver - Algoritmo Genético com Prioridades")
+        self.clock = pygame.time.Clock()
+        self.plot = ConvergencePlot()
+
+    def on_generation(self, event: GenerationEvent) -> None:
+        for pygame_event in pygame.event.get():
+            if pygame_event.type == pygame.QUIT or pygame_event.type == pygame.KEYDOWN and pygame_event.key == pygame.K_q:
+                self.solver.request_stop()
+
+        screen = self.screen
+        screen.fill(WHITE)
+
+        self.plot.draw(screen, event.fitness_history)
+        draw_deliveries(screen, self.problem.deliveries, self.node_radius)
+        draw_depot(screen, self.problem.depot, self.node_radius)
+        draw_multiple_routes(screen, decode_routes(self.problem, event.best_genome, self.improve), self.problem.depot)
+
+        pygame.display.flip()
+        if self.fps:
+            self.clock.tick(self.fps)
+
+    def on_finish(self, result) -> None:
+        if self.plot is not None:
+            self.plot.close()
+        pygame.quit()
@@ -0,0 +1,99 @@
+import csv
+from pathlib import Path
+from typing import Iterable, List
+
+import numpy as np
+
+from checkpoint import load_checkpoint
+from genome import GENOME_DTYPE
+from population import insert_delivery_cheapest
+from problem import VRPProblem
+
+
+def _parse_ids(text: str) -> List[int]:
+    return [int(delivery_id) for delivery_id in text.split(";") if delivery_id]
+
+
+def read_solution_csv(path: str | Path) -> np.ndarray:
+    """Genoma de uma solução gravada por main.write_solution_csv (top_N.csv).
+
+    Vem da coluna GenomeIDs, que decodifica exatamente para as rotas gravadas.
+    Arquivos sem ela (gravados antes) caem nas rotas dos veículos concatenadas,
+    na ordem dos veículos: a decodificação redistribui essas entregas, então a
+    solução é só aproximada.
+    """
+    with open(path, newline="", encoding="utf-8") as file:
+        rows = sorted(csv.DictReader(file), key=lambda row: int(row["VehicleID"]))
+    if rows and rows[0].get("GenomeIDs"):
+        return np.array(_parse_ids(rows[0]["GenomeIDs"]), dtype=GENOME_DTYPE)
+    delivery_ids = [delivery_id for row in rows for delivery_id in _parse_ids(row["DeliveryIDs"])]
+    return np.array(delivery_ids, dtype=GENOME_DTYPE)
+
+
+def _solution_rank(path: Path) -> tuple:
+    # top_2.csv antes de top_10.csv
+    return len(path.stem), path.stem
+
+
+def load_warm_start_genomes(paths: Iterable[str | Path]) -> List[np.ndarray]:
+    """Lê os genomas de execuções anteriores, dos melhores para os piores.
+
+    Cada caminho pode ser um top_N.csv, um diretório com esses arquivos (como
+    o `images/` do main.py) ou um checkpoint .npz, do qual vêm o arquivo de
+    elite e a população gravada.
+    """
+    genomes: List[np.ndarray] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            genomes.extend(read_solution_csv(csv_path) for csv_path in sorted(path.glob("top_*.csv"), key=_solution_rank))
+        elif path.suffix == ".npz":
+            checkpoint = load_checkpoint(path)
+            genomes.extend(genome for _, genome in checkpoint.elite_archive)
+            genomes.extend(checkpoint.population)
+        else:
+            genomes.append(read_solution_csv(path))
+    return genomes
+
+
+def repair_genome(genome: np.ndarray, problem: VRPProblem) -> np.ndarray:
+    """Adapta um genoma de outra instância às entregas de `problem` (identificadas pelo id).
+
+    Ids que não existem mais (ou repetidos) são removidos e cada entrega nova
+    entra na posição de inserção mais barata da sequência (ver
+    insert_delivery_cheapest), em O(n) por entrega. Ao fim, a sequência é
+    ordenada de forma estável pela prioridade: a divisão entre veículos já faz
+    essa ordenação, então as rotas não mudam e a penalidade de prioridade não
+    aumenta.
+    """
+    live = np.zeros(len(problem.delivery_table), dtype=bool)
+    live[list(problem.delivery_lookup)] = True
+
+    genome = np.asarray(genome, dtype=GENOME_DTYPE)
+    kept = genome[(genome >= 0) & (genome < len(live))]
+    kept = kept[live[kept]]
+    _, first_positions = np.unique(kept, return_index=True)
+    kept = kept[np.sort(first_positions)]
+
+    missing = live.copy()
+    missing[kept] = False
+    repaired = kept[None, :]
+    for delivery_id in np.flatnonzero(missing):
+        repaired = insert_delivery_cheapest(repaired, int(delivery_id), problem.distance_matrix)
+
+    repaired = repaired[0]
+    return repaired[np.argsort(problem.delivery_table.priority[repaired], kind="stable")]
+
+
+def warm_start_genomes(problem: VRPProblem, genomes: Iterable[np.ndarray], limit: int) -> np.ndarray:
+    """Repara os genomas para `problem` e devolve até `limit` distintos, na ordem
+    recebida, prontos para `GeneticVRP.run(..., seed_genomes=...)`."""
+    seeds: dict = {}
+    for genome in genomes:
+        if len(seeds) >= limit:
+            break
+        repaired = repair_genome(genome, problem)
+        seeds.setdefault(repaired.tobytes(), repaired)
+
+    if not seeds:
+        return np.empty((0, problem.num_deliveries), dtype=GENOME_DTYPE)
+    return np.stack(list(seeds.values()))
@@ -0,0 +1,79 @@
+"""Testes unitários para o módulo archive.py"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from archive import EliteArchive
+from cities import generate_problem
+from solver import GeneticVRP, SolverConfig, SolverObserver
+
+
+class TestEliteArchive:
+    """Testes para o arquivo limitado dos melhores genomas distintos"""
+
+    def test_keeps_best_unique_genomes_within_capacity(self):
+        # Arrange
+        archive = EliteArchive(capacity=2)
+        a, b, c = np.array([0, 1, 2]), np.array([1, 0, 2]), np.array([2, 1, 0])
+
+        # Act
+        added = [archive.add(5.0, a), archive.add(3.0, b), archive.add(5.0, a), archive.add(4.0, c), archive.add(9.0, a)]
+
+        # Assert
+        assert added == [True, True, False, True, False]
+        assert len(archive) == 2
+        assert [(fitness, genome.tolist()) for fitness, genome in archive.top()] == [(3.0, [1, 0, 2]), (4.0, [2, 1, 0])]
+        assert a not in archive and b in archive
+        assert archive.best()[0] == 3.0
+
+    def test_ties_keep_the_earliest_genome(self):
+        # Arrange
+        archive = EliteArchive(capacity=2)
+
+        # Act
+        for genome in ([0, 1], [1, 0], [0, 1, 2]):
+            archive.add(1.0, np.array(genome))
+
+        # Assert
+        assert [genome.tolist() for _, genome in archive.top()] == [[0, 1], [1, 0]]
+
+    def test_stored_genomes_are_copies(self):
+        # Arrange
+        archive = EliteArchive()
+        genome = np.array([0, 1, 2])
+
+        # Act
+        archive.add(1.0, genome)
+        genome[0] = 2
+
+        # Assert
+        assert archive.best()[1].tolist() == [0, 1, 2]
+        with pytest.raises(ValueError):
+            EliteArchive(capacity=0)
+
+    def test_matches_dedupe_and_sort_of_every_generation(self):
+        # Arrange
+        problem = generate_problem(12, 2, seed=4)
+        generations = []
+
+        class Recorder(SolverObserver):
+            def on_generation(self, event):
+                generations.append((event.best_fitness, tuple(event.best_genome.tolist())))
+
+        config = SolverConfig(population_size=12, time_limit_seconds=None, max_generations=60, seed=2, elite_archive_size=5)
+
+        # Act
+        result = GeneticVRP([Recorder()]).run(problem, config)
+
+        # Assert: mesma seleção que a deduplicação ao fim da execução
+        unique = {}
+        for fitness, key in generations:
+            unique.setdefault(key, fitness)
+        expected = sorted(((fitness, key) for key, fitness in unique.items()), key=lambda item: item[0])[:5]
+        assert [(fitness, tuple(genome.tolist())) for fitness, genome in result.elite_archive.top()] == expected
@@ -0,0 +1,112 @@
+"""Testes unitários para o módulo batch_fitness.py"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from batch_fitness import calculate_fitness_batch, calculate_priority_penalty_batch
+from cities import generate_deliveries, generate_vehicle_capacities, generate_vehicle_max_deliveries
+from distance_matrix import DistanceMatrix
+from models import Delivery, Priority
+from population import calculate_fitness_multi_vehicle, calculate_priority_penalty
+
+
+def _scalar_fitness(population_ids, deliveries, num_vehicles, depot, capacities, max_deliveries, distance_matrix):
+    deliveries_by_id = {delivery.id: delivery for delivery in deliveries}
+    return [
+        calculate_fitness_multi_vehicle(
+            [deliveries_by_id[i] for i in row], num_vehicles, depot, capacities, max_deliveries, distance_matrix
+        )
+        for row in population_ids.tolist()
+    ]
+
+
+class TestCalculateFitnessBatch:
+    """Testes para a função calculate_fitness_batch"""
+
+    def test_calculate_fitness_batch_matches_scalar(self):
+        # Arrange
+        random.seed(11)
+        rng = np.random.default_rng(11)
+        depot = (500, 200)
+        deliveries = generate_deliveries(40)
+        distance_matrix = DistanceMatrix(depot, deliveries)
+        population_ids = np.array([rng.permutation(len(deliveries)) for _ in range(60)])
+
+        for num_vehicles, margin in [(1, 1.1), (3, 1.1), (5, 0.8)]:
+            capacities = generate_vehicle_capacities(sum(d.weight for d in deliveries), num_vehicles, margin)
+            max_deliveries = generate_vehicle_max_deliveries(len(deliveries), num_vehicles)
+
+            # Act
+            fitness = calculate_fitness_batch(
+                population_ids, deliveries, num_vehicles, depot, capacities, max_deliveries, distance_matrix
+            )
+
+            # Assert
+            expected = _scalar_fitness(
+                population_ids, deliveries, num_vehicles, depot, capacities, max_deliveries, distance_matrix
+            )
+            assert fitness.tolist() == expected
+
+    def test_calculate_fitness_batch_with_ties_and_excess(self):
+        # Arrange: pontos repetidos geram empates e o limite de entregas é insuficiente
+        rng = np.random.default_rng(3)
+        depot = (0, 0)
+        priorities = list(Priority)
+        deliveries = [
+            Delivery(
+                location=(int(rng.integers(0, 3)) * 10, int(rng.integers(0, 3)) * 10),
+                priority=priorities[int(rng.integers(0, len(priorities)))],
+                weight=float(rng.integers(5, 25)),
+                id=i,
+            )
+            for i in range(12)
+        ]
+        num_vehicles = 3
+        capacities = [60.0, 50.0, 40.0]
+        max_deliveries = [3, 3, 3]
+        population_ids = np.array([rng.permutation(len(deliveries)) for _ in range(40)])
+        distance_matrix = DistanceMatrix(depot, deliveries)
+
+        # Act
+        fitness = calculate_fitness_batch(population_ids, deliveries, num_vehicles, depot, capacities, max_deliveries)
+
+        # Assert
+        expected = _scalar_fitness(
+            population_ids, deliveries, num_vehicles, depot, capacities, max_deliveries, distance_matrix
+        )
+        assert fitness.tolist() == expected
+
+    def test_calculate_fitness_batch_empty_individuals(self):
+        # Arrange
+        population_ids = np.zeros((4, 0), dtype=np.int64)
+
+        # Act
+        fitness = calculate_fitness_batch(population_ids, [], 2, (0, 0), [10.0, 10.0], [1, 1])
+
+        # Assert
+        assert np.all(np.isinf(fitness))
+
+
+class TestCalculatePriorityPenaltyBatch:
+    """Testes para a função calculate_priority_penalty_batch"""
+
+    def test_calculate_priority_penalty_batch_matches_scalar(self):
+        # Arrange
+        random.seed(4)
+        rng = np.random.default_rng(4)
+        deliveries = generate_deliveries(25)
+        priority_by_id = np.array([d.priority.value for d in sorted(deliveries, key=lambda d: d.id)])
+        population_ids = np.array([rng.permutation(len(deliveries)) for _ in range(30)])
+
+        # Act
+        penalties = calculate_priority_penalty_batch(priority_by_id[population_ids])
+
+        # Assert
+        expected = [calculate_priority_penalty([deliveries[i] for i in row]) for row in population_ids.tolist()]
+        assert penalties.tolist() == expected
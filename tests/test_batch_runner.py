@@ -0,0 +1,122 @@
+"""Testes unitários para o módulo batch_runner.py"""
+
+import csv
+import json
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from batch_runner import load_scenarios, run_batch
+from cities import generate_problem
+from solver import SolverConfig
+
+
+def scenario_data(seed, num_deliveries=12, num_vehicles=2):
+    return generate_problem(num_deliveries, num_vehicles, seed).to_dict()
+
+
+@pytest.fixture
+def defaults():
+    return SolverConfig(population_size=10, time_limit_seconds=None, max_generations=3, evaluator_backend="serial")
+
+
+class TestLoadScenarios:
+    """Testes para a leitura de cenários"""
+
+    def test_directory_uses_file_names_and_overrides(self, tmp_path, defaults):
+        # Arrange
+        (tmp_path / "b.json").write_text(json.dumps({**scenario_data(1), "seed": 7, "max_generations": 5}))
+        (tmp_path / "a.json").write_text(json.dumps(scenario_data(2)))
+
+        # Act
+        scenarios = load_scenarios(tmp_path, defaults)
+
+        # Assert
+        assert [scenario.name for scenario in scenarios] == ["a", "b"]
+        assert scenarios[0].config.max_generations == 3
+        assert scenarios[1].config.seed == 7
+        assert scenarios[1].config.max_generations == 5
+        assert scenarios[1].problem.num_deliveries == 12
+
+    def test_manifest_mixes_paths_and_inline_scenarios(self, tmp_path, defaults):
+        # Arrange
+        (tmp_path / "depot_a.json").write_text(json.dumps(scenario_data(3)))
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps({"scenarios": ["depot_a.json", {**scenario_data(4), "name": "depot_b"}]}))
+
+        # Act
+        scenarios = load_scenarios(manifest, defaults)
+
+        # Assert
+        assert [scenario.name for scenario in scenarios] == ["depot_a", "depot_b"]
+
+    def test_invalid_scenarios_are_rejected(self, tmp_path, defaults):
+        # Arrange
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps({"scenarios": [{**scenario_data(5), "name": "x"}, {**scenario_data(6), "name": "x"}]}))
+
+        # Act / Assert
+        with pytest.raises(ValueError):
+            load_scenarios(manifest, defaults)
+        with pytest.raises(ValueError):
+            load_scenarios(manifest, SolverConfig(time_limit_seconds=None, max_generations=None))
+
+    @pytest.mark.parametrize("name", ["a/b", "../x", "..", "", ".hidden"])
+    def test_names_that_escape_output_dir_are_rejected(self, tmp_path, defaults, name):
+        # Arrange
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps({"scenarios": [{**scenario_data(5), "name": name}]}))
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="inválidos"):
+            load_scenarios(manifest, defaults)
+
+
+class TestRunBatch:
+    """Testes para a execução do lote em processos"""
+
+    def test_writes_result_per_scenario_and_summary(self, tmp_path, defaults):
+        # Arrange: o segundo cenário falha (nenhuma geração executada)
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps({"scenarios": [
+            {**scenario_data(8), "name": "ok", "seed": 1},
+            {**scenario_data(9), "name": "broken", "max_generations": 0},
+        ]}))
+        scenarios = load_scenarios(manifest, defaults)
+        output_dir = tmp_path / "out"
+
+        # Act
+        results = run_batch(scenarios, output_dir, workers=2)
+
+        # Assert
+        assert [result["status"] for result in results] == ["ok", "error"]
+        ok = json.loads((output_dir / "ok.json").read_text())
+        assert ok["generations"] == 3
+        assert sorted(i for route in ok["routes"] for i in route["delivery_ids"]) == list(range(12))
+        assert "RuntimeError" in json.loads((output_dir / "broken.json").read_text())["error"]
+        with open(output_dir / "summary.csv", newline="", encoding="utf-8") as file:
+            rows = list(csv.DictReader(file))
+        assert [row["scenario"] for row in rows] == ["ok", "broken"]
+        assert float(rows[0]["best_fitness"]) == ok["best_fitness"]
+
+    def test_unwritable_result_is_recorded_in_summary(self, tmp_path, defaults):
+        # Arrange: cenário montado sem load_scenarios, com nome que sairia do diretório
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps({"scenarios": [{**scenario_data(10), "name": "ok"}]}))
+        scenario = load_scenarios(manifest, defaults)[0]
+        escaping = replace(scenario, name="../escaped")
+        output_dir = tmp_path / "out"
+
+        # Act
+        results = run_batch([scenario, escaping], output_dir, workers=1)
+
+        # Assert
+        assert [result["status"] for result in results] == ["ok", "error"]
+        assert "fora do diretório" in results[1]["error"]
+        assert not (tmp_path / "escaped.json").exists()
+        assert (output_dir / "summary.csv").exists()
@@ -0,0 +1,136 @@
+"""Testes unitários para o módulo checkpoint.py"""
+
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from checkpoint import CheckpointWriter, load_checkpoint, save_checkpoint
+from cities import generate_problem
+from models import Delivery, Priority
+from solver import GeneticVRP, SolverConfig, SolverObserver
+
+
+class TestCheckpoint:
+    """Testes para a gravação e a retomada de execuções"""
+
+    @pytest.mark.parametrize("local_search_elites", [0, 2])
+    def test_resume_continues_exactly(self, tmp_path, local_search_elites):
+        # Arrange
+        problem = generate_problem(30, 3, 4)
+        config = SolverConfig(population_size=20, time_limit_seconds=None, max_generations=25, seed=7,
+                              local_search_elites=local_search_elites)
+        uninterrupted = GeneticVRP().run(problem, config)
+        path = tmp_path / "run.npz"
+        with CheckpointWriter(path) as writer:
+            GeneticVRP(checkpointer=writer).run(problem, replace(config, max_generations=10))
+
+        # Act
+        checkpoint = load_checkpoint(path)
+        resumed = GeneticVRP().run(checkpoint.problem, replace(checkpoint.config, max_generations=25), checkpoint)
+
+        # Assert
+        assert checkpoint.generation == 10
+        assert resumed.generations == 25
+        assert resumed.fitness_history == uninterrupted.fitness_history
+        assert resumed.best_fitness == uninterrupted.best_fitness
+        assert np.array_equal(resumed.best_genome, uninterrupted.best_genome)
+        assert [f for f, _ in resumed.elite_archive.top()] == [f for f, _ in uninterrupted.elite_archive.top()]
+
+    def test_round_trip_keeps_state(self, tmp_path):
+        # Arrange
+        problem = generate_problem(30, 3, 5)
+        captured = []
+
+        class Collector:
+            def due(self):
+                return True
+
+            def submit(self, checkpoint):
+                captured.append(checkpoint)
+
+            def flush(self):
+                pass
+
+        GeneticVRP(checkpointer=Collector()).run(
+            problem, SolverConfig(population_size=10, time_limit_seconds=None, max_generations=3, seed=1,
+                                  local_search_elites=1))
+        original = captured[-1]
+        path = tmp_path / "state.npz"
+
+        # Act
+        save_checkpoint(path, original)
+        loaded = load_checkpoint(path)
+
+        # Assert
+        assert len(captured) == 4  # uma por geração mais a final
+        assert loaded.population.dtype == np.int32
+        assert np.array_equal(loaded.population, original.population)
+        assert np.array_equal(loaded.fitness, original.fitness)
+        assert loaded.fitness_history == original.fitness_history
+        assert loaded.improved_fitness == original.improved_fitness
+        assert loaded.rng_state == original.rng_state
+        assert loaded.random_state == original.random_state
+        assert loaded.config == original.config
+        assert loaded.problem.to_dict() == problem.to_dict()
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_writer_failure_warns_and_keeps_running(self, tmp_path):
+        # Arrange
+        problem = generate_problem(10, 3, 6)
+        config = SolverConfig(population_size=10, time_limit_seconds=None, max_generations=2, seed=1)
+
+        # Act
+        with pytest.warns(RuntimeWarning, match="checkpoint"):
+            with CheckpointWriter(tmp_path / "missing" / "run.npz", interval_seconds=0) as writer:
+                result = GeneticVRP(checkpointer=writer).run(problem, config)
+
+        # Assert
+        assert result.generations == 2
+        assert writer.saved == 0
+
+    def test_resume_rejects_other_problem(self, tmp_path):
+        # Arrange
+        path = tmp_path / "run.npz"
+        config = SolverConfig(population_size=10, time_limit_seconds=None, max_generations=2, seed=1)
+        with CheckpointWriter(path) as writer:
+            GeneticVRP(checkpointer=writer).run(generate_problem(10, 3, 7), config)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="não corresponde"):
+            GeneticVRP().run(generate_problem(12, 3, 7), config, load_checkpoint(path))
+
+    def test_checkpoint_after_insert_and_cancel_loads_back(self, tmp_path):
+        # Arrange: id alto aceito com 11 entregas, que sai do limite de 9
+        problem = generate_problem(10, 3, 8)
+        path = tmp_path / "run.npz"
+        config = SolverConfig(population_size=10, time_limit_seconds=None, max_generations=4, seed=2)
+
+        class Dispatcher(SolverObserver):
+            def on_start(self, solver, problem, config):
+                self.solver = solver
+
+            def on_generation(self, event):
+                if event.generation == 1:
+                    self.solver.insert_delivery(Delivery((480, 210), Priority.HIGH, 2.0, 1020))
+                if event.generation == 2:
+                    self.solver.cancel_delivery(0)
+                    self.solver.cancel_delivery(1)
+
+        with CheckpointWriter(path) as writer:
+            GeneticVRP([Dispatcher()], checkpointer=writer).run(problem, config)
+
+        # Act
+        checkpoint = load_checkpoint(path)
+        result = GeneticVRP().run(checkpoint.problem, replace(checkpoint.config, max_generations=6), checkpoint)
+
+        # Assert
+        assert sorted(d.id for d in checkpoint.problem.deliveries) == [*range(2, 10), 1020]
+        assert checkpoint.problem.max_id == 1020
+        assert result.generations == 6
+        assert sorted(result.best_genome.tolist()) == [*range(2, 10), 1020]
@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Adiciona o diretório src ao path para permitir imports
@@ -9,8 +10,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 from cities import (
     generate_cities,
     generate_deliveries,
+    generate_problem,
     generate_vehicle_capacities,
     generate_vehicle_max_deliveries,
+    sample_deliveries,
+    sample_locations,
+    sample_vehicle_max_deliveries,
 )
 from models import Delivery, Priority
 
@@ -90,3 +95,103 @@ class TestGenerateVehicleMaxDeliveries:
         assert all(isinstance(count, int) for count in max_deliveries)
         assert all(count >= 1 for count in max_deliveries)
         assert sum(max_deliveries) == num_deliveries
+
+
+def min_pairwise_distance(points):
+    diff = points[:, None, :] - points[None, :, :]
+    distances = np.sqrt((diff ** 2).sum(axis=-1))
+    np.fill_diagonal(distances, np.inf)
+    return distances.min()
+
+
+class TestGenerateProblem:
+    """Testes para a geração de uma instância completa"""
+
+    def test_generate_problem_success(self):
+        # Act
+        problem = generate_problem(15, 3, seed=2)
+        again = generate_problem(15, 3, seed=2)
+
+        # Assert
+        assert problem.num_deliveries == 15
+        assert problem.num_vehicles == 3
+        assert sum(problem.vehicle_max_deliveries) == 15
+        assert sum(problem.vehicle_capacities) == pytest.approx(sum(d.weight for d in problem.deliveries) * 1.1, rel=0.01)
+        assert problem.to_dict() == again.to_dict()
+
+
+class TestSampleLocations:
+    """Testes para a amostragem de Poisson-disk das localizações"""
+
+    @pytest.mark.parametrize("num_locations, bounds", [
+        (1500, (-200, 100, 1800, 900)),  # caixa quase saturada
+        (40, (0, 0, 100_000, 50_000)),  # caixa enorme para poucas entregas
+    ])
+    def test_respects_min_distance_and_bounds(self, num_locations, bounds):
+        # Arrange
+        min_distance = 25
+
+        # Act
+        locations = sample_locations(num_locations, np.random.default_rng(3), min_distance, bounds)
+
+        # Assert
+        assert locations.shape == (num_locations, 2)
+        assert locations.dtype == np.int64
+        assert min_pairwise_distance(locations) >= min_distance
+        assert (locations[:, 0] >= bounds[0]).all() and (locations[:, 0] <= bounds[2]).all()
+        assert (locations[:, 1] >= bounds[1]).all() and (locations[:, 1] <= bounds[3]).all()
+
+    def test_rejects_box_too_small(self):
+        # Act / Assert
+        with pytest.raises(ValueError, match="comporta só"):
+            sample_locations(500, np.random.default_rng(0), min_distance=30)
+
+
+class TestSampleDeliveries:
+    """Testes para a geração vetorizada de instâncias grandes"""
+
+    def test_same_seed_same_instance(self):
+        # Arrange
+        bounds = (0, 0, 3000, 3000)
+
+        # Act
+        first = sample_deliveries(2000, np.random.default_rng(7), 10, bounds)
+        second = sample_deliveries(2000, np.random.default_rng(7), 10, bounds)
+
+        # Assert
+        assert [(d.location, d.priority, d.weight, d.id) for d in first] == \
+            [(d.location, d.priority, d.weight, d.id) for d in second]
+
+    def test_priorities_and_weights_follow_legacy_distribution(self):
+        # Arrange
+        num_deliveries = 1001
+
+        # Act
+        deliveries = sample_deliveries(num_deliveries, np.random.default_rng(1), 10, (0, 0, 2000, 2000))
+
+        # Assert
+        assert [d.id for d in deliveries] == list(range(num_deliveries))
+        counts = {priority: sum(d.priority is priority for d in deliveries) for priority in Priority}
+        assert counts == {Priority.CRITICAL: 100, Priority.HIGH: 200, Priority.MEDIUM: 401, Priority.LOW: 300}
+        assert all(5.0 <= d.weight <= 25.0 and round(d.weight, 2) == d.weight for d in deliveries)
+        assert all(isinstance(coord, int) for d in deliveries for coord in d.location)
+
+
+class TestSampleVehicleMaxDeliveries:
+    """Testes para a divisão vetorizada do número de entregas entre os veículos"""
+
+    def test_allocates_all_deliveries(self):
+        # Act
+        max_deliveries = sample_vehicle_max_deliveries(100_000, 7, np.random.default_rng(2))
+
+        # Assert
+        assert len(max_deliveries) == 7
+        assert all(isinstance(count, int) and count >= 1 for count in max_deliveries)
+        assert sum(max_deliveries) == 100_000
+
+    def test_fewer_deliveries_than_vehicles_gives_one_each(self):
+        # Act
+        max_deliveries = sample_vehicle_max_deliveries(2, 5, np.random.default_rng(3))
+
+        # Assert
+        assert max_deliveries == generate_vehicle_max_deliveries(2, 5) == [1] * 5
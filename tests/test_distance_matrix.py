@@ -0,0 +1,140 @@
+"""Testes unitários para o módulo distance_matrix.py"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cities import generate_deliveries, generate_vehicle_capacities, generate_vehicle_max_deliveries
+from distance_matrix import DEPOT_INDEX, DistanceMatrix
+from models import Delivery, Priority
+from population import (
+    calculate_distance,
+    calculate_fitness_multi_vehicle,
+    calculate_route_distance,
+    optimize_vehicle_route_nearest_neighbor,
+    split_deliveries_by_vehicle,
+)
+
+
+class TestDistanceMatrix:
+    """Testes para a classe DistanceMatrix"""
+
+    def test_distance_matrix_matches_calculate_distance(self):
+        # Arrange
+        depot = (500, 200)
+        deliveries = generate_deliveries(20)
+
+        # Act
+        distance_matrix = DistanceMatrix(depot, deliveries)
+
+        # Assert
+        assert distance_matrix.size == len(deliveries) + 1
+        for delivery in deliveries:
+            assert distance_matrix.depot_distance(delivery.id) == calculate_distance(depot, delivery.location)
+            for other in deliveries:
+                expected = calculate_distance(delivery.location, other.location)
+                assert distance_matrix.distance(delivery.id, other.id) == expected
+        assert distance_matrix.matrix[DEPOT_INDEX, DEPOT_INDEX] == 0.0
+
+    def test_route_distance_success(self):
+        # Arrange
+        depot = (0, 0)
+        route = [
+            Delivery(location=(3, 0), priority=Priority.HIGH, weight=10.0, id=0),
+            Delivery(location=(3, 4), priority=Priority.MEDIUM, weight=15.0, id=1),
+        ]
+        distance_matrix = DistanceMatrix(depot, route)
+
+        # Act
+        distance = calculate_route_distance(route, depot, distance_matrix)
+
+        # Assert
+        assert distance == pytest.approx(12.0, rel=1e-9)
+        assert distance_matrix.route_distance([]) == 0.0
+
+
+    def test_add_delivery_matches_full_rebuild(self):
+        # Arrange: rows já construídas e ids novos com buraco, além de um reposicionamento
+        random.seed(3)
+        depot = (500, 200)
+        deliveries = generate_deliveries(12)
+        distance_matrix = DistanceMatrix(depot, deliveries)
+        _ = distance_matrix.rows
+        _ = distance_matrix.neighbors(3)
+        added = [
+            Delivery((5, 7), Priority.CRITICAL, 2.0, 12),
+            Delivery((900, 300), Priority.LOW, 2.0, 15),
+            Delivery((40, 60), Priority.HIGH, 2.0, 4),
+        ]
+
+        # Act
+        for delivery in added:
+            distance_matrix.add_delivery(delivery)
+
+        # Assert
+        final = [d for d in deliveries if d.id != 4] + added
+        expected = DistanceMatrix(depot, final)
+        assert distance_matrix.size == expected.size
+        assert np.array_equal(distance_matrix.matrix, expected.matrix)
+        assert distance_matrix.rows == distance_matrix.matrix.tolist()
+        assert distance_matrix.neighbors(3) == expected.neighbors(3)
+
+    def test_missing_ids_are_never_neighbors(self):
+        # Arrange: 20 entregas, uma nova com id 40 (ids 20..39 viram buracos) e uma cancelada
+        random.seed(4)
+        deliveries = generate_deliveries(20)
+        distance_matrix = DistanceMatrix((500, 200), deliveries)
+        _ = distance_matrix.rows
+
+        # Act
+        distance_matrix.add_delivery(Delivery((600, 100), Priority.HIGH, 2.0, 40))
+        distance_matrix.remove_delivery(7)
+        neighbors = distance_matrix.neighbors(10)
+
+        # Assert
+        live = {DistanceMatrix.index(d.id) for d in deliveries if d.id != 7} | {DistanceMatrix.index(40)}
+        assert all(set(neighbors[row]) <= live and len(neighbors[row]) == 10 for row in live)
+        assert distance_matrix.matrix[1, 25] == np.inf
+        assert distance_matrix.rows[1][DistanceMatrix.index(7)] == np.inf
+        assert distance_matrix.rows == distance_matrix.matrix.tolist()
+        assert distance_matrix.distance(0, 40) == pytest.approx(calculate_distance(deliveries[0].location, (600, 100)))
+
+
+class TestDistanceMatrixEquivalence:
+    """Garante que o uso da matriz não altera os resultados das funções de rota"""
+
+    def test_fitness_and_routes_are_identical_with_matrix(self):
+        # Arrange
+        random.seed(7)
+        depot = (500, 200)
+        deliveries = generate_deliveries(30)
+        num_vehicles = 3
+        capacities = generate_vehicle_capacities(sum(d.weight for d in deliveries), num_vehicles)
+        max_deliveries = generate_vehicle_max_deliveries(len(deliveries), num_vehicles)
+        distance_matrix = DistanceMatrix(depot, deliveries)
+
+        for _ in range(20):
+            individual = random.sample(deliveries, len(deliveries))
+
+            # Act
+            routes = split_deliveries_by_vehicle(individual, num_vehicles, depot, capacities, max_deliveries)
+            routes_matrix = split_deliveries_by_vehicle(
+                individual, num_vehicles, depot, capacities, max_deliveries, distance_matrix
+            )
+            fitness = calculate_fitness_multi_vehicle(individual, num_vehicles, depot, capacities, max_deliveries)
+            fitness_matrix = calculate_fitness_multi_vehicle(
+                individual, num_vehicles, depot, capacities, max_deliveries, distance_matrix
+            )
+
+            # Assert
+            assert routes == routes_matrix
+            assert fitness == fitness_matrix
+            assert optimize_vehicle_route_nearest_neighbor(individual, depot) == (
+                optimize_vehicle_route_nearest_neighbor(individual, depot, distance_matrix)
+            )
@@ -0,0 +1,105 @@
+"""Testes unitários para o módulo evaluators.py"""
+
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from batch_fitness import calculate_fitness_batch
+from cities import generate_problem
+from evaluators import ProcessPoolEvaluator, SerialEvaluator, ThreadPoolEvaluator, create_evaluator
+from fitness_cache import FitnessCache
+from problem import VRPProblem
+
+
+@pytest.fixture
+def problem():
+    return generate_problem(20, 3, seed=21)
+
+
+@pytest.fixture
+def population(problem):
+    rng = np.random.default_rng(21)
+    return np.array([rng.permutation(problem.num_deliveries) for _ in range(30)], dtype=np.int32)
+
+
+class TestEvaluators:
+    """Testes para os avaliadores serial, por processos e por threads"""
+
+    @pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+    def test_evaluators_match_batch_fitness(self, backend, problem, population):
+        # Arrange
+        expected = calculate_fitness_batch(
+            population, problem.deliveries, problem.num_vehicles, problem.depot,
+            problem.vehicle_capacities, problem.vehicle_max_deliveries,
+        )
+
+        # Act
+        with create_evaluator(backend, problem, workers=2) as evaluator:
+            fitness = evaluator.evaluate(population)
+
+        # Assert
+        assert fitness.tolist() == expected.tolist()
+
+    def test_create_evaluator_types(self, problem):
+        # Act / Assert
+        assert type(create_evaluator("serial", problem)) is SerialEvaluator
+        with create_evaluator("thread", problem, workers=1) as evaluator:
+            assert isinstance(evaluator, ThreadPoolEvaluator)
+        with create_evaluator("process", problem, workers=1) as evaluator:
+            assert isinstance(evaluator, ProcessPoolEvaluator)
+        with pytest.raises(ValueError):
+            create_evaluator("gpu", problem)
+
+    def test_pool_evaluator_uses_cache(self, problem, population):
+        # Arrange
+        cache = FitnessCache()
+
+        # Act
+        with ThreadPoolEvaluator(problem, workers=2, fitness_cache=cache) as evaluator:
+            first = evaluator.evaluate(population)
+            second = evaluator.evaluate(population)
+
+        # Assert
+        assert first.tolist() == second.tolist()
+        assert cache.hits == len(population)
+
+
+class TestVRPProblem:
+    """Testes para a classe VRPProblem"""
+
+    def test_pickle_drops_derived_structures(self, problem):
+        # Arrange
+        _ = problem.distance_matrix
+
+        # Act
+        restored = pickle.loads(pickle.dumps(problem))
+
+        # Assert
+        assert "distance_matrix" not in restored.__dict__
+        assert restored.deliveries == problem.deliveries
+        assert np.array_equal(restored.distance_matrix.matrix, problem.distance_matrix.matrix)
+
+    def test_dict_round_trip(self, problem):
+        # Act
+        restored = VRPProblem.from_dict(json.loads(json.dumps(problem.to_dict())))
+
+        # Assert
+        assert restored == problem
+        with pytest.raises(ValueError):
+            VRPProblem.from_dict({**problem.to_dict(), "vehicle_max_deliveries": [1]})
+
+    def test_dict_rejects_ids_that_would_blow_up_the_matrix(self, problem):
+        # Arrange
+        data = problem.to_dict()
+        data["deliveries"][0]["id"] = 100_000
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="fora do intervalo"):
+            VRPProblem.from_dict(data)
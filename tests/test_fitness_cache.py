@@ -0,0 +1,82 @@
+"""Testes unitários para o módulo fitness_cache.py"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from batch_fitness import calculate_fitness_batch
+from cities import generate_deliveries, generate_vehicle_capacities, generate_vehicle_max_deliveries
+from fitness_cache import FitnessCache
+
+
+class TestFitnessCache:
+    """Testes para a classe FitnessCache"""
+
+    def test_get_and_put_counters(self):
+        # Arrange
+        cache = FitnessCache(max_size=4)
+
+        # Act
+        missing = cache.get((0, 1, 2))
+        cache.put((0, 1, 2), 10.0)
+        found = cache.get((0, 1, 2))
+
+        # Assert
+        assert missing is None
+        assert found == 10.0
+        assert cache.hits == 1
+        assert cache.misses == 1
+        assert cache.hit_rate == pytest.approx(0.5)
+
+    def test_lru_eviction(self):
+        # Arrange
+        cache = FitnessCache(max_size=2)
+        cache.put((0,), 1.0)
+        cache.put((1,), 2.0)
+
+        # Act: (0,) passa a ser o mais recente, então (1,) é descartado
+        cache.get((0,))
+        cache.put((2,), 3.0)
+
+        # Assert
+        assert len(cache) == 2
+        assert (0,) in cache
+        assert (1,) not in cache
+        assert (2,) in cache
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError):
+            FitnessCache(max_size=0)
+
+
+class TestCalculateFitnessBatchWithCache:
+    """Testes para calculate_fitness_batch consultando o cache"""
+
+    def test_cached_results_match_uncached(self):
+        # Arrange
+        random.seed(2)
+        rng = np.random.default_rng(2)
+        depot = (500, 200)
+        deliveries = generate_deliveries(20)
+        capacities = generate_vehicle_capacities(sum(d.weight for d in deliveries), 3)
+        max_deliveries = generate_vehicle_max_deliveries(len(deliveries), 3)
+        unique = np.array([rng.permutation(len(deliveries)) for _ in range(10)])
+        population = np.concatenate([unique, unique[:5]])
+        cache = FitnessCache(max_size=100)
+
+        # Act
+        expected = calculate_fitness_batch(population, deliveries, 3, depot, capacities, max_deliveries)
+        first = calculate_fitness_batch(population, deliveries, 3, depot, capacities, max_deliveries, None, cache)
+        second = calculate_fitness_batch(population, deliveries, 3, depot, capacities, max_deliveries, None, cache)
+
+        # Assert
+        assert first.tolist() == expected.tolist()
+        assert second.tolist() == expected.tolist()
+        assert len(cache) == 10
+        assert cache.hits == len(population)
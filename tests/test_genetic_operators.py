@@ -4,8 +4,14 @@ from pathlib import Path
 # Adiciona o diretório src ao path para permitir imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+import numpy as np
+
 from genetic_operators import (
     order_crossover,
+    order_crossover_batch,
+    order_crossover_genome,
+    random_cut_points,
+    sort_genomes,
     sort_population,
     swap_mutation,
 )
@@ -36,6 +42,22 @@ class TestSortPopulation:
         assert sorted_pop[2] == population[0]
 
 
+class TestSortGenomes:
+    """Testes para a função sort_genomes"""
+
+    def test_sort_genomes_success(self):
+        # Arrange
+        population = np.array([[0, 1, 2], [2, 1, 0], [1, 0, 2]])
+        fitness_scores = np.array([100.0, 50.0, 75.0])
+
+        # Act
+        sorted_pop, sorted_fitness = sort_genomes(population, fitness_scores)
+
+        # Assert
+        assert sorted_fitness.tolist() == [50.0, 75.0, 100.0]
+        assert sorted_pop.tolist() == [[2, 1, 0], [1, 0, 2], [0, 1, 2]]
+
+
 class TestOrderCrossover:
     """Testes para a função order_crossover"""
 
@@ -76,6 +98,57 @@ class TestOrderCrossover:
         assert len(child) == len(parent1)
 
 
+class TestOrderCrossoverGenome:
+    """Testes para a função order_crossover_genome"""
+
+    def test_order_crossover_genome_success(self):
+        # Arrange
+        parent1 = np.array([0, 1, 2, 3, 4, 5, 6, 7], dtype=np.int32)
+        parent2 = np.array([7, 5, 3, 1, 6, 4, 2, 0], dtype=np.int32)
+
+        for _ in range(50):
+            # Act
+            child = order_crossover_genome(parent1, parent2)
+
+            # Assert
+            assert child.dtype == parent1.dtype
+            assert sorted(child.tolist()) == parent1.tolist()
+
+
+    def test_order_crossover_genome_with_cut_points(self):
+        # Arrange
+        parent1 = np.array([0, 1, 2, 3, 4, 5, 6, 7], dtype=np.int32)
+        parent2 = np.array([7, 5, 3, 1, 6, 4, 2, 0], dtype=np.int32)
+
+        # Act
+        child = order_crossover_genome(parent1, parent2, 2, 5)
+
+        # Assert: segmento [2, 3, 4] do pai 1, demais genes na ordem do pai 2
+        assert child.tolist() == [7, 5, 2, 3, 4, 1, 6, 0]
+
+
+class TestOrderCrossoverBatch:
+    """Testes para a função order_crossover_batch"""
+
+    def test_order_crossover_batch_matches_single_crossover(self):
+        # Arrange
+        rng = np.random.default_rng(5)
+        length = 30
+        parents1 = np.array([rng.permutation(length) for _ in range(25)], dtype=np.int32)
+        parents2 = np.array([rng.permutation(length) for _ in range(25)], dtype=np.int32)
+        start_indices, end_indices = random_cut_points(len(parents1), length, rng)
+
+        # Act
+        children = order_crossover_batch(parents1, parents2, start_indices, end_indices)
+
+        # Assert
+        assert np.all(start_indices < end_indices)
+        assert np.all(end_indices <= length)
+        for i in range(len(parents1)):
+            expected = order_crossover_genome(parents1[i], parents2[i], start_indices[i], end_indices[i])
+            assert children[i].tolist() == expected.tolist()
+
+
 class TestSwapMutation:
     """Testes para a função swap_mutation"""
 
@@ -109,3 +182,15 @@ class TestSwapMutation:
         assert len(mutated) == len(individual)
         assert all(delivery in individual for delivery in mutated)
         assert mutated is not individual
+
+    def test_swap_mutation_with_genome_success(self):
+        # Arrange
+        individual = np.array([0, 1, 2, 3], dtype=np.int32)
+
+        # Act
+        mutated = swap_mutation(individual, 1.0)
+
+        # Assert
+        assert sorted(mutated.tolist()) == individual.tolist()
+        assert mutated.tolist() != individual.tolist()
+        assert individual.tolist() == [0, 1, 2, 3]
@@ -0,0 +1,34 @@
+"""Testes unitários para o módulo genome.py"""
+
+import sys
+from pathlib import Path
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from genome import GENOME_DTYPE, build_delivery_lookup, deliveries_to_genome, genome_key, genome_to_deliveries
+from models import Delivery, Priority
+
+
+class TestGenomeConversion:
+    """Testes para as conversões entre listas de entregas e genomas"""
+
+    def test_round_trip_success(self):
+        # Arrange
+        deliveries = [
+            Delivery(location=(10, 20), priority=Priority.HIGH, weight=10.0, id=2),
+            Delivery(location=(30, 40), priority=Priority.MEDIUM, weight=15.0, id=0),
+            Delivery(location=(50, 60), priority=Priority.LOW, weight=20.0, id=1),
+        ]
+        delivery_lookup = build_delivery_lookup(deliveries)
+
+        # Act
+        genome = deliveries_to_genome(deliveries)
+        restored = genome_to_deliveries(genome, delivery_lookup)
+
+        # Assert
+        assert genome.dtype == GENOME_DTYPE
+        assert genome.tolist() == [2, 0, 1]
+        assert restored == deliveries
+        assert all(restored_delivery is delivery for restored_delivery, delivery in zip(restored, deliveries))
+        assert genome_key(genome) == (2, 0, 1)
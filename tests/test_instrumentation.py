@@ -0,0 +1,99 @@
+"""Testes unitários para instrumentation.py e metrics_exporters.py"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cities import generate_problem
+from instrumentation import PHASES, Instrumentation
+from metrics_exporters import JsonlMetricsExporter, PrometheusMetricsExporter
+from solver import GeneticVRP, SolverConfig, SolverObserver
+
+
+@pytest.fixture
+def problem():
+    return generate_problem(12, 2, seed=8)
+
+
+def small_config():
+    return SolverConfig(population_size=20, time_limit_seconds=None, max_generations=5, seed=2)
+
+
+class MetricsRecorder(SolverObserver):
+    def __init__(self):
+        self.metrics = []
+
+    def on_metrics(self, metrics):
+        self.metrics.append(metrics)
+
+
+class TestInstrumentation:
+    """Testes para os temporizadores por fase"""
+
+    def test_finish_generation_resets_current_and_accumulates_totals(self):
+        # Arrange
+        instrumentation = Instrumentation()
+
+        # Act
+        for generation in (1, 2):
+            with instrumentation.phase("evaluate"):
+                pass
+            metrics = instrumentation.finish_generation(generation, 0.0, 1.0, 10, 3, 7, 10)
+
+        # Assert
+        assert set(metrics.phase_seconds) == set(PHASES)
+        assert metrics.phase_seconds["evaluate"] >= 0.0
+        assert instrumentation.generations == 2
+        assert instrumentation.evaluations == 20
+        assert instrumentation.phase_totals["evaluate"] >= metrics.phase_seconds["evaluate"]
+
+    def test_solver_publishes_metrics_per_generation(self, problem):
+        # Arrange
+        recorder = MetricsRecorder()
+
+        # Act
+        result = GeneticVRP([recorder]).run(problem, small_config())
+
+        # Assert
+        assert [m.generation for m in recorder.metrics] == [1, 2, 3, 4, 5]
+        first = recorder.metrics[0]
+        assert first.evaluations == first.cache_misses == 20 - first.cache_hits
+        assert 1 <= first.unique_genomes <= 20
+        assert all(m.cache_hits + m.cache_misses == 20 for m in recorder.metrics)
+        assert result.phase_seconds.keys() == set(PHASES)
+        assert result.phase_seconds["evaluate"] > 0
+
+
+class TestMetricsExporters:
+    """Testes para os exportadores JSONL e Prometheus"""
+
+    def test_jsonl_exporter_writes_one_line_per_generation(self, problem, tmp_path):
+        # Arrange
+        path = tmp_path / "metrics.jsonl"
+
+        # Act
+        GeneticVRP([JsonlMetricsExporter(str(path))]).run(problem, small_config())
+
+        # Assert
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [record["generation"] for record in records] == [1, 2, 3, 4, 5]
+        assert set(records[0]["phase_seconds"]) == set(PHASES)
+
+    def test_prometheus_exporter_writes_totals(self, problem, tmp_path):
+        # Arrange
+        path = tmp_path / "metrics.prom"
+
+        # Act
+        GeneticVRP([PrometheusMetricsExporter(str(path), write_every=2)]).run(problem, small_config())
+
+        # Assert
+        text = path.read_text(encoding="utf-8")
+        assert "vrp_generations_total 5" in text
+        assert 'vrp_phase_seconds_total{phase="evaluate"}' in text
+        assert "vrp_generation 5" in text
+        assert not (tmp_path / "metrics.prom.tmp").exists()
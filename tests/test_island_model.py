@@ -0,0 +1,167 @@
+"""Testes unitários para o módulo island_model.py"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cities import generate_problem
+from island_model import IslandConfig, IslandModel, integrate_migrants, migration_sources, select_migrants
+from solver import SolverConfig, SolverObserver
+
+
+@pytest.fixture
+def problem():
+    return generate_problem(15, 3, seed=13)
+
+
+class TestMigration:
+    """Testes para topologias e troca de migrantes"""
+
+    def test_ring_and_full_topologies(self):
+        # Act / Assert
+        assert migration_sources("ring", 3) == [[2], [0], [1]]
+        assert migration_sources("full", 3) == [[1, 2], [0, 2], [0, 1]]
+        assert migration_sources("ring", 1) == [[]]
+        with pytest.raises(ValueError):
+            migration_sources("star", 3)
+
+    def test_select_migrants_keeps_best_of_all_sources(self):
+        # Arrange
+        emigrants = [
+            (np.array([[0, 1], [1, 0]]), np.array([5.0, 9.0])),
+            (np.array([[1, 0], [0, 1]]), np.array([3.0, 7.0])),
+        ]
+
+        # Act
+        genomes, fitness = select_migrants(emigrants, 2)
+
+        # Assert
+        assert fitness.tolist() == [3.0, 5.0]
+        assert genomes.tolist() == [[1, 0], [0, 1]]
+
+    def test_integrate_migrants_replaces_worst_and_keeps_elite(self):
+        # Arrange
+        population = np.array([[0, 1, 2], [1, 0, 2], [2, 1, 0]])
+        fitness = np.array([1.0, 2.0, 3.0])
+        migrants = np.array([[2, 0, 1], [0, 2, 1], [1, 2, 0]])
+
+        # Act
+        new_population, new_fitness = integrate_migrants(population, fitness, migrants, np.array([0.5, 0.7, 0.9]))
+
+        # Assert
+        assert new_fitness.tolist() == [0.5, 0.7, 1.0]
+        assert new_population[2].tolist() == [0, 1, 2]
+        assert population.tolist() == [[0, 1, 2], [1, 0, 2], [2, 1, 0]]
+
+
+class TestIslandModel:
+    """Testes para a execução das ilhas em processos"""
+
+    def test_run_splits_generations_into_migration_epochs(self, problem):
+        # Arrange
+        generations = []
+
+        class Recorder(SolverObserver):
+            def on_generation(self, event):
+                generations.append(event.generation)
+
+        solver = IslandModel([Recorder()], IslandConfig(num_islands=2, migration_interval=3, topology="full"))
+        config = SolverConfig(population_size=20, time_limit_seconds=None, max_generations=7, seed=4)
+
+        # Act
+        result = solver.run(problem, config)
+
+        # Assert
+        assert result.generations == 7
+        assert generations == list(range(1, 8))
+        assert len(result.fitness_history) == 7
+        assert result.elite_archive.best()[0] == min(result.fitness_history)
+        assert sorted(d.id for route in result.best_routes for d in route) == list(range(15))
+
+    def test_same_seed_is_reproducible(self, problem):
+        # Arrange
+        config = SolverConfig(population_size=20, time_limit_seconds=None, max_generations=6, seed=9)
+
+        # Act
+        first = IslandModel(island_config=IslandConfig(num_islands=2, migration_interval=2)).run(problem, config)
+        second = IslandModel(island_config=IslandConfig(num_islands=2, migration_interval=2)).run(problem, config)
+
+        # Assert
+        assert first.fitness_history == second.fitness_history
+
+    def test_metrics_are_emitted_for_every_generation(self, problem):
+        # Arrange
+        metrics = []
+
+        class Recorder(SolverObserver):
+            def on_metrics(self, generation_metrics):
+                metrics.append(generation_metrics)
+
+        solver = IslandModel([Recorder()], IslandConfig(num_islands=2, migration_interval=3))
+        config = SolverConfig(population_size=20, time_limit_seconds=None, max_generations=5, seed=4)
+
+        # Act
+        result = solver.run(problem, config)
+
+        # Assert
+        assert [m.generation for m in metrics] == list(range(1, 6))
+        assert [m.best_fitness for m in metrics] == result.fitness_history
+        assert all(m.cache_hits + m.cache_misses == 20 and m.evaluations == m.cache_misses for m in metrics)
+        assert all(m.phase_seconds["evaluate"] > 0 for m in metrics)
+        assert result.phase_seconds["evaluate"] == pytest.approx(sum(m.phase_seconds["evaluate"] for m in metrics))
+
+    def test_seed_genomes_enter_the_initial_populations(self, problem):
+        # Arrange
+        config = SolverConfig(population_size=20, time_limit_seconds=None, max_generations=15, seed=2)
+        previous = IslandModel(island_config=IslandConfig(num_islands=2)).run(problem, config)
+        seed_fitness, seed_genome = previous.elite_archive.best()
+
+        # Act
+        result = IslandModel(island_config=IslandConfig(num_islands=2)).run(
+            problem, SolverConfig(population_size=20, time_limit_seconds=None, max_generations=1, seed=7),
+            seed_genomes=seed_genome[None, :])
+
+        # Assert
+        assert result.fitness_history[0] <= seed_fitness
+
+    def test_unsupported_features_are_rejected(self, problem):
+        # Arrange
+        solver = IslandModel(island_config=IslandConfig(num_islands=2))
+        config = SolverConfig(population_size=20, time_limit_seconds=None, max_generations=1)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="checkpoint"):
+            solver.run(problem, config, resume_from=object())
+        with pytest.raises(ValueError, match="número de entregas"):
+            solver.run(problem, config, seed_genomes=np.zeros((1, 3), dtype=np.int32))
+        with pytest.raises(NotImplementedError):
+            solver.insert_delivery(problem.deliveries[0])
+        with pytest.raises(NotImplementedError):
+            solver.cancel_delivery(0)
+
+    def test_time_limit_and_stop_are_checked_inside_the_epoch(self, problem):
+        # Arrange
+        island_config = IslandConfig(num_islands=2, migration_interval=10**6)
+        stopped = IslandModel(island_config=island_config)
+        timer = threading.Timer(0.5, stopped.request_stop)
+
+        # Act
+        start = time.perf_counter()
+        limited = IslandModel(island_config=island_config).run(
+            problem, SolverConfig(population_size=20, time_limit_seconds=0.5, seed=3))
+        limited_seconds = time.perf_counter() - start
+        timer.start()
+        stopped_result = stopped.run(problem, SolverConfig(population_size=20, time_limit_seconds=None, seed=3))
+        timer.join()
+
+        # Assert
+        assert 0 < limited.generations < 10**6
+        assert limited_seconds < 5
+        assert 0 < stopped_result.generations < 10**6
@@ -0,0 +1,116 @@
+"""Testes unitários para o módulo local_search.py"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cities import generate_problem
+from distance_matrix import DistanceMatrix
+from genome import genome_to_deliveries
+from local_search import improve_route, improve_routes
+from models import Delivery, Priority
+from population import calculate_fitness_multi_vehicle, calculate_route_distance
+from solver import GeneticVRP, SolverConfig, decode_routes
+
+
+class TestLocalSearch:
+    """Testes para 2-opt e Or-opt com avaliação por delta"""
+
+    def test_two_opt_removes_crossing(self):
+        # Arrange: quadrado percorrido em "laço" (arestas cruzadas)
+        depot = (0, 0)
+        route = [
+            Delivery((0, 10), Priority.LOW, 1.0, 0),
+            Delivery((10, 0), Priority.LOW, 1.0, 1),
+            Delivery((10, 10), Priority.LOW, 1.0, 2),
+        ]
+        distance_matrix = DistanceMatrix(depot, route)
+        before = calculate_route_distance(route, depot)
+
+        # Act
+        improved, delta = improve_route(route, distance_matrix)
+
+        # Assert
+        after = calculate_route_distance(improved, depot)
+        assert after == pytest.approx(40.0)
+        assert delta == pytest.approx(after - before)
+
+    def test_moves_stay_inside_priority_groups(self):
+        # Arrange: a entrega crítica está longe, mas deve continuar primeiro
+        depot = (0, 0)
+        route = [
+            Delivery((100, 100), Priority.CRITICAL, 1.0, 0),
+            Delivery((1, 0), Priority.LOW, 1.0, 1),
+            Delivery((3, 0), Priority.LOW, 1.0, 2),
+            Delivery((2, 0), Priority.LOW, 1.0, 3),
+        ]
+
+        # Act
+        improved, delta = improve_route(route, DistanceMatrix(depot, route))
+
+        # Assert
+        assert improved[0].id == 0
+        assert delta <= 0
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_delta_matches_recomputed_distance(self, seed):
+        # Arrange
+        problem = generate_problem(60, 2, seed)
+        genome = np.random.default_rng(seed).permutation(problem.num_deliveries).astype(np.int32)
+        routes = decode_routes(problem, genome)
+
+        # Act
+        improved, delta = improve_routes(routes, problem.distance_matrix)
+
+        # Assert
+        before = sum(calculate_route_distance(route, problem.depot) for route in routes)
+        after = sum(calculate_route_distance(route, problem.depot) for route in improved)
+        assert delta <= 0
+        assert after - before == pytest.approx(delta, abs=1e-6)
+        for original, new in zip(routes, improved, strict=True):
+            assert sorted(d.id for d in original) == sorted(d.id for d in new)
+            priorities = [d.priority.value for d in new]
+            assert priorities == sorted(priorities)
+
+    def test_neighbor_lists_exclude_self_and_depot(self):
+        # Arrange
+        problem = generate_problem(10, 2, 3)
+
+        # Act
+        neighbors = problem.distance_matrix.neighbors(4)
+
+        # Assert
+        assert len(neighbors) == problem.distance_matrix.size
+        for row, candidates in enumerate(neighbors):
+            assert len(candidates) == 4
+            assert row not in candidates and 0 not in candidates
+            distances = [problem.distance_matrix.matrix[row][c] for c in candidates]
+            assert distances == sorted(distances)
+
+
+class TestMemeticSolver:
+    """Testes para o modo memético do solver"""
+
+    def test_best_fitness_accounts_for_refined_routes(self):
+        # Arrange
+        problem = generate_problem(40, 3, 11)
+        config = SolverConfig(population_size=20, time_limit_seconds=None, max_generations=5, seed=1, local_search_elites=3)
+
+        # Act
+        result = GeneticVRP().run(problem, config)
+
+        # Assert
+        raw_fitness = calculate_fitness_multi_vehicle(
+            genome_to_deliveries(result.best_genome, problem.delivery_lookup), problem.num_vehicles, problem.depot,
+            problem.vehicle_capacities, problem.vehicle_max_deliveries,
+        )
+        _, delta = improve_routes(decode_routes(problem, result.best_genome), problem.distance_matrix)
+        assert result.best_fitness == pytest.approx(raw_fitness + delta)
+        assert result.best_routes == decode_routes(problem, result.best_genome, improve=True)
+        history = result.fitness_history
+        assert all(later <= earlier for earlier, later in zip(history, history[1:]))
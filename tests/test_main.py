@@ -0,0 +1,23 @@
+"""Testes unitários para o módulo main.py"""
+
+import sys
+from pathlib import Path
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from main import build_problem
+
+
+class TestBuildProblem:
+    """Testes para a geração da instância pela linha de comando"""
+
+    def test_same_seed_builds_same_instance(self):
+        # Act
+        first = build_problem(20, 3, seed=5)
+        second = build_problem(20, 3, seed=5)
+        other = build_problem(20, 3, seed=6)
+
+        # Assert
+        assert first.to_dict() == second.to_dict()
+        assert first.to_dict() != other.to_dict()
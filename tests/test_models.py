@@ -0,0 +1,61 @@
+"""Testes unitários para o módulo models.py"""
+
+import dataclasses
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from models import Delivery, DeliveryTable, Priority
+
+
+class TestDelivery:
+    """Testes para a entrega imutável identificada pelo id"""
+
+    def test_identity_is_the_id(self):
+        # Arrange
+        delivery = Delivery((10, 20), Priority.HIGH, 5.0, 7)
+        same_id = Delivery((99, 99), Priority.LOW, 1.0, 7)
+        other = Delivery((10, 20), Priority.HIGH, 5.0, 8)
+
+        # Act / Assert
+        assert delivery == same_id and hash(delivery) == hash(same_id)
+        assert delivery != other
+        assert len({delivery, same_id, other}) == 2
+        assert [other, delivery].index(same_id) == 1
+
+    def test_is_frozen_and_slotted(self):
+        # Arrange
+        delivery = Delivery((10, 20), Priority.HIGH, 5.0, 7)
+
+        # Act / Assert
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            delivery.weight = 1.0
+        assert not hasattr(delivery, "__dict__")
+        restored = pickle.loads(pickle.dumps(delivery))
+        assert (restored.location, restored.priority, restored.weight, restored.id) == ((10, 20), Priority.HIGH, 5.0, 7)
+
+
+class TestDeliveryTable:
+    """Testes para as colunas NumPy indexadas pelo id"""
+
+    def test_columns_are_indexed_by_id(self):
+        # Arrange
+        deliveries = [
+            Delivery((30, 40), Priority.LOW, 2.5, 1),
+            Delivery((10, 20), Priority.CRITICAL, 5.0, 0),
+        ]
+
+        # Act
+        table = DeliveryTable.from_deliveries(deliveries)
+
+        # Assert
+        assert len(table) == 2
+        assert table.x.tolist() == [10.0, 30.0]
+        assert table.y.tolist() == [20.0, 40.0]
+        assert table.weight.tolist() == [5.0, 2.5]
+        assert table.priority.tolist() == [Priority.CRITICAL.value, Priority.LOW.value]
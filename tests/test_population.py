@@ -1,24 +1,97 @@
 """Testes unitários para o módulo population.py"""
 
+import random
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Adiciona o diretório src ao path para permitir imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from cities import generate_problem
+from config import PENALTY_PRIORITY
+from distance_matrix import DistanceMatrix
 from models import Delivery, Priority
 from population import (
+    assign_deliveries_to_vehicles,
     calculate_distance,
     calculate_fitness_multi_vehicle,
+    calculate_priority_penalty,
     calculate_route_distance,
     create_initial_population_deliveries,
+    create_initial_population_genomes,
+    insert_delivery_cheapest,
     optimize_vehicle_route_nearest_neighbor,
+    remove_delivery_from_genomes,
     split_deliveries_by_vehicle,
 )
 
 
+def legacy_assign_deliveries(deliveries, num_vehicles, vehicle_capacities, vehicle_max_deliveries):
+    """Cópia da atribuição original de split_deliveries_by_vehicle (varredura de todos os veículos)."""
+    sorted_deliveries = deliveries.copy()
+    sorted_deliveries.sort(key=lambda d: d.priority.value)
+    vehicle_routes = [[] for _ in range(num_vehicles)]
+    vehicle_loads = [0.0 for _ in range(num_vehicles)]
+
+    if len(sorted_deliveries) >= num_vehicles:
+        for i in range(num_vehicles):
+            for idx, delivery in enumerate(sorted_deliveries):
+                if delivery.weight <= vehicle_capacities[i] and vehicle_max_deliveries[i] > 0:
+                    vehicle_routes[i].append(delivery)
+                    vehicle_loads[i] += delivery.weight
+                    sorted_deliveries.pop(idx)
+                    break
+
+    for delivery in sorted_deliveries:
+        best_vehicle = None
+        min_load = float("inf")
+        for i in range(num_vehicles):
+            if (vehicle_loads[i] + delivery.weight <= vehicle_capacities[i]
+                    and len(vehicle_routes[i]) < vehicle_max_deliveries[i] and vehicle_loads[i] < min_load):
+                min_load = vehicle_loads[i]
+                best_vehicle = i
+        if best_vehicle is None:
+            min_load = float("inf")
+            for i in range(num_vehicles):
+                if len(vehicle_routes[i]) < vehicle_max_deliveries[i] and vehicle_loads[i] < min_load:
+                    min_load = vehicle_loads[i]
+                    best_vehicle = i
+        if best_vehicle is None:
+            best_vehicle = vehicle_loads.index(min(vehicle_loads))
+        vehicle_routes[best_vehicle].append(delivery)
+        vehicle_loads[best_vehicle] += delivery.weight
+
+    for vehicle_id in range(num_vehicles):
+        while len(vehicle_routes[vehicle_id]) > vehicle_max_deliveries[vehicle_id]:
+            excess_delivery = vehicle_routes[vehicle_id].pop()
+            vehicle_loads[vehicle_id] -= excess_delivery.weight
+            reallocated = False
+            for other_id in range(num_vehicles):
+                if (other_id != vehicle_id
+                        and vehicle_loads[other_id] + excess_delivery.weight <= vehicle_capacities[other_id]
+                        and len(vehicle_routes[other_id]) < vehicle_max_deliveries[other_id]):
+                    vehicle_routes[other_id].append(excess_delivery)
+                    vehicle_loads[other_id] += excess_delivery.weight
+                    reallocated = True
+                    break
+            if not reallocated:
+                for other_id in range(num_vehicles):
+                    if other_id != vehicle_id and len(vehicle_routes[other_id]) < vehicle_max_deliveries[other_id]:
+                        vehicle_routes[other_id].append(excess_delivery)
+                        vehicle_loads[other_id] += excess_delivery.weight
+                        reallocated = True
+                        break
+            if not reallocated:
+                best_other = min((i for i in range(num_vehicles) if i != vehicle_id), key=lambda i: vehicle_loads[i])
+                vehicle_routes[best_other].append(excess_delivery)
+                vehicle_loads[best_other] += excess_delivery.weight
+
+    return vehicle_routes
+
+
 class TestCreateInitialPopulationDeliveries:
     """Testes para a função create_initial_population_deliveries"""
 
@@ -41,6 +114,59 @@ class TestCreateInitialPopulationDeliveries:
         assert all(all(delivery in individual for delivery in deliveries) for individual in population)
 
 
+class TestCreateInitialPopulationGenomes:
+    """Testes para a função create_initial_population_genomes"""
+
+    def test_create_initial_population_genomes_success(self):
+        # Arrange
+        deliveries = [
+            Delivery(location=(10, 20), priority=Priority.HIGH, weight=10.0, id=0),
+            Delivery(location=(30, 40), priority=Priority.MEDIUM, weight=15.0, id=1),
+            Delivery(location=(50, 60), priority=Priority.LOW, weight=20.0, id=2),
+        ]
+        population_size = 10
+
+        # Act
+        population = create_initial_population_genomes(deliveries, population_size)
+
+        # Assert
+        assert population.shape == (population_size, len(deliveries))
+        assert all(sorted(individual) == [0, 1, 2] for individual in population.tolist())
+
+
+class TestInsertAndRemoveDelivery:
+    """Testes para a inserção mais barata e a remoção de uma entrega em todos os genomas"""
+
+    def test_insert_matches_brute_force(self):
+        # Arrange
+        random.seed(4)
+        deliveries = [Delivery((random.randint(0, 900), random.randint(0, 400)), Priority.LOW, 1.0, i) for i in range(9)]
+        depot = (500, 200)
+        distance_matrix = DistanceMatrix(depot, deliveries)
+        population = np.array([random.sample(range(8), 8) for _ in range(30)], dtype=np.int32)
+
+        # Act
+        result = insert_delivery_cheapest(population, 8, distance_matrix)
+
+        # Assert
+        for genome, inserted in zip(population.tolist(), result.tolist(), strict=True):
+            candidates = [genome[:position] + [8] + genome[position:] for position in range(len(genome) + 1)]
+            best = min(calculate_route_distance([deliveries[i] for i in c], depot, distance_matrix) for c in candidates)
+            assert calculate_route_distance([deliveries[i] for i in inserted], depot, distance_matrix) == pytest.approx(best)
+            assert [i for i in inserted if i != 8] == genome
+
+    def test_remove_keeps_order_of_remaining_genes(self):
+        # Arrange
+        population = np.array([[3, 1, 0, 2], [0, 2, 3, 1]], dtype=np.int32)
+
+        # Act
+        result = remove_delivery_from_genomes(population, 3)
+
+        # Assert
+        assert result.dtype == np.int32
+        assert result.tolist() == [[1, 0, 2], [0, 2, 1]]
+
+
 class TestCalculateDistance:
     """Testes para a função calculate_distance"""
 
@@ -106,6 +232,35 @@ class TestSplitDeliveriesByVehicle:
         assert all(delivery in all_deliveries for delivery in deliveries)
 
 
+    @pytest.mark.parametrize("seed", range(100))
+    def test_assignment_matches_legacy_implementation(self, seed):
+        # Arrange
+        rng = random.Random(seed)
+        num_vehicles = rng.choice([2, 3, 5, 8, 20, 60])
+        num_deliveries = rng.randint(0, 150)
+        problem = generate_problem(num_deliveries, num_vehicles, seed)
+        # Pesos inteiros forçam empates de carga; capacidades e limites apertados, o repasse do excedente
+        deliveries = [Delivery(d.location, d.priority, float(round(d.weight)), d.id) for d in problem.deliveries]
+        capacities = [float(rng.randint(1, 60)) for _ in range(num_vehicles)]
+        max_deliveries = [rng.randint(0, 2 * num_deliveries // num_vehicles + 1) for _ in range(num_vehicles)]
+
+        # Act
+        routes = assign_deliveries_to_vehicles(deliveries, num_vehicles, capacities, max_deliveries)
+
+        # Assert
+        expected = legacy_assign_deliveries(deliveries, num_vehicles, capacities, max_deliveries)
+        assert [[d.id for d in route] for route in routes] == [[d.id for d in route] for route in expected]
+
+    def test_single_vehicle_keeps_excess_deliveries(self):
+        # Arrange: sem outro veículo para receber o excedente
+        deliveries = [Delivery((i, i), Priority.LOW, 1.0, i) for i in range(5)]
+
+        # Act
+        routes = assign_deliveries_to_vehicles(deliveries, 1, [100.0], [3])
+
+        # Assert
+        assert [d.id for d in routes[0]] == [0, 1, 2, 3, 4]
+
 class TestCalculateRouteDistance:
     """Testes para a função calculate_route_distance"""
 
@@ -149,3 +304,23 @@ class TestCalculateFitnessMultiVehicle:
         assert isinstance(fitness, float)
         assert fitness > 0
         assert fitness != float("inf")
+
+
+class TestCalculatePriorityPenalty:
+    """Testes para a função calculate_priority_penalty"""
+
+    def test_calculate_priority_penalty_success(self):
+        # Arrange: CRITICAL na última posição (> 20%) e LOW nunca penalizada
+        deliveries = [
+            Delivery(location=(10, 10), priority=Priority.LOW, weight=10.0, id=0),
+            Delivery(location=(20, 20), priority=Priority.HIGH, weight=15.0, id=1),
+            Delivery(location=(30, 30), priority=Priority.LOW, weight=12.0, id=2),
+            Delivery(location=(40, 40), priority=Priority.CRITICAL, weight=12.0, id=3),
+        ]
+
+        # Act
+        penalty = calculate_priority_penalty(deliveries)
+
+        # Assert
+        assert penalty == pytest.approx(PENALTY_PRIORITY * 3.0)
+        assert calculate_priority_penalty([deliveries[3], deliveries[1], deliveries[0], deliveries[2]]) == 0.0
@@ -0,0 +1,91 @@
+"""Testes unitários para o módulo selection.py"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from selection import (
+    SELECTION_STRATEGIES,
+    proportional_selection,
+    select_parents,
+    stochastic_universal_sampling,
+    tournament_selection,
+)
+
+
+@pytest.fixture
+def fitness():
+    return np.array([100.0, 200.0, 400.0, 800.0])
+
+
+class TestSelection:
+    """Testes para as estratégias de seleção de pais"""
+
+    @pytest.mark.parametrize("strategy", sorted(SELECTION_STRATEGIES))
+    def test_strategies_return_valid_pairs(self, strategy, fitness):
+        # Arrange
+        rng = np.random.default_rng(0)
+
+        # Act
+        parents1, parents2 = select_parents(fitness, 50, rng, strategy)
+
+        # Assert
+        assert parents1.shape == parents2.shape == (50,)
+        assert parents1.min() >= 0 and parents1.max() < len(fitness)
+        assert parents2.min() >= 0 and parents2.max() < len(fitness)
+
+    def test_proportional_matches_inverse_fitness_probabilities(self, fitness):
+        # Arrange
+        rng = np.random.default_rng(1)
+        expected = (1 / fitness) / (1 / fitness).sum()
+
+        # Act
+        parents1, parents2 = proportional_selection(fitness, 50_000, rng)
+
+        # Assert
+        counts = np.bincount(np.concatenate([parents1, parents2]), minlength=len(fitness))
+        assert np.allclose(counts / counts.sum(), expected, atol=0.01)
+
+    def test_sus_gives_each_individual_its_expected_share(self, fitness):
+        # Arrange
+        rng = np.random.default_rng(2)
+        num_pairs = 30
+        expected = (1 / fitness) / (1 / fitness).sum() * 2 * num_pairs
+
+        # Act
+        parents1, parents2 = stochastic_universal_sampling(fitness, num_pairs, rng)
+
+        # Assert: cada um é escolhido floor(esperado) ou ceil(esperado) vezes
+        counts = np.bincount(np.concatenate([parents1, parents2]), minlength=len(fitness))
+        assert np.all(counts >= np.floor(expected)) and np.all(counts <= np.ceil(expected))
+
+    def test_tournament_never_picks_worst_with_full_tournament(self, fitness):
+        # Arrange
+        rng = np.random.default_rng(3)
+
+        # Act
+        parents1, parents2 = tournament_selection(fitness, 100, rng, tournament_size=len(fitness) * 4)
+
+        # Assert
+        assert 3 not in parents1 and 3 not in parents2
+
+    def test_rank_selection_favours_best(self, fitness):
+        # Arrange
+        rng = np.random.default_rng(4)
+
+        # Act
+        parents1, parents2 = select_parents(fitness, 20_000, rng, "rank")
+
+        # Assert: pesos 4:3:2:1
+        counts = np.bincount(np.concatenate([parents1, parents2]), minlength=len(fitness))
+        assert np.allclose(counts / counts.sum(), [0.4, 0.3, 0.2, 0.1], atol=0.01)
+
+    def test_unknown_strategy_raises(self, fitness):
+        # Act / Assert
+        with pytest.raises(ValueError):
+            select_parents(fitness, 1, np.random.default_rng(), "elitist")
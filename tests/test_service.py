@@ -0,0 +1,170 @@
+"""Testes unitários para o módulo service.py"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cities import generate_problem
+from service import Job, SolverService
+from solver import SolverConfig
+
+
+def job_data(instance_seed, **settings):
+    return {**generate_problem(25, 3, instance_seed).to_dict(), **settings}
+
+
+async def request(port, method, path, payload=None):
+    """Faz uma requisição HTTP e devolve (status, linhas do corpo) após o servidor fechar a conexão."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+    return status, [json.loads(line) for line in content.splitlines() if line]
+
+
+def run_with_service(scenario, **service_options):
+    async def runner():
+        service = SolverService(**service_options)
+        server = await service.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await scenario(port)
+        finally:
+            await service.close()
+
+    return asyncio.run(runner())
+
+
+class TestSolverService:
+    """Testes para o serviço HTTP com jobs em processos"""
+
+    def test_job_streams_progress_until_completion(self):
+        # Arrange
+        async def scenario(port):
+            status, (job,) = await request(port, "POST", "/jobs", job_data(1, seed=3, max_generations=40))
+            _, events = await request(port, "GET", f"/jobs/{job['job_id']}/events")
+            _, (snapshot,) = await request(port, "GET", f"/jobs/{job['job_id']}")
+            return status, events, snapshot
+
+        # Act
+        status, events, snapshot = run_with_service(scenario, max_jobs=1, progress_interval=0.0)
+
+        # Assert
+        assert status == 202
+        final = events[-1]
+        assert final["event"] == "finished" and final["status"] == "completed"
+        assert final["generation"] == 40
+        assert sorted(i for route in final["routes"] for i in route["delivery_ids"]) == list(range(25))
+        progress = [event["best_fitness"] for event in events[:-1]]
+        assert progress and all(later < earlier for earlier, later in zip(progress, progress[1:]))
+        assert snapshot["status"] == "completed"
+
+    def test_cancel_returns_best_solution_so_far(self):
+        # Arrange
+        async def scenario(port):
+            _, (job,) = await request(port, "POST", "/jobs", job_data(2, time_limit_seconds=60))
+            job_path = f"/jobs/{job['job_id']}"
+            events_task = asyncio.create_task(request(port, "GET", f"{job_path}/events"))
+            while True:
+                _, (snapshot,) = await request(port, "GET", job_path)
+                if snapshot["latest"] is not None:
+                    break
+                await asyncio.sleep(0.05)
+
+            start = time.perf_counter()
+            status, _ = await request(port, "DELETE", job_path)
+            _, events = await events_task
+            return status, events, time.perf_counter() - start
+
+        # Act
+        status, events, waited = run_with_service(scenario, max_jobs=1)
+
+        # Assert
+        assert status == 202
+        assert events[-1]["status"] == "cancelled"
+        assert events[-1]["routes"]
+        assert waited < 10
+
+    def test_deliveries_inserted_and_cancelled_while_running(self):
+        # Arrange
+        async def scenario(port):
+            _, (job,) = await request(port, "POST", "/jobs", job_data(3, time_limit_seconds=60))
+            job_path = f"/jobs/{job['job_id']}"
+            events_task = asyncio.create_task(request(port, "GET", f"{job_path}/events"))
+            while (await request(port, "GET", job_path))[1][0]["latest"] is None:
+                await asyncio.sleep(0.05)
+
+            urgent = {"location": [480, 210], "priority": "CRITICAL", "weight": 2.5}
+            inserted = await request(port, "POST", f"{job_path}/deliveries", urgent)
+            cancelled = await request(port, "DELETE", f"{job_path}/deliveries/4")
+            invalid = [
+                (await request(port, "DELETE", f"{job_path}/deliveries/4"))[0],
+                (await request(port, "POST", f"{job_path}/deliveries", {**urgent, "id": 3}))[0],
+                (await request(port, "POST", f"{job_path}/deliveries", {"location": [1, 2]}))[0],
+                (await request(port, "POST", f"{job_path}/deliveries", {**urgent, "id": 100_000}))[0],
+                (await request(port, "POST", f"{job_path}/deliveries", [urgent]))[0],
+            ]
+            while True:
+                _, (snapshot,) = await request(port, "GET", job_path)
+                routes = snapshot["latest"]["routes"]
+                if 25 in (i for route in routes for i in route["delivery_ids"]):
+                    break
+                await asyncio.sleep(0.05)
+
+            await request(port, "DELETE", job_path)
+            _, events = await events_task
+            after_finish = (await request(port, "POST", f"{job_path}/deliveries", urgent))[0]
+            return inserted, cancelled, invalid, events, after_finish
+
+        # Act
+        inserted, cancelled, invalid, events, after_finish = run_with_service(scenario, max_jobs=1, progress_interval=0.0)
+
+        # Assert
+        assert inserted == (202, [{"job_id": inserted[1][0]["job_id"], "delivery_id": 25, "status": "running"}])
+        assert cancelled[0] == 202
+        assert invalid == [400, 400, 400, 400, 400]
+        final_ids = sorted(i for route in events[-1]["routes"] for i in route["delivery_ids"])
+        assert final_ids == sorted(set(range(26)) - {4})
+        assert after_finish == 409
+
+    def test_invalid_requests(self):
+        # Arrange
+        async def scenario(port):
+            return [
+                (await request(port, "POST", "/jobs", {"deliveries": []}))[0],
+                (await request(port, "POST", "/jobs", [job_data(1)]))[0],
+                (await request(port, "POST", "/jobs", "texto"))[0],
+                (await request(port, "POST", "/jobs", {**job_data(1), "deliveries": []}))[0],
+                (await request(port, "POST", "/jobs", {**job_data(1), "deliveries": job_data(1)["deliveries"][:1]}))[0],
+                (await request(port, "GET", "/jobs/unknown"))[0],
+                (await request(port, "PUT", "/jobs"))[0],
+                (await request(port, "GET", "/other"))[0],
+            ]
+
+        # Act
+        statuses = run_with_service(scenario)
+
+        # Assert
+        assert statuses == [400, 400, 400, 400, 400, 404, 405, 404]
+
+    def test_cancel_cannot_leave_fewer_than_two_deliveries(self):
+        # Arrange
+        service = SolverService()
+        job = Job("job", "pequeno", generate_problem(3, 2, 4), SolverConfig())
+        service.cancel_delivery(job, 0)
+
+        # Act / Assert
+        with pytest.raises(ValueError, match="ao menos 2"):
+            service.cancel_delivery(job, 1)
+        assert sorted(job.problem.delivery_lookup) == [1, 2]
@@ -0,0 +1,180 @@
+"""Testes unitários para o módulo solver.py"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cities import generate_problem
+from models import Delivery, Priority
+from solver import GeneticVRP, SolverConfig, SolverObserver, decode_routes
+
+
+@pytest.fixture
+def problem():
+    return generate_problem(15, 3, seed=5)
+
+
+def small_config(**overrides):
+    values = {"population_size": 20, "time_limit_seconds": None, "max_generations": 10, "seed": 1}
+    values.update(overrides)
+    return SolverConfig(**values)
+
+
+class RecordingObserver(SolverObserver):
+    def __init__(self):
+        self.calls = []
+
+    def on_start(self, solver, problem, config):
+        self.calls.append("start")
+
+    def on_generation(self, event):
+        self.calls.append(event.generation)
+
+    def on_finish(self, result):
+        self.calls.append("finish")
+
+
+class TestGeneticVRP:
+    """Testes para o solver sem interface gráfica"""
+
+    def test_run_respects_max_generations(self, problem):
+        # Act
+        result = GeneticVRP().run(problem, small_config())
+
+        # Assert
+        assert result.generations == 10
+        assert len(result.fitness_history) == 10
+        assert result.best_fitness == min(result.fitness_history)
+        assert sorted(d.id for route in result.best_routes for d in route) == list(range(15))
+
+    def test_best_fitness_never_worsens_with_elitism(self, problem):
+        # Act
+        result = GeneticVRP().run(problem, small_config(max_generations=25))
+
+        # Assert
+        history = result.fitness_history
+        assert all(later <= earlier for earlier, later in zip(history, history[1:]))
+
+    def test_same_seed_is_reproducible(self, problem):
+        # Act
+        first = GeneticVRP().run(problem, small_config())
+        second = GeneticVRP().run(problem, small_config())
+
+        # Assert
+        assert first.fitness_history == second.fitness_history
+        assert np.array_equal(first.best_genome, second.best_genome)
+
+    def test_observers_are_notified_in_order(self, problem):
+        # Arrange
+        observer = RecordingObserver()
+
+        # Act
+        GeneticVRP([observer]).run(problem, small_config(max_generations=3))
+
+        # Assert
+        assert observer.calls == ["start", 1, 2, 3, "finish"]
+
+    def test_request_stop_ends_run_after_current_generation(self, problem):
+        # Arrange
+        class StopAtTwo(SolverObserver):
+            def on_start(self, solver, problem, config):
+                self.solver = solver
+
+            def on_generation(self, event):
+                if event.generation == 2:
+                    self.solver.request_stop()
+
+        # Act
+        result = GeneticVRP([StopAtTwo()]).run(problem, small_config())
+
+        # Assert
+        assert result.generations == 2
+
+    @pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+    def test_deliveries_inserted_and_cancelled_mid_run(self, problem, backend):
+        # Arrange
+        urgent = Delivery((480, 210), Priority.CRITICAL, 3.0, 15)
+
+        class Dispatcher(SolverObserver):
+            def __init__(self):
+                self.sizes = {}
+
+            def on_start(self, solver, problem, config):
+                self.solver = solver
+
+            def on_generation(self, event):
+                self.sizes[event.generation] = len(event.best_genome)
+                if event.generation == 3:
+                    self.solver.insert_delivery(urgent)
+                    self.solver.cancel_delivery(0)
+                if event.generation == 5:
+                    self.solver.cancel_delivery(7)
+                    with pytest.raises(ValueError):
+                        self.solver.cancel_delivery(7)
+                    with pytest.raises(ValueError):
+                        self.solver.insert_delivery(urgent)
+                    with pytest.raises(ValueError, match="fora do intervalo"):
+                        self.solver.insert_delivery(Delivery((0, 0), Priority.LOW, 1.0, 100_000))
+
+        dispatcher = Dispatcher()
+        solver = GeneticVRP([dispatcher])
+
+        # Act
+        result = solver.run(problem, small_config(evaluator_backend=backend, evaluator_workers=2))
+
+        # Assert
+        expected_ids = sorted({*range(1, 15), 15} - {7})
+        assert dispatcher.sizes == {1: 15, 2: 15, 3: 15, 4: 15, 5: 15, 6: 14, 7: 14, 8: 14, 9: 14, 10: 14}
+        assert sorted(d.id for d in problem.deliveries) == expected_ids
+        assert sorted(d.id for route in result.best_routes for d in route) == expected_ids
+        assert sorted(result.best_genome.tolist()) == expected_ids
+        assert all(sorted(genome.tolist()) == expected_ids for _, genome in result.elite_archive.top())
+        assert result.best_fitness == pytest.approx(GeneticVRP().run(
+            problem, small_config(max_generations=1, population_size=1), seed_genomes=result.best_genome[None]).best_fitness)
+        with pytest.raises(RuntimeError):
+            solver.insert_delivery(Delivery((0, 0), Priority.LOW, 1.0, 20))
+
+    def test_cancel_cannot_leave_fewer_than_two_deliveries(self):
+        # Arrange
+        problem = generate_problem(3, 2, seed=2)
+        outcomes = []
+
+        class Dispatcher(SolverObserver):
+            def on_start(self, solver, problem, config):
+                self.solver = solver
+
+            def on_generation(self, event):
+                if event.generation == 1:
+                    self.solver.cancel_delivery(0)
+                    with pytest.raises(ValueError, match="ao menos 2"):
+                        self.solver.cancel_delivery(1)
+                    outcomes.append("refused")
+
+        # Act
+        result = GeneticVRP([Dispatcher()]).run(problem, small_config(max_generations=3))
+
+        # Assert
+        assert outcomes == ["refused"]
+        assert result.generations == 3
+        assert sorted(result.best_genome.tolist()) == [1, 2]
+
+    def test_run_without_generations_raises(self, problem):
+        # Act / Assert
+        with pytest.raises(RuntimeError):
+            GeneticVRP().run(problem, small_config(max_generations=0))
+
+    def test_decode_routes_covers_every_delivery(self, problem):
+        # Arrange
+        genome = np.arange(problem.num_deliveries, dtype=np.int32)
+
+        # Act
+        routes = decode_routes(problem, genome)
+
+        # Assert
+        assert len(routes) == problem.num_vehicles
+        assert sorted(d.id for route in routes for d in route) == genome.tolist()
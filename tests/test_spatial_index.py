@@ -0,0 +1,80 @@
+"""Testes unitários para o módulo spatial_index.py"""
+
+import random
+import sys
+from pathlib import Path
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import population
+from distance_matrix import DistanceMatrix
+from models import Delivery, Priority
+from population import calculate_distance, optimize_vehicle_route_nearest_neighbor, split_deliveries_by_vehicle
+from spatial_index import GridIndex
+
+
+class TestGridIndex:
+    """Testes para a classe GridIndex"""
+
+    def test_nearest_with_removal_success(self):
+        # Arrange
+        points = [(0, 0), (10, 0), (10, 10), (0, 10), (5, 5)]
+        grid = GridIndex(points, cell_size=3.0)
+        query = (6, 6)
+
+        # Act
+        first = grid.nearest(query, lambda i: calculate_distance(query, points[i]))
+        grid.remove(first)
+        second = grid.nearest(query, lambda i: calculate_distance(query, points[i]))
+
+        # Assert
+        assert first == 4
+        assert second == 2
+        assert len(grid) == 4
+
+    def test_ties_resolved_by_lowest_index(self):
+        # Arrange: pontos equidistantes da consulta e consulta fora da grade
+        points = [(10, 0), (0, 10), (-10, 0), (0, -10)]
+        grid = GridIndex(points, cell_size=1.0)
+        query = (0, 0)
+
+        # Act
+        nearest = grid.nearest(query, lambda i: calculate_distance(query, points[i]))
+
+        # Assert
+        assert nearest == 0
+        assert GridIndex([]).nearest(query, lambda i: 0.0) == -1
+
+
+class TestNearestNeighborWithGrid:
+    """Garante que o vizinho mais próximo com grade gera as mesmas rotas"""
+
+    def test_routes_identical_to_linear_search(self, monkeypatch):
+        # Arrange: coordenadas em malha grossa geram muitos empates
+        rng = random.Random(9)
+        depot = (-15, 40)
+        deliveries = [
+            Delivery(
+                location=(rng.randint(0, 12) * 5, rng.randint(0, 12) * 5),
+                priority=rng.choice(list(Priority)),
+                weight=1.0,
+                id=i,
+            )
+            for i in range(300)
+        ]
+        distance_matrix = DistanceMatrix(depot, deliveries)
+
+        # Act
+        monkeypatch.setattr(population, "SPATIAL_INDEX_MIN_POINTS", 10**9)
+        linear = optimize_vehicle_route_nearest_neighbor(deliveries, depot)
+        linear_split = split_deliveries_by_vehicle(deliveries, 2, depot, [1e9, 1e9], [300, 300], distance_matrix)
+        monkeypatch.setattr(population, "SPATIAL_INDEX_MIN_POINTS", 1)
+        grid = optimize_vehicle_route_nearest_neighbor(deliveries, depot)
+        grid_matrix = optimize_vehicle_route_nearest_neighbor(deliveries, depot, distance_matrix)
+        grid_split = split_deliveries_by_vehicle(deliveries, 2, depot, [1e9, 1e9], [300, 300], distance_matrix)
+
+        # Assert
+        assert [d.id for d in grid] == [d.id for d in linear]
+        assert [d.id for d in grid_matrix] == [d.id for d in linear]
+        assert grid_split == linear_split
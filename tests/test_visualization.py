@@ -0,0 +1,79 @@
+"""Testes unitários para o gráfico de convergência de visualization.py"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pygame
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from visualization import ConvergencePlot, downsample_series
+
+
+class TestDownsampleSeries:
+    """Testes para a amostragem do histórico de fitness"""
+
+    def test_short_series_is_kept(self):
+        # Act
+        x, y = downsample_series([5.0, 4.0, 3.0], max_points=10)
+
+        # Assert
+        assert x.tolist() == [1, 2, 3]
+        assert y.tolist() == [5.0, 4.0, 3.0]
+
+    def test_long_series_respects_budget_and_keeps_endpoints(self):
+        # Arrange
+        values = list(np.linspace(1000, 10, 10_000))
+
+        # Act
+        x, y = downsample_series(values, max_points=200)
+
+        # Assert
+        assert len(x) <= 200
+        assert x[0] == 1 and x[-1] == 10_000
+        assert y[0] == values[0] and y[-1] == values[-1]
+        assert np.all(np.diff(x) > 0)
+
+
+class TestConvergencePlot:
+    """Testes para o gráfico persistente"""
+
+    def test_draw_reuses_figure_and_grows_limits(self):
+        # Arrange
+        plot = ConvergencePlot(max_points=50)
+        screen = pygame.Surface((800, 400))
+        history = [100.0, 90.0]
+
+        try:
+            # Act
+            plot.draw(screen, history)
+            figure = plot.fig
+            for value in range(89, 0, -1):
+                history.append(float(value))
+                plot.draw(screen, history)
+
+            # Assert
+            assert plot.fig is figure
+            assert len(plot.line.get_xdata()) <= 50
+            x_low, x_high = plot.ax.get_xlim()
+            y_low, y_high = plot.ax.get_ylim()
+            assert x_high >= len(history)
+            assert y_low <= 1.0 and y_high >= 100.0
+        finally:
+            plot.close()
+
+    def test_draw_ignores_history_with_single_point(self):
+        # Arrange
+        plot = ConvergencePlot()
+        screen = pygame.Surface((800, 400))
+
+        try:
+            # Act
+            plot.draw(screen, [10.0])
+
+            # Assert
+            assert plot._surface is None
+        finally:
+            plot.close()
@@ -0,0 +1,113 @@
+"""Testes unitários para o módulo warm_start.py"""
+
+import csv
+import random
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+
+# Adiciona o diretório src ao path para permitir imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cities import generate_deliveries, generate_fleet_problem, generate_problem
+from main import write_solution_csv
+from models import Delivery, Priority
+from problem import VRPProblem
+from solver import GeneticVRP, SolverConfig, decode_routes
+from warm_start import load_warm_start_genomes, repair_genome, warm_start_genomes
+
+
+class TestRepairGenome:
+    """Testes para a adaptação de genomas a um novo conjunto de entregas"""
+
+    def test_new_delivery_goes_to_cheapest_position(self):
+        # Arrange: entregas em linha; a nova (id 3) fica entre as de id 0 e 1
+        deliveries = [
+            Delivery((10, 0), Priority.LOW, 1.0, 0),
+            Delivery((30, 0), Priority.LOW, 1.0, 1),
+            Delivery((40, 0), Priority.LOW, 1.0, 2),
+            Delivery((20, 0), Priority.LOW, 1.0, 3),
+        ]
+        problem = VRPProblem(deliveries, 1, (0, 0), [10.0], [4])
+
+        # Act
+        repaired = repair_genome(np.array([0, 1, 2]), problem)
+
+        # Assert
+        assert repaired.tolist() == [0, 3, 1, 2]
+
+    def test_removes_unknown_ids_and_sorts_by_priority(self):
+        # Arrange
+        problem = generate_problem(30, 3, seed=1)
+        old_genome = np.array([35, 12, 3, 12, 31, 7, 20, 0, 29, 5], dtype=np.int32)
+
+        # Act
+        repaired = repair_genome(old_genome, problem)
+
+        # Assert
+        assert sorted(repaired.tolist()) == list(range(30))
+        priorities = problem.delivery_table.priority[repaired]
+        assert priorities.tolist() == sorted(priorities.tolist())
+        for priority in set(priorities.tolist()):
+            kept = [i for i in [12, 3, 7, 20, 0, 29, 5] if problem.delivery_table.priority[i] == priority]
+            same_priority = [i for i in repaired.tolist() if i in kept]
+            assert same_priority == kept
+
+
+class TestWarmStart:
+    """Testes para semear a população inicial com soluções anteriores"""
+
+    def test_reads_solution_csvs_in_rank_order(self, tmp_path):
+        # Arrange
+        for rank, vehicle_routes in [(10, ["4;2", "0"]), (2, ["1;0", "3;4"])]:
+            with open(tmp_path / f"top_{rank}.csv", "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(["SolutionRank", "Fitness", "VehicleID", "DeliveryIDs"])
+                for vehicle_id, ids in reversed(list(enumerate(vehicle_routes, 1))):
+                    writer.writerow([rank, "1.00", vehicle_id, ids])
+
+        # Act
+        genomes = load_warm_start_genomes([tmp_path])
+
+        # Assert
+        assert [genome.tolist() for genome in genomes] == [[1, 0, 3, 4], [4, 2, 0]]
+
+    def test_saved_solution_round_trips_with_same_fitness(self, tmp_path):
+        # Arrange
+        problem = generate_problem(40, 3, seed=6)
+        config = SolverConfig(population_size=30, time_limit_seconds=None, max_generations=30, seed=1)
+        saved = GeneticVRP().run(problem, config)
+        routes = decode_routes(problem, saved.best_genome)
+        write_solution_csv(str(tmp_path / "top_1.csv"), 1, saved.best_fitness, routes, problem, saved.best_genome)
+
+        # Act
+        (genome,) = load_warm_start_genomes([tmp_path])
+        single = replace(config, population_size=1, max_generations=1)
+        reloaded = GeneticVRP().run(problem, single, seed_genomes=genome[None])
+        warm = GeneticVRP().run(problem, single, seed_genomes=warm_start_genomes(problem, [genome], 1))
+
+        # Assert
+        assert genome.tolist() == saved.best_genome.tolist()
+        assert reloaded.best_fitness == saved.best_fitness
+        assert [[d.id for d in route] for route in decode_routes(problem, genome)] == [[d.id for d in route] for route in routes]
+        assert warm.best_fitness <= saved.best_fitness
+
+    def test_previous_solutions_speed_up_new_instance(self):
+        # Arrange: a instância de hoje tem 6 entregas a mais que a de ontem
+        random.seed(2)
+        deliveries = generate_deliveries(60)
+        yesterday = generate_fleet_problem(deliveries[:54], 3)
+        today = generate_fleet_problem(deliveries, 3)
+        config = SolverConfig(population_size=30, time_limit_seconds=None, max_generations=60, seed=3)
+        previous = GeneticVRP().run(yesterday, config)
+
+        # Act
+        seeds = warm_start_genomes(today, [genome for _, genome in previous.elite_archive.top()], config.population_size)
+        cold = GeneticVRP().run(today, replace(config, max_generations=1))
+        warm = GeneticVRP().run(today, replace(config, max_generations=1), seed_genomes=seeds)
+
+        # Assert
+        assert 1 <= len(seeds) <= len(previous.elite_archive)
+        assert warm.best_fitness < cold.best_fitness